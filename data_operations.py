@@ -3,19 +3,29 @@ Centralized data operations for Vehicle Maintenance Tracker
 This module contains all database operations to ensure consistency across pages
 """
 
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import select, delete, text, func, or_
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Dict, Any, Tuple, Union
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import select, delete, insert, update, text, func, or_, literal, exists
 from models import Vehicle, MaintenanceRecord, Account
 from importer import import_csv, ImportResult
 from database import SessionLocal
+import codecs
 import csv
+import logging
 from io import StringIO
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 import os
+import re
+import secrets
+import threading
+from collections import OrderedDict, defaultdict
+from itertools import islice
 from pydantic import ValidationError
-from schemas import TireMeta
+from schemas import TireMeta, parse_date_string
+from ttl_cache import MISS, TTLCache
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_OWNER_ID = "kory"
 UNSET = object()
@@ -28,7 +38,7 @@ def normalize_tire_meta_payload(meta: Optional[Dict[str, Any]]) -> Optional[Dict
         if not model.has_measurements():
             return None
         if model.measured_at is None:
-            model = model.model_copy(update={"measured_at": datetime.utcnow()})
+            model = model.model_copy(update={"measured_at": datetime.now(timezone.utc)})
         return model.model_dump(mode="json", exclude_none=True)
     except ValidationError as exc:
         print(f"Invalid tire_meta payload: {exc}")
@@ -143,34 +153,42 @@ def create_account(name: str, owner_user_id: str = DEFAULT_OWNER_ID, set_default
 
 
 def rename_account(account_id: str, new_name: str, owner_user_id: str = DEFAULT_OWNER_ID) -> Dict[str, Any]:
-    """Rename an account after validating ownership and uniqueness."""
+    """Rename an account after validating ownership and uniqueness.
+
+    A single UPDATE ... RETURNING does the ownership and duplicate-name checks;
+    only when it matches nothing is the account looked up to report why.
+    Failures for a missing account carry not_found=True.
+    """
+    normalized_name = (new_name or "").strip()
+    if not normalized_name:
+        return {"success": False, "error": "Account name cannot be empty."}
+
     session = SessionLocal()
     try:
+        other = aliased(Account)
         account = session.execute(
-            select(Account).where(Account.id == account_id, Account.owner_user_id == owner_user_id)
-        ).scalar_one_or_none()
-        if not account:
-            return {"success": False, "error": "Account not found."}
-
-        normalized_name = (new_name or "").strip()
-        if not normalized_name:
-            return {"success": False, "error": "Account name cannot be empty."}
-
-        existing = session.execute(
-            select(Account).where(
+            update(Account)
+            .where(
+                Account.id == account_id,
                 Account.owner_user_id == owner_user_id,
-                Account.name == normalized_name,
-                Account.id != account_id,
+                ~exists().where(
+                    other.owner_user_id == owner_user_id,
+                    other.name == normalized_name,
+                    other.id != account_id,
+                ),
             )
+            .values(name=normalized_name, updated_at=datetime.utcnow())
+            .returning(Account)
         ).scalar_one_or_none()
-        if existing:
+        if account is None:
+            session.rollback()
+            if _owned_account_id(session, account_id, owner_user_id) is None:
+                return {"success": False, "error": "Account not found.", "not_found": True}
             return {"success": False, "error": "Another account already uses that name."}
 
-        account.name = normalized_name
-        account.updated_at = datetime.utcnow()
-        session.add(account)
+        # Keep the returned values readable after commit and close
+        session.expunge(account)
         session.commit()
-        session.refresh(account)
         return {"success": True, "account": account}
     except Exception as e:
         session.rollback()
@@ -181,24 +199,30 @@ def rename_account(account_id: str, new_name: str, owner_user_id: str = DEFAULT_
 
 
 def delete_account(account_id: str, owner_user_id: str = DEFAULT_OWNER_ID) -> Dict[str, Any]:
-    """Delete an account if it belongs to the owner and has no vehicles."""
+    """Delete an account if it belongs to the owner and has no vehicles.
+
+    One DELETE ... RETURNING; the reason is looked up only when nothing was deleted.
+    Failures for a missing account carry not_found=True.
+    """
     session = SessionLocal()
     try:
-        account = session.execute(
-            select(Account).where(Account.id == account_id, Account.owner_user_id == owner_user_id)
+        account_name = session.execute(
+            delete(Account)
+            .where(
+                Account.id == account_id,
+                Account.owner_user_id == owner_user_id,
+                ~exists().where(Vehicle.account_id == account_id),
+            )
+            .returning(Account.name)
         ).scalar_one_or_none()
-        if not account:
-            return {"success": False, "error": "Account not found."}
-
-        vehicle_count = session.execute(
-            select(func.count(Vehicle.id)).where(Vehicle.account_id == account_id)
-        ).scalar_one()
-        if vehicle_count:
+        if account_name is None:
+            session.rollback()
+            if _owned_account_id(session, account_id, owner_user_id) is None:
+                return {"success": False, "error": "Account not found.", "not_found": True}
             return {"success": False, "error": "Account still has vehicles assigned."}
 
-        session.delete(account)
         session.commit()
-        return {"success": True}
+        return {"success": True, "account_name": account_name}
     except Exception as e:
         session.rollback()
         print(f"Error deleting account {account_id}: {e}")
@@ -208,24 +232,30 @@ def delete_account(account_id: str, owner_user_id: str = DEFAULT_OWNER_ID) -> Di
 
 
 def set_default_account(account_id: str, owner_user_id: str = DEFAULT_OWNER_ID) -> Dict[str, Any]:
-    """Mark the specified account as the default for the owner."""
+    """Mark the specified account as the default for the owner.
+
+    Failures for a missing account carry not_found=True.
+    """
     session = SessionLocal()
     try:
         account = session.execute(
-            select(Account).where(Account.id == account_id, Account.owner_user_id == owner_user_id)
+            update(Account)
+            .where(Account.id == account_id, Account.owner_user_id == owner_user_id)
+            .values(is_default=True, updated_at=datetime.utcnow())
+            .returning(Account)
         ).scalar_one_or_none()
-        if not account:
-            return {"success": False, "error": "Account not found."}
+        if account is None:
+            session.rollback()
+            return {"success": False, "error": "Account not found.", "not_found": True}
 
         session.execute(
-            text("UPDATE account SET is_default = 0 WHERE owner_user_id = :owner"),
-            {"owner": owner_user_id},
+            update(Account)
+            .where(Account.owner_user_id == owner_user_id, Account.id != account_id)
+            .values(is_default=False)
         )
-        account.is_default = True
-        account.updated_at = datetime.utcnow()
-        session.add(account)
+        # Keep the returned values readable after commit and close
+        session.expunge(account)
         session.commit()
-        session.refresh(account)
         return {"success": True, "account": account}
     except Exception as e:
         session.rollback()
@@ -235,6 +265,13 @@ def set_default_account(account_id: str, owner_user_id: str = DEFAULT_OWNER_ID)
         session.close()
 
 
+def _owned_account_id(session: Session, account_id: str, owner_user_id: str) -> Optional[str]:
+    """The account's id if it exists and belongs to the owner, else None."""
+    return session.execute(
+        select(Account.id).where(Account.id == account_id, Account.owner_user_id == owner_user_id)
+    ).scalar_one_or_none()
+
+
 def get_default_account(owner_user_id: str = DEFAULT_OWNER_ID) -> Optional[Account]:
     """Return the default account for the owner, if one exists."""
     session = SessionLocal()
@@ -273,53 +310,53 @@ def get_account_vehicle_counts(owner_user_id: str = DEFAULT_OWNER_ID) -> Dict[st
 def transfer_vehicle_to_account(
     vehicle_id: int, target_account_id: str, owner_user_id: str = DEFAULT_OWNER_ID
 ) -> Dict[str, Any]:
-    """Move a vehicle to another account with ownership validation."""
+    """Move a vehicle to another account with ownership validation.
+
+    The target account is read once (its name is used in the result message), and
+    the move is one UPDATE ... RETURNING that also checks the vehicle's current
+    account is the owner's. The vehicle is looked up only when that UPDATE matches
+    nothing. Failures for a missing vehicle or target account carry not_found=True.
+    """
     session = SessionLocal()
     try:
-        vehicle = session.execute(select(Vehicle).where(Vehicle.id == vehicle_id)).scalar_one_or_none()
-        if not vehicle:
-            return {"success": False, "error": "Vehicle not found."}
-
-        current_account = session.execute(
-            select(Account).where(Account.id == vehicle.account_id, Account.owner_user_id == owner_user_id)
+        target_name = session.execute(
+            select(Account.name).where(Account.id == target_account_id, Account.owner_user_id == owner_user_id)
         ).scalar_one_or_none()
-        if not current_account:
-            return {"success": False, "error": "You do not have permission to move this vehicle."}
+        if target_name is None:
+            return {"success": False, "error": "Target account not found.", "not_found": True}
 
-        target_account = session.execute(
-            select(Account).where(Account.id == target_account_id, Account.owner_user_id == owner_user_id)
+        owned_accounts = select(Account.id).where(Account.owner_user_id == owner_user_id)
+        vehicle = session.execute(
+            update(Vehicle)
+            .where(
+                Vehicle.id == vehicle_id,
+                Vehicle.account_id.in_(owned_accounts),
+                Vehicle.account_id != target_account_id,
+            )
+            .values(account_id=target_account_id)
+            .returning(Vehicle)
         ).scalar_one_or_none()
-        if not target_account:
-            return {"success": False, "error": "Target account not found."}
-
-        if vehicle.account_id == target_account.id:
+        if vehicle is None:
+            session.rollback()
+            vehicle = session.execute(select(Vehicle).where(Vehicle.id == vehicle_id)).scalar_one_or_none()
+            if not vehicle:
+                return {"success": False, "error": "Vehicle not found.", "not_found": True}
+            if _owned_account_id(session, vehicle.account_id, owner_user_id) is None:
+                return {"success": False, "error": "You do not have permission to move this vehicle."}
             return {"success": True, "vehicle": vehicle, "message": "Vehicle already in selected account."}
 
-        vehicle.account_id = target_account.id
-        session.add(vehicle)
+        # Keep the returned values readable after commit and close
+        session.expunge(vehicle)
         session.commit()
-        session.refresh(vehicle)
-        return {"success": True, "vehicle": vehicle}
+        invalidate_vehicle_cache()
+        invalidate_notifications_cache()
+        return {"success": True, "vehicle": vehicle, "message": f"Vehicle moved to {target_name}."}
     except Exception as e:
         session.rollback()
         print(f"Error transferring vehicle {vehicle_id} to {target_account_id}: {e}")
         return {"success": False, "error": str(e)}
     finally:
         session.close()
-def parse_date_string(date_string: str) -> datetime.date:
-    """Parse date string in either MM/DD/YYYY or YYYY-MM-DD format"""
-    if not date_string or date_string == "0":
-        raise ValueError("Date string cannot be empty")
-    
-    # Try MM/DD/YYYY format first (new standard)
-    try:
-        return datetime.strptime(date_string, "%m/%d/%Y").date()
-    except ValueError:
-        # Fall back to YYYY-MM-DD format (legacy)
-        try:
-            return datetime.strptime(date_string, "%Y-%m-%d").date()
-        except ValueError:
-            raise ValueError("Invalid date format. Use MM/DD/YYYY or YYYY-MM-DD")
 
 # ============================================================================
 # VEHICLE OPERATIONS
@@ -343,22 +380,49 @@ def get_all_vehicles(
             .order_by(Vehicle.name)
         )
 
-        normalized_account_id = (
-            account_id if account_id and account_id.lower() not in ("all", "null") else None
+        vehicles = session.execute(_scope_vehicle_query(query, account_id, owner_user_id)).scalars().all()
+        return vehicles
+    except Exception as e:
+        print(f"Error getting vehicles: {e}")
+        return []
+    finally:
+        session.close()
+
+def _scope_vehicle_query(query, account_id: Optional[str], owner_user_id: str):
+    """Restrict a Vehicle query (already outer-joined to Account) to the owner and account."""
+    normalized_account_id = (
+        account_id if account_id and account_id.lower() not in ("all", "null") else None
+    )
+
+    if normalized_account_id:
+        return query.where(
+            Vehicle.account_id == normalized_account_id,
+            or_(Account.owner_user_id == owner_user_id, Account.id.is_(None)),
         )
+    return query.where(
+        or_(Account.owner_user_id == owner_user_id, Vehicle.account_id.is_(None))
+    )
 
-        if normalized_account_id:
-            query = query.where(
-                Vehicle.account_id == normalized_account_id,
-                or_(Account.owner_user_id == owner_user_id, Account.id.is_(None)),
-            )
-        else:
-            query = query.where(
-                or_(Account.owner_user_id == owner_user_id, Vehicle.account_id.is_(None))
-            )
+def get_vehicle_summaries(
+    account_id: Optional[str] = None, owner_user_id: str = DEFAULT_OWNER_ID
+) -> List[Dict[str, Any]]:
+    """Vehicles as plain dicts of id, name, year, make, model, vin and account_id.
 
-        vehicles = session.execute(query).scalars().all()
-        return vehicles
+    Same scope and order as get_all_vehicles, but selects only these columns,
+    so no Vehicle instances (or their records) are loaded for pickers.
+    """
+    session = SessionLocal()
+    try:
+        query = (
+            select(
+                Vehicle.id, Vehicle.name, Vehicle.year, Vehicle.make,
+                Vehicle.model, Vehicle.vin, Vehicle.account_id,
+            )
+            .outerjoin(Account, Account.id == Vehicle.account_id)
+            .order_by(Vehicle.name)
+        )
+        result = session.execute(_scope_vehicle_query(query, account_id, owner_user_id))
+        return [dict(row) for row in result.mappings()]
     except Exception as e:
         print(f"Error getting vehicles: {e}")
         return []
@@ -434,6 +498,8 @@ def create_vehicle(
         vehicle = Vehicle(name=name, make=make, model=model, year=year, vin=vin, account_id=account_id)
         session.add(vehicle)
         session.commit()
+        invalidate_vehicle_cache()
+        invalidate_notifications_cache()
         session.refresh(vehicle)
         
         return {"success": True, "vehicle": vehicle}
@@ -493,6 +559,8 @@ def update_vehicle(
         vehicle.vin = vin
         
         session.commit()
+        invalidate_vehicle_cache()
+        invalidate_notifications_cache()
         session.refresh(vehicle)
         
         return {"success": True, "vehicle": vehicle}
@@ -517,6 +585,9 @@ def delete_vehicle(vehicle_id: int) -> Dict[str, Any]:
         # Delete the vehicle
         session.delete(vehicle)
         session.commit()
+        invalidate_vehicle_cache()
+        invalidate_oil_analysis_cache()
+        invalidate_notifications_cache()
         
         return {"success": True}
     except Exception as e:
@@ -608,6 +679,133 @@ def get_maintenance_records_by_vehicle(
     finally:
         session.close()
 
+def get_oil_management_records(
+    vehicle_ids: List[int], account_id: Optional[str] = None, owner_user_id: str = DEFAULT_OWNER_ID
+) -> Dict[str, Dict[int, List[Any]]]:
+    """
+    Load the oil management page's rows for many vehicles in one session.
+
+    Returns a dict with:
+      - records: oil change and oil analysis records per vehicle_id, ordered like
+        get_maintenance_records_by_vehicle
+      - future_oil_changes: active "Oil Change" FutureMaintenance rows per vehicle_id
+    """
+    records_by_vehicle: Dict[int, List[MaintenanceRecord]] = defaultdict(list)
+    future_by_vehicle: Dict[int, List[Any]] = defaultdict(list)
+    if not vehicle_ids:
+        return {"records": records_by_vehicle, "future_oil_changes": future_by_vehicle}
+
+    session = SessionLocal()
+    try:
+        from models import FutureMaintenance
+
+        query = (
+            select(MaintenanceRecord)
+            .join(Vehicle, Vehicle.id == MaintenanceRecord.vehicle_id)
+            .outerjoin(Account, Account.id == Vehicle.account_id)
+            .where(MaintenanceRecord.vehicle_id.in_(vehicle_ids))
+            .where(or_(MaintenanceRecord.is_oil_change == True, MaintenanceRecord.is_oil_analysis == True))  # noqa: E712
+            .order_by(MaintenanceRecord.date.desc(), MaintenanceRecord.mileage.desc())
+        )
+        for record in session.execute(_scope_vehicle_query(query, account_id, owner_user_id)).scalars():
+            records_by_vehicle[record.vehicle_id].append(record)
+
+        for fm in session.execute(
+            select(FutureMaintenance)
+            .where(FutureMaintenance.vehicle_id.in_(vehicle_ids))
+            .where(FutureMaintenance.maintenance_type == "Oil Change")
+            .where(FutureMaintenance.is_active == True)  # noqa: E712
+        ).scalars():
+            future_by_vehicle[fm.vehicle_id].append(fm)
+    except Exception as e:
+        print(f"Error getting oil management records: {e}")
+    finally:
+        session.close()
+
+    return {"records": records_by_vehicle, "future_oil_changes": future_by_vehicle}
+
+def get_oil_analysis_records(owner_user_id: str = DEFAULT_OWNER_ID) -> List[MaintenanceRecord]:
+    """Get every oil analysis record visible to the owner, using the generated is_oil_analysis flag."""
+    session = SessionLocal()
+    try:
+        query = (
+            select(MaintenanceRecord)
+            .join(Vehicle, Vehicle.id == MaintenanceRecord.vehicle_id)
+            .outerjoin(Account, Account.id == Vehicle.account_id)
+            .where(MaintenanceRecord.is_oil_analysis == True)  # noqa: E712
+            .order_by(MaintenanceRecord.date.desc(), MaintenanceRecord.id.desc())
+        )
+        return session.execute(_scope_vehicle_query(query, None, owner_user_id)).scalars().all()
+    except Exception as e:
+        print(f"Error getting oil analysis records: {e}")
+        return []
+    finally:
+        session.close()
+
+# (vehicle_id, mileage) -> has analysis; maintenance writes clear it and the TTL
+# bounds staleness for writes made outside these helpers
+_OIL_ANALYSIS_TTL_SECONDS = 30
+_oil_analysis_cache = TTLCache(_OIL_ANALYSIS_TTL_SECONDS, max_entries=4096)
+
+
+def invalidate_oil_analysis_cache() -> None:
+    """Drop cached oil analysis lookups; call after any maintenance record write"""
+    _oil_analysis_cache.invalidate()
+
+
+# Notifications payload per owner, built in main.get_notifications_api. Every write that
+# can change it (vehicles, maintenance, fuel, future maintenance) calls
+# invalidate_notifications_cache(); the TTL picks up date-based reminders coming due
+_NOTIFICATIONS_TTL_SECONDS = 60
+_notifications_cache = TTLCache(_NOTIFICATIONS_TTL_SECONDS)
+
+
+def invalidate_notifications_cache() -> None:
+    """Drop cached notifications; call after any write that affects vehicles, mileage or reminders"""
+    _notifications_cache.invalidate()
+
+
+def get_cached_notifications(owner_user_id: str = DEFAULT_OWNER_ID) -> Tuple[Optional[Dict[str, Any]], int]:
+    """Return (cached payload or None, current generation); pass the generation to cache_notifications"""
+    payload, generation = _notifications_cache.get(owner_user_id)
+    return (None if payload is MISS else payload), generation
+
+
+def cache_notifications(
+    payload: Dict[str, Any], generation: int, owner_user_id: str = DEFAULT_OWNER_ID
+) -> None:
+    """Store a notifications payload unless a write invalidated the cache while it was built"""
+    _notifications_cache.set(owner_user_id, payload, generation)
+
+
+def has_existing_oil_analysis(vehicle_id: int, mileage: Optional[int]) -> bool:
+    """Check whether an oil analysis record already exists for a vehicle at the given mileage."""
+    key = (vehicle_id, mileage)
+    cached, generation = _oil_analysis_cache.get(key)
+    if cached is not MISS:
+        return cached
+
+    session = SessionLocal()
+    try:
+        query = (
+            select(literal(1))
+            .select_from(MaintenanceRecord)
+            .where(
+                MaintenanceRecord.vehicle_id == vehicle_id,
+                MaintenanceRecord.mileage == mileage,
+                MaintenanceRecord.is_oil_analysis == True,  # noqa: E712
+            )
+            .limit(1)
+        )
+        exists = session.execute(query).first() is not None
+        _oil_analysis_cache.set(key, exists, generation)
+        return exists
+    except Exception as e:
+        print(f"Error checking oil analysis for vehicle {vehicle_id}: {e}")
+        return False
+    finally:
+        session.close()
+
 def get_maintenance_by_id(record_id: int) -> Optional[MaintenanceRecord]:
     """Get a specific maintenance record by ID with vehicle eagerly loaded"""
     session = SessionLocal()
@@ -729,6 +927,8 @@ def create_basic_maintenance_record(vehicle_id: int, date: str, description: str
         
         session.add(record)
         session.commit()
+        invalidate_oil_analysis_cache()
+        invalidate_notifications_cache()
         session.refresh(record)
         
         return {"success": True, "record": record}
@@ -815,6 +1015,8 @@ def create_oil_analysis_record(vehicle_id: int, date: str, description: str, mil
         
         session.add(record)
         session.commit()
+        invalidate_oil_analysis_cache()
+        invalidate_notifications_cache()
         session.refresh(record)
         
         return {"success": True, "record": record}
@@ -839,6 +1041,13 @@ def create_placeholder_oil_analysis(vehicle_id: int, date: str, description: str
 def create_maintenance_record(vehicle_id: int, date: str, description: Optional[str], cost: float, mileage: Optional[int], 
                             oil_change_interval: Optional[int] = None,
                             is_oil_change: Optional[bool] = None,
+                            oil_type: Optional[str] = None,
+                            oil_brand: Optional[str] = None,
+                            oil_filter_brand: Optional[str] = None,
+                            oil_filter_part_number: Optional[str] = None,
+                            oil_cost: Optional[float] = None,
+                            filter_cost: Optional[float] = None,
+                            labor_cost: Optional[float] = None,
                             oil_analysis_date: Optional[str] = None,
                             next_oil_analysis_date: Optional[str] = None,
                             oil_analysis_cost: Optional[float] = None,
@@ -855,8 +1064,19 @@ def create_maintenance_record(vehicle_id: int, date: str, description: Optional[
                             oil_analysis_report: Optional[str] = None,
                             photo_path: Optional[str] = None,
                             photo_description: Optional[str] = None,
-                            tire_meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Create a new maintenance record"""
+                            tire_meta: Optional[Dict[str, Any]] = None,
+                            future_maintenance_id: Optional[int] = None,
+                            placeholder_analysis_description: Optional[str] = None,
+                            oil_change_reminder_interval: Any = UNSET) -> Dict[str, Any]:
+    """
+    Create a new maintenance record, optionally completing the future maintenance it fulfils.
+
+    When placeholder_analysis_description is given, a placeholder oil analysis linked to
+    the new record (see create_placeholder_oil_analysis) is inserted in the same transaction.
+    Oil changes schedule their next reminder from oil_change_reminder_interval, which
+    defaults to the stored oil_change_interval; pass None to store an interval without
+    scheduling a reminder.
+    """
     session = SessionLocal()
     try:
         # Verify vehicle exists
@@ -870,6 +1090,8 @@ def create_maintenance_record(vehicle_id: int, date: str, description: Optional[
         except ValueError as e:
             return {"success": False, "error": str(e)}
         
+        entered_mileage = mileage
+        
         # Handle missing mileage - use placeholder and mark date as estimated for sorting
         if mileage is None:
             mileage = 0  # Placeholder mileage
@@ -913,6 +1135,14 @@ def create_maintenance_record(vehicle_id: int, date: str, description: Optional[
             date_estimated=date_estimated,
             oil_change_interval=oil_change_interval,
             is_oil_change=is_oil_change_flag,  # Use explicit parameter
+            # Oil change fields
+            oil_type=oil_type,
+            oil_brand=oil_brand,
+            oil_filter_brand=oil_filter_brand,
+            oil_filter_part_number=oil_filter_part_number,
+            oil_cost=oil_cost,
+            filter_cost=filter_cost,
+            labor_cost=labor_cost,
             # Oil analysis fields
             oil_analysis_date=parsed_oil_analysis_date,
             next_oil_analysis_date=parsed_next_oil_analysis_date,
@@ -935,26 +1165,63 @@ def create_maintenance_record(vehicle_id: int, date: str, description: Optional[
         )
         
         session.add(record)
+        
+        if future_maintenance_id:
+            # Complete the reminder in the same transaction; it must belong to this vehicle
+            from models import FutureMaintenance
+            completed = session.execute(
+                update(FutureMaintenance)
+                .where(
+                    FutureMaintenance.id == future_maintenance_id,
+                    FutureMaintenance.vehicle_id == vehicle_id,
+                )
+                .values(is_active=False)
+            )
+            if completed.rowcount == 0:
+                session.rollback()
+                return {
+                    "success": False,
+                    "error": "Future maintenance not found for this vehicle.",
+                    "not_found": True,
+                }
+        
+        if placeholder_analysis_description is not None:
+            # Flush for the new record's id, then add the linked analysis to the same commit
+            session.flush()
+            session.add(MaintenanceRecord(
+                vehicle_id=vehicle_id,
+                date=parsed_date,
+                description=placeholder_analysis_description or "N/A",
+                cost=0.0,
+                mileage=entered_mileage,
+                date_estimated=False,
+                is_oil_change=False,
+                linked_oil_change_id=record.id,
+            ))
+        
         session.commit()
+        invalidate_oil_analysis_cache()
+        invalidate_notifications_cache()
         session.refresh(record)
         
         # If this is an oil change, automatically create future maintenance record
         future_maintenance_result = None
-        if is_oil_change and oil_change_interval and mileage:
-            print(f"DEBUG: Creating future maintenance - is_oil_change: {is_oil_change}, oil_change_interval: {oil_change_interval}, mileage: {mileage}")
+        if oil_change_reminder_interval is UNSET:
+            oil_change_reminder_interval = oil_change_interval
+        if is_oil_change and oil_change_reminder_interval and mileage:
             try:
                 # Extract oil type from description if possible
-                oil_type = "Conventional"  # Default
+                future_oil_type = "Conventional"  # Default
                 if description and "synthetic" in description.lower():
-                    oil_type = "Synthetic"
+                    future_oil_type = "Synthetic"
                 elif description and "blend" in description.lower():
-                    oil_type = "Blend"
+                    future_oil_type = "Blend"
                 
                 future_maintenance_result = create_future_oil_change_record(
                     vehicle_id=vehicle_id,
                     current_mileage=mileage,
-                    oil_change_interval=oil_change_interval,
-                    oil_type=oil_type,
+                    oil_change_interval=oil_change_reminder_interval,
+                    oil_type=future_oil_type,
                     estimated_cost=cost
                 )
             except Exception as e:
@@ -1086,6 +1353,8 @@ def update_maintenance_record(record_id: int, vehicle_id: int, date: str, descri
             record.tire_meta = normalize_tire_meta_payload(tire_meta)
         
         session.commit()
+        invalidate_oil_analysis_cache()
+        invalidate_notifications_cache()
         session.refresh(record)
         
         return {"success": True, "record": record}
@@ -1096,6 +1365,40 @@ def update_maintenance_record(record_id: int, vehicle_id: int, date: str, descri
     finally:
         session.close()
 
+# Columns reset when a record is found to be wrongly flagged as an oil change
+OIL_CHANGE_CLEARED_VALUES: Dict[str, Any] = {
+    "is_oil_change": False,
+    "oil_change_interval": None,
+    "oil_type": None,
+    "oil_brand": None,
+    "oil_filter_brand": None,
+    "oil_filter_part_number": None,
+    "oil_cost": None,
+    "filter_cost": None,
+    "labor_cost": None,
+}
+
+def clear_oil_change_fields(record_id: int) -> Dict[str, Any]:
+    """Unmark a maintenance record as an oil change with a single UPDATE"""
+    session = SessionLocal()
+    try:
+        result = session.execute(
+            update(MaintenanceRecord)
+            .where(MaintenanceRecord.id == record_id)
+            .values(**OIL_CHANGE_CLEARED_VALUES)
+        )
+        session.commit()
+        if result.rowcount == 0:
+            return {"success": False, "error": "Maintenance record not found"}
+        invalidate_notifications_cache()
+        return {"success": True}
+    except Exception as e:
+        session.rollback()
+        print(f"Error clearing oil change fields: {e}")
+        return {"success": False, "error": str(e)}
+    finally:
+        session.close()
+
 def delete_maintenance_record(record_id: int) -> Dict[str, Any]:
     """Delete a maintenance record"""
     session = SessionLocal()
@@ -1108,6 +1411,8 @@ def delete_maintenance_record(record_id: int) -> Dict[str, Any]:
         
         session.delete(record)
         session.commit()
+        invalidate_oil_analysis_cache()
+        invalidate_notifications_cache()
         
         return {"success": True}
     except Exception as e:
@@ -1117,11 +1422,38 @@ def delete_maintenance_record(record_id: int) -> Dict[str, Any]:
     finally:
         session.close()
 
+def delete_oil_analysis_records(record_ids: List[int]) -> Dict[str, Any]:
+    """Delete the given oil analysis records in one statement; returns the ids actually deleted"""
+    if not record_ids:
+        return {"success": True, "deleted_ids": []}
+
+    session = SessionLocal()
+    try:
+        deleted_ids = session.execute(
+            delete(MaintenanceRecord)
+            .where(
+                MaintenanceRecord.id.in_(record_ids),
+                MaintenanceRecord.is_oil_analysis == True,  # noqa: E712
+            )
+            .returning(MaintenanceRecord.id)
+        ).scalars().all()
+        session.commit()
+        invalidate_oil_analysis_cache()
+        invalidate_notifications_cache()
+
+        return {"success": True, "deleted_ids": deleted_ids}
+    except Exception as e:
+        session.rollback()
+        print(f"Error deleting oil analysis records: {e}")
+        return {"success": False, "error": str(e)}
+    finally:
+        session.close()
+
 # ============================================================================
 # IMPORT/EXPORT OPERATIONS
 # ============================================================================
 
-def import_csv_data(file_content: str, vehicle_id: int = None) -> ImportResult:
+def import_csv_data(file_content: Union[str, Iterable[str]], vehicle_id: int = None) -> ImportResult:
     """Import CSV data with centralized logic - now uses improved importer.py functions"""
     session = SessionLocal()
     try:
@@ -1147,7 +1479,9 @@ def import_csv_data(file_content: str, vehicle_id: int = None) -> ImportResult:
         
         # Use the improved importer.py functions instead of basic parsing
         from importer import import_csv
-        result = import_csv(file_content.encode('utf-8'), vehicle_id, session, "skip")
+        result = import_csv(file_content, vehicle_id, session, "skip")
+        invalidate_oil_analysis_cache()
+        invalidate_notifications_cache()
         return result
         
     except Exception as e:
@@ -1163,86 +1497,243 @@ def import_csv_data(file_content: str, vehicle_id: int = None) -> ImportResult:
     finally:
         session.close()
 
-def export_vehicles_csv(vehicle_ids: Optional[List[int]] = None) -> str:
-    """Export vehicles to CSV format"""
+# ============================================================================
+# BACKGROUND IMPORT JOBS
+# ============================================================================
+
+# Finished jobs are kept for polling until the registry grows past this size; pending
+# and running jobs are never evicted so their status page keeps working, and new jobs
+# are refused while this many are still unfinished
+_IMPORT_JOB_LIMIT = 100
+_IMPORT_JOB_FINISHED_STATUSES = ("done", "failed")
+_import_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_import_jobs_lock = threading.Lock()
+
+
+def create_import_job() -> Optional[str]:
+    """Register a pending import job and return its id, or None if the registry is full of unfinished jobs"""
+    with _import_jobs_lock:
+        excess = len(_import_jobs) + 1 - _IMPORT_JOB_LIMIT
+        if excess > 0:
+            finished = [
+                old_id for old_id, job in _import_jobs.items()
+                if job["status"] in _IMPORT_JOB_FINISHED_STATUSES
+            ]
+            for old_id in finished[:excess]:
+                del _import_jobs[old_id]
+        if len(_import_jobs) >= _IMPORT_JOB_LIMIT:
+            return None
+        job_id = secrets.token_hex(16)
+        _import_jobs[job_id] = {"status": "pending", "result": None}
+    return job_id
+
+
+def run_import_job(job_id: str, csv_path: str, vehicle_id: int) -> None:
+    """Run import_csv_data over an uploaded CSV file for a registered job, then delete the file"""
+    with _import_jobs_lock:
+        if job_id in _import_jobs:
+            _import_jobs[job_id]["status"] = "running"
     try:
-        if vehicle_ids:
-            # Export specific vehicles
-            vehicles = [get_vehicle_by_id(vid) for vid in vehicle_ids if get_vehicle_by_id(vid)]
-        else:
-            # Export all vehicles
-            vehicles = get_all_vehicles()
-        
-        output = StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow(['Name', 'Make', 'Model', 'Year', 'VIN'])
-        
-        # Write data
-        for vehicle in vehicles:
-            writer.writerow([
-                vehicle.name,
-                vehicle.make,
-                vehicle.model,
-                vehicle.year,
-                vehicle.vin or ''
-            ])
-        
-        return output.getvalue()
+        # The file is parsed row by row as it is read rather than loaded into memory
+        with open(csv_path, newline="", encoding="utf-8") as csv_file:
+            outcome = {"status": "done", "result": import_csv_data(csv_file, vehicle_id)}
     except Exception as e:
-        print(f"Error exporting vehicles: {e}")
-        return ""
+        print(f"Error running import job {job_id}: {e}")
+        outcome = {"status": "failed", "error": str(e)}
+    finally:
+        try:
+            os.unlink(csv_path)
+        except OSError:
+            pass
+    with _import_jobs_lock:
+        if job_id in _import_jobs:
+            _import_jobs[job_id].update(outcome)
+
+
+def get_import_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """Return the status and result of an import job, or None if unknown"""
+    with _import_jobs_lock:
+        job = _import_jobs.get(job_id)
+        return dict(job) if job else None
+
+# Rows per chunk handed to StreamingResponse; each chunk costs a threadpool hop
+_CSV_CHUNK_ROWS = 500
+
+
+def _iter_csv_chunks(header: List[str], rows: Iterable[List[Any]]) -> Iterator[str]:
+    """Format rows with one csv.writer and yield them in chunks of _CSV_CHUNK_ROWS lines"""
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    rows = iter(rows)
+    # writerows formats a whole batch in one C call; the buffer is reused between chunks
+    while batch := list(islice(rows, _CSV_CHUNK_ROWS)):
+        writer.writerows(batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _select_export_vehicles(session: Session, vehicle_ids: Optional[List[int]] = None) -> List[Any]:
+    """Rows of (id, name, make, model, year, vin) for the vehicle exports.
+
+    Only the exported columns, owner-scoped like get_vehicle_by_id/get_all_vehicles,
+    in one query instead of loading full vehicles (and their records) one by one.
+    """
+    query = (
+        select(Vehicle.id, Vehicle.name, Vehicle.make, Vehicle.model, Vehicle.year, Vehicle.vin)
+        .outerjoin(Account, Account.id == Vehicle.account_id)
+        .where(or_(Account.owner_user_id == DEFAULT_OWNER_ID, Vehicle.account_id.is_(None)))
+    )
+    if vehicle_ids:
+        # Export specific vehicles, in the order they were requested
+        rows_by_id = {row.id: row for row in session.execute(query.where(Vehicle.id.in_(vehicle_ids)))}
+        return [rows_by_id[vid] for vid in vehicle_ids if vid in rows_by_id]
+    # Export all vehicles
+    return session.execute(query.order_by(Vehicle.name)).all()
 
-def export_maintenance_csv(vehicle_id: Optional[int] = None) -> str:
-    """Export maintenance records to CSV format"""
-    session = SessionLocal()
+
+def _start_csv_export(session: Session, chunks: Iterator[str], label: str) -> Iterator[str]:
+    """Produce the first chunk now, then stream the rest and close the session.
+
+    The first chunk runs the export query, so a database error raises to the caller
+    (and the route's 500) before a response starts. An error later in the stream
+    propagates too, aborting the response instead of ending it as a complete-looking CSV.
+    """
     try:
-        # Get records with vehicle info while session is active
-        from sqlalchemy.orm import selectinload
-        
-        if vehicle_id:
-            # Export single vehicle maintenance
-            records = session.execute(
-                select(MaintenanceRecord)
-                .options(selectinload(MaintenanceRecord.vehicle))
-                .where(MaintenanceRecord.vehicle_id == vehicle_id)
-                .order_by(MaintenanceRecord.date.desc())
-            ).scalars().all()
-        else:
-            # Export all maintenance records
-            records = session.execute(
-                select(MaintenanceRecord)
-                .options(selectinload(MaintenanceRecord.vehicle))
-                .order_by(MaintenanceRecord.date.desc())
-            ).scalars().all()
-        
-        output = StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow(['Vehicle Name', 'Date', 'Description', 'Cost', 'Mileage'])
-        
-        # Write data while session is still active
-        for record in records:
-            vehicle_name = record.vehicle.name if record.vehicle else "Unknown"
-            writer.writerow([
-                vehicle_name,
+        first = next(chunks, None)
+    except Exception:
+        session.close()
+        logger.exception("Error exporting %s", label)
+        raise
+
+    def stream() -> Iterator[str]:
+        try:
+            if first is not None:
+                yield first
+            yield from chunks
+        except Exception:
+            logger.exception("Error streaming %s export", label)
+            raise
+        finally:
+            session.close()
+
+    return stream()
+
+
+def _vehicles_csv_chunks(session: Session, vehicle_ids: Optional[List[int]]) -> Iterator[str]:
+    vehicles = _select_export_vehicles(session, vehicle_ids)
+    yield from _iter_csv_chunks(
+        ['Name', 'Make', 'Model', 'Year', 'VIN'],
+        (
+            [vehicle.name, vehicle.make, vehicle.model, vehicle.year, vehicle.vin or '']
+            for vehicle in vehicles
+        ),
+    )
+
+
+def iter_vehicles_csv(vehicle_ids: Optional[List[int]] = None) -> Iterator[str]:
+    """Return an iterator of vehicle CSV chunks; query errors raise here, not mid-stream"""
+    session = SessionLocal()
+    return _start_csv_export(session, _vehicles_csv_chunks(session, vehicle_ids), "vehicles")
+
+# PostgreSQL formats the maintenance export itself; columns and formatting match the
+# Python path below (COPY ends lines with \n rather than csv's \r\n)
+_MAINTENANCE_CSV_COPY_SQL = """
+    COPY (
+        SELECT
+            COALESCE(v.name, 'Unknown') AS "Vehicle Name",
+            to_char(m.date, 'YYYY-MM-DD') AS "Date",
+            m.description AS "Description",
+            CASE
+                WHEN COALESCE(m.cost, 0) = 0 THEN '$0.00'
+                ELSE '$' || round(m.cost::numeric, 2)::text
+            END AS "Cost",
+            m.mileage AS "Mileage"
+        FROM maintenancerecord m
+        LEFT JOIN vehicle v ON v.id = m.vehicle_id
+        {where}
+        ORDER BY m.date DESC
+    ) TO STDOUT WITH (FORMAT CSV, HEADER)
+"""
+
+
+def _iter_maintenance_csv_copy(session: Session, vehicle_id: Optional[int]) -> Iterator[str]:
+    """Stream the maintenance CSV straight from PostgreSQL's COPY ... TO STDOUT"""
+    if vehicle_id:
+        statement, params = _MAINTENANCE_CSV_COPY_SQL.format(where="WHERE m.vehicle_id = %s"), (vehicle_id,)
+    else:
+        statement, params = _MAINTENANCE_CSV_COPY_SQL.format(where=""), None
+    # COPY chunks can split a multi-byte character, so decode incrementally
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    dbapi_connection = session.connection().connection.dbapi_connection
+    with dbapi_connection.cursor() as cursor:
+        with cursor.copy(statement, params) as copy:
+            for data in copy:
+                text_chunk = decoder.decode(bytes(data))
+                if text_chunk:
+                    yield text_chunk
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _maintenance_csv_chunks(session: Session, vehicle_id: Optional[int]) -> Iterator[str]:
+    if session.get_bind().dialect.name == "postgresql":
+        yield from _iter_maintenance_csv_copy(session, vehicle_id)
+        return
+    
+    # Get records with vehicle info while session is active
+    from sqlalchemy.orm import selectinload
+    
+    query = (
+        select(MaintenanceRecord)
+        .options(selectinload(MaintenanceRecord.vehicle))
+        .order_by(MaintenanceRecord.date.desc())
+    )
+    if vehicle_id:
+        # Export single vehicle maintenance
+        query = query.where(MaintenanceRecord.vehicle_id == vehicle_id)
+    
+    # Fetch in batches so large exports never materialize every row at once
+    records = session.execute(query.execution_options(yield_per=500)).scalars()
+    
+    # Rows are formatted while the session is still active
+    yield from _iter_csv_chunks(
+        ['Vehicle Name', 'Date', 'Description', 'Cost', 'Mileage'],
+        (
+            [
+                record.vehicle.name if record.vehicle else "Unknown",
                 record.date.strftime("%Y-%m-%d"),
                 record.description,
                 f"${record.cost:.2f}" if record.cost else "$0.00",
-                record.mileage
-            ])
-        
-        return output.getvalue()
-    except Exception as e:
-        print(f"Error exporting maintenance: {e}")
-        return ""
-    finally:
-        session.close()
+                record.mileage,
+            ]
+            for record in records
+        ),
+    )
+
+
+def iter_maintenance_csv(vehicle_id: Optional[int] = None) -> Iterator[str]:
+    """Return an iterator of maintenance CSV chunks; query errors raise here, not mid-stream"""
+    session = SessionLocal()
+    return _start_csv_export(session, _maintenance_csv_chunks(session, vehicle_id), "maintenance")
+
+def export_vehicles_csv(vehicle_ids: Optional[List[int]] = None) -> str:
+    """Export vehicles to CSV format"""
+    return "".join(iter_vehicles_csv(vehicle_ids))
 
-def export_vehicles_pdf(vehicle_ids: Optional[List[int]] = None) -> bytes:
-    """Export vehicles to PDF format using ReportLab"""
+def export_maintenance_csv(vehicle_id: Optional[int] = None) -> str:
+    """Export maintenance records to CSV format"""
+    return "".join(iter_maintenance_csv(vehicle_id))
+
+def export_vehicles_pdf(vehicle_ids: Optional[List[int]] = None, out: Optional[BinaryIO] = None) -> bytes:
+    """Export vehicles to PDF format using ReportLab.
+
+    With ``out`` the document is written to that file object and b"" is returned.
+    """
     try:
         from reportlab.lib.pagesizes import letter
         from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
@@ -1251,13 +1742,11 @@ def export_vehicles_pdf(vehicle_ids: Optional[List[int]] = None) -> bytes:
         from io import BytesIO
         
         # Get vehicle data
-        if vehicle_ids:
-            vehicles = [get_vehicle_by_id(vid) for vid in vehicle_ids if get_vehicle_by_id(vid)]
-        else:
-            vehicles = get_all_vehicles()
+        with SessionLocal() as session:
+            vehicles = _select_export_vehicles(session, vehicle_ids)
         
-        # Create PDF buffer
-        buffer = BytesIO()
+        # Create PDF buffer (or write straight to the caller's file)
+        buffer = out if out is not None else BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=letter)
         elements = []
         
@@ -1301,6 +1790,8 @@ def export_vehicles_pdf(vehicle_ids: Optional[List[int]] = None) -> bytes:
         elements.append(table)
         doc.build(elements)
         
+        if out is not None:
+            return b""
         pdf_content = buffer.getvalue()
         buffer.close()
         return pdf_content
@@ -1309,8 +1800,11 @@ def export_vehicles_pdf(vehicle_ids: Optional[List[int]] = None) -> bytes:
         print(f"Error exporting vehicles to PDF: {e}")
         return b""
 
-def export_maintenance_pdf(vehicle_id: Optional[int] = None) -> bytes:
-    """Export maintenance records to PDF format using ReportLab"""
+def export_maintenance_pdf(vehicle_id: Optional[int] = None, out: Optional[BinaryIO] = None) -> bytes:
+    """Export maintenance records to PDF format using ReportLab.
+
+    With ``out`` the document is written to that file object and b"" is returned.
+    """
     try:
         from reportlab.lib.pagesizes import letter
         from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
@@ -1337,8 +1831,8 @@ def export_maintenance_pdf(vehicle_id: Optional[int] = None) -> bytes:
                     .order_by(MaintenanceRecord.date.desc())
                 ).scalars().all()
             
-            # Create PDF buffer
-            buffer = BytesIO()
+            # Create PDF buffer (or write straight to the caller's file)
+            buffer = out if out is not None else BytesIO()
             doc = SimpleDocTemplate(buffer, pagesize=letter)
             elements = []
             
@@ -1390,6 +1884,8 @@ def export_maintenance_pdf(vehicle_id: Optional[int] = None) -> bytes:
             elements.append(table)
             doc.build(elements)
             
+            if out is not None:
+                return b""
             pdf_content = buffer.getvalue()
             buffer.close()
             return pdf_content
@@ -1405,15 +1901,32 @@ def export_maintenance_pdf(vehicle_id: Optional[int] = None) -> bytes:
 # UTILITY OPERATIONS
 # ============================================================================
 
-def get_vehicle_names() -> List[Dict[str, Any]]:
+# Vehicle names back every form dropdown but change rarely, so keep them briefly
+_VEHICLE_NAMES_TTL_SECONDS = 30
+_vehicle_names_cache = TTLCache(_VEHICLE_NAMES_TTL_SECONDS)
+
+
+def invalidate_vehicle_cache() -> None:
+    """Drop cached vehicle names; call after any vehicle create/update/delete/transfer"""
+    _vehicle_names_cache.invalidate()
+
+
+def get_vehicle_names(account_id: Optional[str] = None) -> List[Dict[str, Any]]:
     """Get list of vehicle names and IDs for dropdowns"""
+    cached, generation = _vehicle_names_cache.get(account_id)
+    if cached is not MISS:
+        return [dict(item) for item in cached]
+
     try:
-        vehicles = get_all_vehicles()
-        return [{"id": v.id, "name": v.name} for v in vehicles]
+        vehicles = get_all_vehicles(account_id=account_id)
+        names = [{"id": v.id, "name": v.name} for v in vehicles]
     except Exception as e:
         print(f"Error getting vehicle names: {e}")
         return []
 
+    _vehicle_names_cache.set(account_id, names, generation)
+    return [dict(item) for item in names]
+
 def get_maintenance_summary() -> Dict[str, Any]:
     """Get summary statistics for maintenance page"""
     try:
@@ -1633,12 +2146,15 @@ def create_future_oil_change_record(vehicle_id: int,
         )
         
         session.add(future_maintenance)
+        # Flush so the INSERT populates the id; no refresh SELECT after commit
+        session.flush()
+        future_maintenance_id = future_maintenance.id
         session.commit()
-        session.refresh(future_maintenance)
+        invalidate_notifications_cache()
         
         return {
             "success": True,
-            "future_maintenance_id": future_maintenance.id,
+            "future_maintenance_id": future_maintenance_id,
             "next_due_mileage": next_due_mileage,
             "next_due_date": next_due_date,
             "message": f"Next oil change scheduled for {next_due_mileage:,} miles or {next_due_date}"
@@ -1669,6 +2185,49 @@ def get_future_maintenance_by_id(future_maintenance_id: int) -> Optional[Any]:
     finally:
         session.close()
 
+def _mileage_summary_by_vehicle(session: Session, vehicle_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """current_mileage, source and confidence per vehicle, as get_vehicle_current_mileage reports them.
+
+    Two grouped aggregates (maintenance records and fuel entries) for all the
+    vehicles instead of loading every row of each vehicle separately.
+    """
+    from models import FuelEntry
+
+    def _aggregate(model):
+        return {
+            vehicle_id: (count, low, high)
+            for vehicle_id, count, low, high in session.execute(
+                select(model.vehicle_id, func.count(), func.min(model.mileage), func.max(model.mileage))
+                .where(model.vehicle_id.in_(vehicle_ids))
+                .group_by(model.vehicle_id)
+            )
+        }
+
+    maintenance = _aggregate(MaintenanceRecord)
+    fuel = _aggregate(FuelEntry)
+
+    summaries: Dict[int, Dict[str, Any]] = {}
+    for vehicle_id in vehicle_ids:
+        sources = [agg for agg in (maintenance.get(vehicle_id), fuel.get(vehicle_id)) if agg]
+        if not sources:
+            summaries[vehicle_id] = {"current_mileage": 0, "source": "none", "confidence": "low"}
+            continue
+        total = sum(count for count, _, _ in sources)
+        high = max(agg[2] for agg in sources)
+        low = min(agg[1] for agg in sources)
+        # Ties go to maintenance, matching the stable sort in get_vehicle_current_mileage
+        in_maintenance = vehicle_id in maintenance and maintenance[vehicle_id][2] == high
+        summaries[vehicle_id] = {
+            "current_mileage": high,
+            "source": "maintenance" if in_maintenance else "fuel",
+            "confidence": "high" if total > 1 and high - low <= 1000 else "medium",
+        }
+    return summaries
+
+# Oil reminders are matched by type name; a compiled case-insensitive search avoids
+# lowercasing a copy of every reminder's type
+OIL_TYPE_RE = re.compile("oil", re.IGNORECASE)
+
 def get_oil_status_for_all(
     account_id: Optional[str] = None, owner_user_id: str = DEFAULT_OWNER_ID
 ) -> List[Dict[str, Any]]:
@@ -1689,16 +2248,24 @@ def get_oil_status_for_all(
 
     today = date.today()
 
-    vehicles = get_all_vehicles(account_id=account_id, owner_user_id=owner_user_id)
+    vehicles = get_vehicle_summaries(account_id=account_id, owner_user_id=owner_user_id)
     records = get_all_maintenance_records(account_id=account_id, owner_user_id=owner_user_id)
-    mileage_map = get_all_vehicles_current_mileage(account_id=account_id, owner_user_id=owner_user_id)
+    session = SessionLocal()
+    try:
+        mileage_map = _mileage_summary_by_vehicle(session, [vehicle["id"] for vehicle in vehicles])
+    finally:
+        session.close()
     future_items = get_all_future_maintenance(account_id=account_id, owner_user_id=owner_user_id)
 
+    oil_changes_by_vehicle: Dict[int, List[MaintenanceRecord]] = {}
+    for record in records:
+        if getattr(record, "is_oil_change", False):
+            oil_changes_by_vehicle.setdefault(record.vehicle_id, []).append(record)
+
     # Group future maintenance oil-change reminders by vehicle, using the earliest trigger
     future_by_vehicle: Dict[int, Dict[str, Any]] = {}
     for item in future_items:
-        maintenance_type = (item.get("maintenance_type") or "").lower()
-        if "oil" not in maintenance_type:
+        if not OIL_TYPE_RE.search(item.get("maintenance_type") or ""):
             continue
         vehicle_id = item["vehicle_id"]
         existing = future_by_vehicle.get(vehicle_id)
@@ -1718,15 +2285,14 @@ def get_oil_status_for_all(
     statuses: List[Dict[str, Any]] = []
 
     for vehicle in vehicles:
-        vehicle_id = vehicle.id
-        vehicle_name = vehicle.name
+        vehicle_id = vehicle["id"]
+        vehicle_name = vehicle["name"]
 
         mileage_info = mileage_map.get(vehicle_id, {})
         current_miles = mileage_info.get("current_mileage", 0) or 0
 
         # Locate most recent oil change record
-        vehicle_records = [r for r in records if r.vehicle_id == vehicle_id]
-        oil_changes = [r for r in vehicle_records if getattr(r, "is_oil_change", False)]
+        oil_changes = oil_changes_by_vehicle.get(vehicle_id, [])
         last_oil_change = max(oil_changes, key=lambda r: r.date or date.min) if oil_changes else None
 
         interval_miles = None
@@ -2004,6 +2570,24 @@ def get_home_dashboard_summary() -> Dict[str, Any]:
 # FUEL TRACKING OPERATIONS
 # ============================================================================
 
+def _serialize_fuel_entry(entry) -> Dict[str, Any]:
+    """Convert a FuelEntry row to the dict shape returned by the fuel helpers."""
+    return {
+        "id": entry.id,
+        "date": entry.date,
+        "time": getattr(entry, "time", None),
+        "mileage": entry.mileage,
+        "fuel_amount": entry.fuel_amount,
+        "fuel_cost": entry.fuel_cost,
+        "fuel_type": entry.fuel_type,
+        "driving_pattern": entry.driving_pattern,
+        "notes": entry.notes,
+        "odometer_photo": entry.odometer_photo,
+        "created_at": entry.created_at,
+        "updated_at": entry.updated_at,
+    }
+
+
 def get_fuel_entries_for_vehicle(
     vehicle_id: int, account_id: Optional[str] = None, owner_user_id: str = DEFAULT_OWNER_ID
 ) -> List[Dict[str, Any]]:
@@ -2036,26 +2620,7 @@ def get_fuel_entries_for_vehicle(
 
         fuel_entries = session.execute(query).scalars().all()
 
-        entries: List[Dict[str, Any]] = []
-        for entry in fuel_entries:
-            entries.append(
-                {
-                    "id": entry.id,
-                    "date": entry.date,
-                    "time": getattr(entry, "time", None),
-                    "mileage": entry.mileage,
-                    "fuel_amount": entry.fuel_amount,
-                    "fuel_cost": entry.fuel_cost,
-                    "fuel_type": entry.fuel_type,
-                    "driving_pattern": entry.driving_pattern,
-                    "notes": entry.notes,
-                    "odometer_photo": entry.odometer_photo,
-                    "created_at": entry.created_at,
-                    "updated_at": entry.updated_at,
-                }
-            )
-        
-        return entries
+        return [_serialize_fuel_entry(entry) for entry in fuel_entries]
         
     except Exception as e:
         print(f"Error getting fuel entries for vehicle {vehicle_id}: {e}")
@@ -2064,6 +2629,72 @@ def get_fuel_entries_for_vehicle(
         session.close()
 
 
+def get_latest_fuel_mileage(vehicle_id: int) -> Optional[int]:
+    """Highest odometer reading among a vehicle's fuel entries, or None when it has none.
+
+    Reads the stored Vehicle.last_fuel_mileage (a primary key lookup) instead of
+    aggregating the vehicle's fuel entries.
+    """
+    session = SessionLocal()
+    try:
+        return session.execute(
+            select(Vehicle.last_fuel_mileage).where(Vehicle.id == vehicle_id)
+        ).scalar()
+    except Exception as e:
+        print(f"Error getting latest fuel mileage: {e}")
+        return None
+    finally:
+        session.close()
+
+def get_fuel_entries_for_vehicles(
+    vehicle_ids: List[int], account_id: Optional[str] = None, owner_user_id: str = DEFAULT_OWNER_ID
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Get fuel entries for several vehicles in one query, grouped by vehicle id.
+
+    Each list matches get_fuel_entries_for_vehicle() for that vehicle; vehicles
+    without entries are omitted.
+    """
+    if not vehicle_ids:
+        return {}
+    session = SessionLocal()
+    try:
+        from models import FuelEntry
+        
+        normalized_account_id = (
+            account_id if account_id and account_id.lower() not in ("all", "null") else None
+        )
+
+        query = (
+            select(FuelEntry)
+            .join(Vehicle, Vehicle.id == FuelEntry.vehicle_id)
+            .outerjoin(Account, Account.id == Vehicle.account_id)
+            .where(FuelEntry.vehicle_id.in_(vehicle_ids))
+            .order_by(FuelEntry.vehicle_id, FuelEntry.date.desc(), FuelEntry.mileage.desc())
+        )
+
+        if normalized_account_id:
+            query = query.where(
+                Vehicle.account_id == normalized_account_id,
+                or_(Account.owner_user_id == owner_user_id, Account.id.is_(None)),
+            )
+        else:
+            query = query.where(
+                or_(Account.owner_user_id == owner_user_id, Vehicle.account_id.is_(None))
+            )
+
+        entries_by_vehicle: Dict[int, List[Dict[str, Any]]] = {}
+        for entry in session.execute(query).scalars():
+            entries_by_vehicle.setdefault(entry.vehicle_id, []).append(_serialize_fuel_entry(entry))
+        return entries_by_vehicle
+        
+    except Exception as e:
+        print(f"Error getting fuel entries for vehicles {vehicle_ids}: {e}")
+        return {}
+    finally:
+        session.close()
+
+
 def get_all_fuel_entries(
     account_id: Optional[str] = None, owner_user_id: str = DEFAULT_OWNER_ID
 ) -> List[Dict[str, Any]]:
@@ -2076,8 +2707,26 @@ def get_all_fuel_entries(
             account_id if account_id and account_id.lower() not in ("all", "null") else None
         )
 
+        # Plain column rows: no ORM objects or identity-map bookkeeping per entry
         query = (
-            select(FuelEntry, Vehicle, Account)
+            select(
+                FuelEntry.id,
+                FuelEntry.vehicle_id,
+                Vehicle.name.label("vehicle_name"),
+                Vehicle.account_id,
+                Account.name.label("account_name"),
+                FuelEntry.date,
+                FuelEntry.time,
+                FuelEntry.mileage,
+                FuelEntry.fuel_amount,
+                FuelEntry.fuel_cost,
+                FuelEntry.fuel_type,
+                FuelEntry.driving_pattern,
+                FuelEntry.notes,
+                FuelEntry.odometer_photo,
+                FuelEntry.created_at,
+                FuelEntry.updated_at,
+            )
             .join(Vehicle, Vehicle.id == FuelEntry.vehicle_id)
             .outerjoin(Account, Account.id == Vehicle.account_id)
             .order_by(FuelEntry.date.desc(), FuelEntry.mileage.desc(), FuelEntry.id.desc())
@@ -2093,30 +2742,7 @@ def get_all_fuel_entries(
                 or_(Account.owner_user_id == owner_user_id, Vehicle.account_id.is_(None))
             )
 
-        fuel_entries = session.execute(query).all()
-
-        entries: List[Dict[str, Any]] = []
-        for entry, vehicle, account in fuel_entries:
-            entries.append(
-                {
-                    "id": entry.id,
-                    "vehicle_id": entry.vehicle_id,
-                    "vehicle_name": vehicle.name if vehicle else "Unknown Vehicle",
-                    "account_id": vehicle.account_id if vehicle else None,
-                    "account_name": account.name if account else None,
-                    "date": entry.date,
-                    "time": getattr(entry, "time", None),
-                    "mileage": entry.mileage,
-                    "fuel_amount": entry.fuel_amount,
-                    "fuel_cost": entry.fuel_cost,
-                    "fuel_type": entry.fuel_type,
-                    "driving_pattern": entry.driving_pattern,
-                    "notes": entry.notes,
-                    "odometer_photo": entry.odometer_photo,
-                    "created_at": entry.created_at,
-                    "updated_at": entry.updated_at,
-                }
-            )
+        entries: List[Dict[str, Any]] = [dict(row) for row in session.execute(query).mappings()]
         
         return entries
         
@@ -2126,6 +2752,151 @@ def get_all_fuel_entries(
     finally:
         session.close()
 
+# Rows per INSERT statement for bulk fuel entry creation
+_FUEL_INSERT_BATCH = 1000
+
+
+def sync_last_fuel_mileage(session: Session, vehicle_ids: Iterable[int]) -> None:
+    """Recompute Vehicle.last_fuel_mileage from fuel entries, in the caller's transaction.
+
+    Needed after an entry is edited or deleted, when the highest reading may go down.
+    """
+    from models import FuelEntry
+
+    latest = (
+        select(func.max(FuelEntry.mileage))
+        .where(FuelEntry.vehicle_id == Vehicle.id)
+        .scalar_subquery()
+    )
+    session.execute(
+        update(Vehicle).where(Vehicle.id.in_(set(vehicle_ids))).values(last_fuel_mileage=latest)
+    )
+
+def create_fuel_entries(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Insert fuel entries with batched INSERT ... RETURNING in a single transaction.
+
+    Each entry needs vehicle_id, date (a date, or MM/DD/YYYY or YYYY-MM-DD), mileage, fuel_amount,
+    fuel_cost, fuel_type and driving_pattern; time, notes and odometer_photo are optional.
+    Returns the new ids in input order.
+    """
+    from models import FuelEntry
+
+    rows: List[Dict[str, Any]] = []
+    for index, entry in enumerate(entries):
+        try:
+            parsed_date = parse_date_string(entry["date"])
+        except ValueError as e:
+            return {"success": False, "error": f"Entry {index + 1}: {e}"}
+        rows.append({
+            "vehicle_id": entry["vehicle_id"],
+            "date": parsed_date,
+            "time": entry.get("time"),
+            "mileage": entry["mileage"],
+            "fuel_amount": entry["fuel_amount"],
+            "fuel_cost": entry["fuel_cost"],
+            "fuel_type": entry["fuel_type"],
+            "driving_pattern": entry["driving_pattern"],
+            "notes": entry.get("notes"),
+            "odometer_photo": entry.get("odometer_photo"),
+        })
+    if not rows:
+        return {"success": True, "entry_ids": []}
+
+    session = SessionLocal()
+    try:
+        statement = insert(FuelEntry).returning(FuelEntry.id, sort_by_parameter_order=True)
+        entry_ids: List[int] = []
+        for start in range(0, len(rows), _FUEL_INSERT_BATCH):
+            entry_ids.extend(session.scalars(statement, rows[start:start + _FUEL_INSERT_BATCH]))
+
+        # Raise each vehicle's stored last mileage in the same transaction; the
+        # conditional UPDATE locks the row, so concurrent inserts can't lose a higher value
+        highest: Dict[int, int] = {}
+        for row in rows:
+            vehicle_id, mileage = row["vehicle_id"], row["mileage"]
+            highest[vehicle_id] = max(highest.get(vehicle_id, mileage), mileage)
+        for vehicle_id, mileage in highest.items():
+            session.execute(
+                update(Vehicle)
+                .where(
+                    Vehicle.id == vehicle_id,
+                    or_(Vehicle.last_fuel_mileage.is_(None), Vehicle.last_fuel_mileage < mileage),
+                )
+                .values(last_fuel_mileage=mileage)
+            )
+        session.commit()
+        invalidate_notifications_cache()
+        return {"success": True, "entry_ids": entry_ids}
+    except Exception as e:
+        session.rollback()
+        print(f"Error creating fuel entries: {e}")
+        return {"success": False, "error": str(e)}
+    finally:
+        session.close()
+
+def _build_vehicle_health_entry(
+    vehicle: Vehicle, vehicle_records: List[MaintenanceRecord], current_mileage: int, current_year: int
+) -> Dict[str, Any]:
+    """Build the health summary for one vehicle from its records and current mileage."""
+    # Get maintenance records for this vehicle this year
+    vehicle_year_records = [r for r in vehicle_records if r.date and r.date.year == current_year]
+    
+    # Calculate cost this year
+    cost_this_year = sum(r.cost or 0 for r in vehicle_year_records)
+    
+    # Get oil change status
+    oil_changes = [r for r in vehicle_records if getattr(r, "is_oil_change", False)]
+    oil_change_status = "unknown"
+    
+    if oil_changes and current_mileage > 0:
+        # Sort by date (most recent first)
+        oil_changes.sort(key=lambda x: x.date or datetime.min.date(), reverse=True)
+        last_oil_change = oil_changes[0]
+        
+        # Get oil change interval
+        oil_change_interval = get_oil_change_interval_from_record(last_oil_change)
+        last_mileage = getattr(last_oil_change, "mileage", 0) or 0
+        miles_since_oil_change = current_mileage - last_mileage
+        miles_until_next = oil_change_interval - miles_since_oil_change
+        
+        if miles_until_next < 0:
+            oil_change_status = "overdue"
+        elif miles_until_next <= 500:
+            oil_change_status = "due_soon"
+        else:
+            oil_change_status = "good"
+    
+    # Determine overall health indicator
+    if oil_change_status == "overdue":
+        health_indicator = "🔴"
+        health_text = "Overdue"
+        health_class = "text-danger"
+    elif oil_change_status == "due_soon":
+        health_indicator = "🟡"
+        health_text = "Due Soon"
+        health_class = "text-warning"
+    elif oil_change_status == "good":
+        health_indicator = "🟢"
+        health_text = "Good"
+        health_class = "text-success"
+    else:
+        health_indicator = "⚪"
+        health_text = "Unknown"
+        health_class = "text-muted"
+    
+    return {
+        "vehicle": vehicle,
+        "current_mileage": current_mileage,
+        "cost_this_year": cost_this_year,
+        "health_indicator": health_indicator,
+        "health_text": health_text,
+        "health_class": health_class,
+        "oil_change_status": oil_change_status,
+        "maintenance_count": len(vehicle_records),
+        "year_records_count": len(vehicle_year_records),
+    }
+
+
 def get_vehicle_health_status(
     account_id: Optional[str] = None, owner_user_id: str = DEFAULT_OWNER_ID
 ) -> List[Dict[str, Any]]:
@@ -2146,69 +2917,15 @@ def get_vehicle_health_status(
         vehicle_health: List[Dict[str, Any]] = []
         
         for vehicle in vehicles:
-            vehicle_id = vehicle.id
-            current_mileage_info = vehicles_current_mileage.get(vehicle_id, {})
-            current_mileage = current_mileage_info.get("current_mileage", 0)
-            
-            # Get maintenance records for this vehicle this year
-            vehicle_records = [r for r in records if r.vehicle_id == vehicle_id]
-            vehicle_year_records = [r for r in vehicle_records if r.date and r.date.year == current_year]
-            
-            # Calculate cost this year
-            cost_this_year = sum(r.cost or 0 for r in vehicle_year_records)
-            
-            # Get oil change status
-            oil_changes = [r for r in vehicle_records if getattr(r, "is_oil_change", False)]
-            oil_change_status = "unknown"
-            
-            if oil_changes and current_mileage > 0:
-                # Sort by date (most recent first)
-                oil_changes.sort(key=lambda x: x.date or datetime.min.date(), reverse=True)
-                last_oil_change = oil_changes[0]
-                
-                # Get oil change interval
-                oil_change_interval = get_oil_change_interval_from_record(last_oil_change)
-                last_mileage = getattr(last_oil_change, "mileage", 0) or 0
-                miles_since_oil_change = current_mileage - last_mileage
-                miles_until_next = oil_change_interval - miles_since_oil_change
-                
-                if miles_until_next < 0:
-                    oil_change_status = "overdue"
-                elif miles_until_next <= 500:
-                    oil_change_status = "due_soon"
-                else:
-                    oil_change_status = "good"
-            
-            # Determine overall health indicator
-            if oil_change_status == "overdue":
-                health_indicator = "🔴"
-                health_text = "Overdue"
-                health_class = "text-danger"
-            elif oil_change_status == "due_soon":
-                health_indicator = "🟡"
-                health_text = "Due Soon"
-                health_class = "text-warning"
-            elif oil_change_status == "good":
-                health_indicator = "🟢"
-                health_text = "Good"
-                health_class = "text-success"
-            else:
-                health_indicator = "⚪"
-                health_text = "Unknown"
-                health_class = "text-muted"
-            
+            current_mileage_info = vehicles_current_mileage.get(vehicle.id, {})
+            vehicle_records = [r for r in records if r.vehicle_id == vehicle.id]
             vehicle_health.append(
-                {
-                "vehicle": vehicle,
-                "current_mileage": current_mileage,
-                "cost_this_year": cost_this_year,
-                "health_indicator": health_indicator,
-                "health_text": health_text,
-                "health_class": health_class,
-                "oil_change_status": oil_change_status,
-                "maintenance_count": len(vehicle_records),
-                    "year_records_count": len(vehicle_year_records),
-                }
+                _build_vehicle_health_entry(
+                    vehicle,
+                    vehicle_records,
+                    current_mileage_info.get("current_mileage", 0),
+                    current_year,
+                )
             )
         
         return vehicle_health
@@ -2291,13 +3008,16 @@ def create_future_maintenance(
         )
         
         session.add(future_maintenance)
+        # Flush so the INSERT populates the id; no refresh SELECT after commit
+        session.flush()
+        future_maintenance_id = future_maintenance.id
         session.commit()
-        session.refresh(future_maintenance)
+        invalidate_notifications_cache()
         
         return {
             "success": True,
             "message": "Future maintenance reminder created successfully",
-            "future_maintenance_id": future_maintenance.id
+            "future_maintenance_id": future_maintenance_id
         }
         
     except Exception as e:
@@ -2388,6 +3108,7 @@ def update_future_maintenance(
         future_maintenance.updated_at = datetime.now().date()
         
         session.commit()
+        invalidate_notifications_cache()
         
         return {
             "success": True,
@@ -2473,6 +3194,30 @@ def get_all_future_maintenance(
         session.close()
 
 
+def _serialize_vehicle_future_maintenance(fm, vehicle: Vehicle, account: Optional[Account]) -> Dict[str, Any]:
+    """Serialize a future maintenance row in the per-vehicle shape."""
+    return {
+        "id": fm.id,
+        "vehicle_id": fm.vehicle_id,
+        "maintenance_type": fm.maintenance_type,
+        "target_mileage": fm.target_mileage,
+        "target_date": fm.target_date,
+        "mileage_reminder": fm.mileage_reminder,
+        "date_reminder": fm.date_reminder,
+        "estimated_cost": fm.estimated_cost,
+        "parts_link": fm.parts_link,
+        "notes": fm.notes,
+        "is_recurring": fm.is_recurring,
+        "recurrence_interval_miles": fm.recurrence_interval_miles,
+        "recurrence_interval_months": fm.recurrence_interval_months,
+        "is_active": fm.is_active,
+        "created_at": fm.created_at,
+        "updated_at": fm.updated_at,
+        "account_id": vehicle.account_id,
+        "account_name": account.name if account else None,
+    }
+
+
 def get_future_maintenance_by_vehicle(
     vehicle_id: int, account_id: Optional[str] = None, owner_user_id: str = DEFAULT_OWNER_ID
 ) -> List[Dict[str, Any]]:
@@ -2506,32 +3251,7 @@ def get_future_maintenance_by_vehicle(
 
         future_maintenance = session.execute(query).all()
 
-        result: List[Dict[str, Any]] = []
-        for fm, vehicle, account in future_maintenance:
-            result.append(
-                {
-                    "id": fm.id,
-                    "vehicle_id": fm.vehicle_id,
-                    "maintenance_type": fm.maintenance_type,
-                    "target_mileage": fm.target_mileage,
-                    "target_date": fm.target_date,
-                    "mileage_reminder": fm.mileage_reminder,
-                    "date_reminder": fm.date_reminder,
-                    "estimated_cost": fm.estimated_cost,
-                    "parts_link": fm.parts_link,
-                    "notes": fm.notes,
-                    "is_recurring": fm.is_recurring,
-                    "recurrence_interval_miles": fm.recurrence_interval_miles,
-                    "recurrence_interval_months": fm.recurrence_interval_months,
-                    "is_active": fm.is_active,
-                    "created_at": fm.created_at,
-                    "updated_at": fm.updated_at,
-                    "account_id": vehicle.account_id,
-                    "account_name": account.name if account else None,
-                }
-            )
-        
-        return result
+        return [_serialize_vehicle_future_maintenance(fm, vehicle, account) for fm, vehicle, account in future_maintenance]
         
     except Exception as e:
         print(f"Error getting future maintenance for vehicle {vehicle_id}: {e}")
@@ -2556,6 +3276,7 @@ def mark_future_maintenance_completed(future_maintenance_id: int) -> Dict[str, A
         # Mark as inactive (completed)
         future_maintenance.is_active = False
         session.commit()
+        invalidate_notifications_cache()
         
         return {"success": True, "message": "Future maintenance record marked as completed"}
         
@@ -2580,6 +3301,7 @@ def delete_future_maintenance(future_maintenance_id: int) -> Dict[str, Any]:
         
         session.delete(future_maintenance)
         session.commit()
+        invalidate_notifications_cache()
         
         return {
             "success": True,
@@ -2599,73 +3321,73 @@ def delete_future_maintenance(future_maintenance_id: int) -> Dict[str, Any]:
 # FUTURE MAINTENANCE TRIGGER FUNCTIONS
 # ============================================================================
 
+def _evaluate_triggered_items(future_items: List[Dict[str, Any]], current_mileage: int) -> List[Dict[str, Any]]:
+    """Return the future maintenance items whose mileage or date reminder has fired."""
+    from datetime import date, timedelta
+
+    today = date.today()
+    triggered_items = []
+    
+    for item in future_items:
+        # Check if mileage trigger is met
+        mileage_triggered = False
+        if item.get('target_mileage') and item.get('mileage_reminder'):
+            reminder_threshold = item['target_mileage'] - item['mileage_reminder']
+            if current_mileage >= reminder_threshold:
+                mileage_triggered = True
+        
+        # Check if date trigger is met
+        date_triggered = False
+        if item.get('target_date') and item.get('date_reminder'):
+            # target_date is already a date object from the database
+            target_date = item['target_date']
+            
+            # Calculate the reminder threshold (target_date - reminder_days)
+            reminder_threshold = target_date - timedelta(days=item['date_reminder'])
+            
+            if today >= reminder_threshold:
+                date_triggered = True
+        
+        # Only include items that have met their triggers
+        if mileage_triggered or date_triggered:
+            # Calculate urgency based on what's actually overdue
+            is_mileage_overdue = False
+            is_date_overdue = False
+            
+            # Check if mileage is overdue (past target)
+            if item.get('target_mileage'):
+                is_mileage_overdue = current_mileage >= item['target_mileage']
+            
+            # Check if date is overdue (past target)
+            if item.get('target_date'):
+                is_date_overdue = today >= item['target_date']
+            
+            # Determine urgency level with priority on mileage for vehicles
+            if is_mileage_overdue:
+                urgency = "high"  # Mileage overdue - RED
+            elif mileage_triggered and not is_mileage_overdue:
+                urgency = "medium"  # Approaching mileage target - YELLOW
+            elif is_date_overdue:
+                urgency = "high"  # Date overdue - RED
+            elif date_triggered:
+                urgency = "low"  # Approaching date - BLUE
+            else:
+                urgency = "low"  # Default - BLUE
+            
+            triggered_items.append({
+                **item,
+                'urgency': urgency,
+                'mileage_triggered': mileage_triggered,
+                'date_triggered': date_triggered
+            })
+    
+    return triggered_items
+
 def get_triggered_future_maintenance(vehicle_id: int, current_mileage: int) -> List[Dict[str, Any]]:
     """Get future maintenance items that have met their notification triggers"""
     try:
         future_items = get_future_maintenance_by_vehicle(vehicle_id)
-        triggered_items = []
-        
-        for item in future_items:
-            # Check if mileage trigger is met
-            mileage_triggered = False
-            if item.get('target_mileage') and item.get('mileage_reminder'):
-                reminder_threshold = item['target_mileage'] - item['mileage_reminder']
-                if current_mileage >= reminder_threshold:
-                    mileage_triggered = True
-            
-            # Check if date trigger is met
-            date_triggered = False
-            if item.get('target_date') and item.get('date_reminder'):
-                from datetime import date, timedelta
-                today = date.today()
-                
-                # target_date is already a date object from the database
-                target_date = item['target_date']
-                
-                # Calculate the reminder threshold (target_date - reminder_days)
-                reminder_threshold = target_date - timedelta(days=item['date_reminder'])
-                
-                if today >= reminder_threshold:
-                    date_triggered = True
-            
-            # Only include items that have met their triggers
-            if mileage_triggered or date_triggered:
-                # Calculate urgency based on what's actually overdue
-                is_mileage_overdue = False
-                is_date_overdue = False
-                
-                # Check if mileage is overdue (past target)
-                if item.get('target_mileage'):
-                    is_mileage_overdue = current_mileage >= item['target_mileage']
-                
-                # Check if date is overdue (past target)
-                if item.get('target_date'):
-                    from datetime import date
-                    today = date.today()
-                    is_date_overdue = today >= item['target_date']
-                
-                # Determine urgency level with priority on mileage for vehicles
-                if is_mileage_overdue:
-                    urgency = "high"  # Mileage overdue - RED
-                elif mileage_triggered and not is_mileage_overdue:
-                    urgency = "medium"  # Approaching mileage target - YELLOW
-                elif is_date_overdue:
-                    urgency = "high"  # Date overdue - RED
-                elif date_triggered:
-                    urgency = "low"  # Approaching date - BLUE
-                else:
-                    urgency = "low"  # Default - BLUE
-                
-
-                
-                triggered_items.append({
-                    **item,
-                    'urgency': urgency,
-                    'mileage_triggered': mileage_triggered,
-                    'date_triggered': date_triggered
-                })
-        
-        return triggered_items
+        return _evaluate_triggered_items(future_items, current_mileage)
         
     except Exception as e:
         return []
@@ -2691,3 +3413,163 @@ def get_all_vehicles_triggered_maintenance(
     except Exception as e:
         print(f"Error getting all vehicles triggered maintenance: {e}")
         return {}
+
+
+def _active_future_by_vehicle(session: Session, vehicle_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+    """Active future maintenance for the vehicles, grouped by vehicle_id.
+
+    Items have get_future_maintenance_by_vehicle's shape and order.
+    """
+    from models import FutureMaintenance
+
+    future_by_vehicle: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    future_rows = session.execute(
+        select(FutureMaintenance, Vehicle, Account)
+        .join(Vehicle, FutureMaintenance.vehicle_id == Vehicle.id)
+        .outerjoin(Account, Account.id == Vehicle.account_id)
+        .where(FutureMaintenance.vehicle_id.in_(vehicle_ids))
+        .where(FutureMaintenance.is_active == True)  # noqa: E712
+        .order_by(FutureMaintenance.target_date, FutureMaintenance.id)
+    ).all()
+    for fm, vehicle, account in future_rows:
+        future_by_vehicle[fm.vehicle_id].append(_serialize_vehicle_future_maintenance(fm, vehicle, account))
+    return future_by_vehicle
+
+
+def get_notifications_bundle(
+    account_id: Optional[str] = None, owner_user_id: str = DEFAULT_OWNER_ID
+) -> Dict[str, Any]:
+    """
+    Load the notification data for every vehicle in one session.
+
+    Vehicles (id, name, year, make, model, account_id), their current mileage and
+    their active reminders are fetched with one query each, instead of a mileage
+    lookup and a reminders lookup per vehicle.
+
+    Returns a dict with:
+      - vehicles: list of vehicle dicts, each with its current_mileage
+      - triggered_maintenance: dict matching get_all_vehicles_triggered_maintenance()
+    """
+    session = SessionLocal()
+    try:
+        query = (
+            select(Vehicle.id, Vehicle.name, Vehicle.year, Vehicle.make, Vehicle.model, Vehicle.account_id)
+            .outerjoin(Account, Account.id == Vehicle.account_id)
+            .order_by(Vehicle.name)
+        )
+        vehicles = [
+            dict(row)
+            for row in session.execute(_scope_vehicle_query(query, account_id, owner_user_id)).mappings()
+        ]
+        vehicle_ids = [vehicle["id"] for vehicle in vehicles]
+        if not vehicle_ids:
+            return {"vehicles": [], "triggered_maintenance": {}}
+
+        mileage_map = _mileage_summary_by_vehicle(session, vehicle_ids)
+        future_by_vehicle = _active_future_by_vehicle(session, vehicle_ids)
+
+        triggered_maintenance: Dict[int, List[Dict[str, Any]]] = {}
+        for vehicle in vehicles:
+            vehicle["current_mileage"] = mileage_map[vehicle["id"]]["current_mileage"]
+            triggered_items = _evaluate_triggered_items(
+                future_by_vehicle.get(vehicle["id"], []), vehicle["current_mileage"]
+            )
+            if triggered_items:
+                triggered_maintenance[vehicle["id"]] = triggered_items
+
+        return {"vehicles": vehicles, "triggered_maintenance": triggered_maintenance}
+    except Exception as e:
+        print(f"Error loading notifications: {e}")
+        return {"vehicles": [], "triggered_maintenance": {}}
+    finally:
+        session.close()
+
+
+def get_vehicles_with_health_and_triggers(
+    account_id: Optional[str] = None, owner_user_id: str = DEFAULT_OWNER_ID
+) -> Dict[str, Any]:
+    """
+    Load the vehicles list page data in one session.
+
+    Replaces calling get_all_vehicles, get_vehicle_health_status and
+    get_all_vehicles_triggered_maintenance separately: vehicles (with their
+    records), current mileage and active reminders are fetched with one
+    account-scoped query each instead of per-vehicle lookups.
+
+    Returns a dict with:
+      - vehicles: list of Vehicle instances
+      - vehicle_health: list matching get_vehicle_health_status()
+      - triggered_maintenance: dict matching get_all_vehicles_triggered_maintenance()
+    """
+    session = SessionLocal()
+    try:
+        from sqlalchemy import union_all
+        from sqlalchemy.orm import selectinload
+        from models import FuelEntry
+
+        normalized_account_id = (
+            account_id if account_id and account_id.lower() not in ("all", "null") else None
+        )
+
+        query = (
+            select(Vehicle)
+            .options(
+                selectinload(Vehicle.account),
+                selectinload(Vehicle.maintenance_records),
+            )
+            .outerjoin(Account, Account.id == Vehicle.account_id)
+            .order_by(Vehicle.name)
+        )
+        if normalized_account_id:
+            query = query.where(
+                Vehicle.account_id == normalized_account_id,
+                or_(Account.owner_user_id == owner_user_id, Account.id.is_(None)),
+            )
+        else:
+            query = query.where(
+                or_(Account.owner_user_id == owner_user_id, Vehicle.account_id.is_(None))
+            )
+
+        vehicles = session.execute(query).scalars().all()
+        vehicle_ids = [vehicle.id for vehicle in vehicles]
+        if not vehicle_ids:
+            return {"vehicles": [], "vehicle_health": [], "triggered_maintenance": {}}
+
+        # Current mileage is the highest reading across maintenance and fuel entries
+        readings = union_all(
+            select(MaintenanceRecord.vehicle_id.label("vehicle_id"), MaintenanceRecord.mileage.label("mileage"))
+            .where(MaintenanceRecord.vehicle_id.in_(vehicle_ids)),
+            select(FuelEntry.vehicle_id.label("vehicle_id"), FuelEntry.mileage.label("mileage"))
+            .where(FuelEntry.vehicle_id.in_(vehicle_ids)),
+        ).subquery()
+        current_mileage_map = {
+            vehicle_id: mileage or 0
+            for vehicle_id, mileage in session.execute(
+                select(readings.c.vehicle_id, func.max(readings.c.mileage)).group_by(readings.c.vehicle_id)
+            ).all()
+        }
+
+        future_by_vehicle = _active_future_by_vehicle(session, vehicle_ids)
+
+        current_year = datetime.now().year
+        vehicle_health: List[Dict[str, Any]] = []
+        triggered_maintenance: Dict[int, List[Dict[str, Any]]] = {}
+        for vehicle in vehicles:
+            current_mileage = current_mileage_map.get(vehicle.id, 0)
+            vehicle_health.append(
+                _build_vehicle_health_entry(vehicle, list(vehicle.maintenance_records), current_mileage, current_year)
+            )
+            triggered_items = _evaluate_triggered_items(future_by_vehicle.get(vehicle.id, []), current_mileage)
+            if triggered_items:
+                triggered_maintenance[vehicle.id] = triggered_items
+
+        return {
+            "vehicles": vehicles,
+            "vehicle_health": vehicle_health,
+            "triggered_maintenance": triggered_maintenance,
+        }
+    except Exception as e:
+        print(f"Error loading vehicles with health and triggers: {e}")
+        return {"vehicles": [], "vehicle_health": [], "triggered_maintenance": {}}
+    finally:
+        session.close()
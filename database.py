@@ -47,6 +47,12 @@ def get_database_url():
 # Get the database URL
 DATABASE_URL = get_database_url()
 
+# Connection pool sizing (PostgreSQL). The app runs as a single uvicorn worker whose
+# sync DB work runs on a 40-thread pool, so the default 5 + 10 connections stalls under
+# bursts. Override when the database plan caps connections.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
 # Create engine with appropriate configuration
 if DATABASE_URL.startswith("postgresql"):
     # PostgreSQL (cloud) configuration - ensure psycopg driver is specified
@@ -62,6 +68,9 @@ if DATABASE_URL.startswith("postgresql"):
     engine = create_engine(
         psycopg_url,
         echo=False,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_use_lifo=True,   # Reuse the most recent connection so idle extras can time out
         pool_pre_ping=True,  # Better connection handling
         pool_recycle=300      # Recycle connections every 5 minutes
     )
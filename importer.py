@@ -2,8 +2,14 @@ import csv
 import re
 from io import StringIO
 from datetime import date, datetime
+from typing import Iterable, Union
 from dateutil import parser
+from sqlalchemy import delete, insert
 from sqlmodel import select
+from models import MaintenanceRecord
+
+# Rows per multi-row INSERT statement
+IMPORT_CHUNK_SIZE = 1000
 
 class ImportResult:
     """Result of CSV import operation"""
@@ -72,41 +78,14 @@ def _parse_cost_flexible(cost_str: str) -> float:
     except ValueError:
         return None
 
-def _check_duplicate_record(session, vehicle_id: int, date: date, mileage: int, description: str) -> bool:
-    """Check if a maintenance record already exists with the same key fields"""
-    from .models import MaintenanceRecord
-    
-    # Check for exact matches on key fields
-    existing = session.execute(
-        select(MaintenanceRecord).where(
-            MaintenanceRecord.vehicle_id == vehicle_id,
-            MaintenanceRecord.date == date,
-            MaintenanceRecord.mileage == mileage,
-            MaintenanceRecord.description == description
-        )
-    ).scalars().first()
-    
-    return existing is not None
-
-def _check_duplicate_record_no_date(session, vehicle_id: int, mileage: int, description: str) -> bool:
-    """Check if a maintenance record already exists with the same key fields (no date)"""
-    from .models import MaintenanceRecord
-    
-    # Check for exact matches on key fields
-    existing = session.execute(
-        select(MaintenanceRecord).where(
-            MaintenanceRecord.vehicle_id == vehicle_id,
-            MaintenanceRecord.mileage == mileage,
-            MaintenanceRecord.description == description
-        )
-    ).scalars().first()
-    
-    return existing is not None
-
-def import_csv(csv_content: bytes, vehicle_id: int, session, handle_duplicates: str = "skip") -> ImportResult:
+def import_csv(csv_content: Union[bytes, str, Iterable[str]], vehicle_id: int, session, handle_duplicates: str = "skip") -> ImportResult:
     result = ImportResult()
-    csv_file = StringIO(csv_content.decode('utf-8'))
-    reader = csv.DictReader(csv_file)
+    # Text streams (e.g. an open file) are parsed line by line instead of loaded whole
+    if isinstance(csv_content, bytes):
+        csv_content = csv_content.decode('utf-8')
+    if isinstance(csv_content, str):
+        csv_content = StringIO(csv_content)
+    reader = csv.DictReader(csv_content)
     
     fieldnames_lower = [col.lower() for col in reader.fieldnames]
     required_columns = ['description']  # Only description is absolutely required
@@ -133,6 +112,22 @@ def import_csv(csv_content: bytes, vehicle_id: int, session, handle_duplicates:
     # Placeholder date for records without dates
     PLACEHOLDER_DATE = date(1900, 1, 1)
     
+    # Load the vehicle's existing record keys once instead of querying per row.
+    # Each key points at its source: ("db", record_id) or ("row", index into rows).
+    dated_keys = {}
+    undated_keys = {}
+    existing = session.execute(
+        select(MaintenanceRecord.id, MaintenanceRecord.date, MaintenanceRecord.mileage, MaintenanceRecord.description)
+        .where(MaintenanceRecord.vehicle_id == vehicle_id)
+        .order_by(MaintenanceRecord.id)
+    ).all()
+    for record_id, record_date, record_mileage, record_description in existing:
+        dated_keys.setdefault((record_date, record_mileage, record_description), ("db", record_id))
+        undated_keys.setdefault((record_mileage, record_description), ("db", record_id))
+    
+    rows = []
+    replaced_ids = []
+    
     for row_num, row in enumerate(reader, start=2):
         result.total_rows += 1
         
@@ -162,22 +157,17 @@ def import_csv(csv_content: bytes, vehicle_id: int, session, handle_duplicates:
                 cost = _parse_cost_flexible(row[col_mapping['cost']])
             
             description = row[col_mapping['description']].strip()
-            is_duplicate = False
             
             # Use placeholder date if no valid date provided
             final_date = date_obj if date_obj else PLACEHOLDER_DATE
             is_estimated = not date_obj
             
             if date_obj:
-                is_duplicate = _check_duplicate_record(
-                    session, vehicle_id, date_obj, mileage, description
-                )
+                match = dated_keys.get((date_obj, mileage, description))
             else:
-                is_duplicate = _check_duplicate_record_no_date(
-                    session, vehicle_id, mileage, description
-                )
+                match = undated_keys.get((mileage, description))
             
-            if is_duplicate:
+            if match:
                 if handle_duplicates == "skip":
                     result.duplicate_rows += 1
                     date_str = date_obj.strftime('%m/%d/%Y') if date_obj else "No date (placeholder)"
@@ -186,44 +176,28 @@ def import_csv(csv_content: bytes, vehicle_id: int, session, handle_duplicates:
                     )
                     continue
                 elif handle_duplicates == "replace":
-                    from .models import MaintenanceRecord
-                    if date_obj:
-                        existing = session.execute(
-                            select(MaintenanceRecord).where(
-                                MaintenanceRecord.vehicle_id == vehicle_id,
-                                MaintenanceRecord.date == date_obj,
-                                MaintenanceRecord.mileage == mileage,
-                                MaintenanceRecord.description == description
-                            )
-                        ).scalars().first()
+                    source, ref = match
+                    if source == "db":
+                        replaced_ids.append(ref)
                     else:
-                        existing = session.execute(
-                            select(MaintenanceRecord).where(
-                                MaintenanceRecord.vehicle_id == vehicle_id,
-                                MaintenanceRecord.mileage == mileage,
-                                MaintenanceRecord.description == description
-                            )
-                        ).scalars().first()
-                    
-                    if existing:
-                        session.delete(existing)
-                        date_str = date_obj.strftime('%m/%d/%Y') if date_obj else "No date (placeholder)"
-                        result.skipped_details.append(
-                            f"Row {row_num}: Replaced existing record - {date_str} at {mileage:,} miles: {description}"
-                        )
-            
-            from .models import MaintenanceRecord
-            
-            maintenance_record = MaintenanceRecord(
-                vehicle_id=vehicle_id,
-                date=final_date,
-                mileage=mileage,
-                description=description,
-                cost=cost,
-                date_estimated=is_estimated
-            )
+                        rows[ref] = None
+                    date_str = date_obj.strftime('%m/%d/%Y') if date_obj else "No date (placeholder)"
+                    result.skipped_details.append(
+                        f"Row {row_num}: Replaced existing record - {date_str} at {mileage:,} miles: {description}"
+                    )
             
-            session.add(maintenance_record)
+            rows.append({
+                "vehicle_id": vehicle_id,
+                "date": final_date,
+                "mileage": mileage,
+                "description": description,
+                "cost": cost,
+                "date_estimated": is_estimated,
+            })
+            new_ref = ("row", len(rows) - 1)
+            dated_keys[(final_date, mileage, description)] = new_ref
+            if match or (mileage, description) not in undated_keys:
+                undated_keys[(mileage, description)] = new_ref
             result.imported_rows += 1
             
         except Exception as e:
@@ -231,5 +205,13 @@ def import_csv(csv_content: bytes, vehicle_id: int, session, handle_duplicates:
             result.skipped_details.append(f"Row {row_num}: Error processing row - {str(e)}")
             continue
     
+    if replaced_ids:
+        session.execute(delete(MaintenanceRecord).where(MaintenanceRecord.id.in_(replaced_ids)))
+    
+    # Multi-row INSERTs in fixed-size chunks instead of one ORM add per row
+    rows = [row for row in rows if row is not None]
+    for offset in range(0, len(rows), IMPORT_CHUNK_SIZE):
+        session.execute(insert(MaintenanceRecord), rows[offset:offset + IMPORT_CHUNK_SIZE])
+    
     session.commit()
     return result
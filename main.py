@@ -1,26 +1,50 @@
 # Standard library imports
+import asyncio
 import os
 import sys
 import csv
 import json
+import logging
 import re
+import hashlib
+import html
+import secrets
+import tempfile
+from collections import defaultdict
 from decimal import Decimal
-from datetime import date, datetime
-from typing import Optional, Dict, Any
+from datetime import date, datetime, timezone
+from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass
+from functools import partial
 from io import StringIO
-from urllib.parse import urlencode
-from itertools import zip_longest
+from pathlib import Path
+from urllib.parse import quote_plus, urlencode
+from itertools import pairwise, zip_longest
+from operator import itemgetter
 
 # Third-party imports
-from fastapi import FastAPI, Request, Depends, HTTPException, Form, UploadFile, File, Query
-from fastapi.responses import HTMLResponse, RedirectResponse, Response, FileResponse
+from fastapi import APIRouter, FastAPI, Request, Depends, HTTPException, Form, UploadFile, File, Query, BackgroundTasks
+from fastapi.responses import HTMLResponse, RedirectResponse, Response, FileResponse, StreamingResponse, JSONResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
 from fastapi.staticfiles import StaticFiles
+from starlette.background import BackgroundTask
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.datastructures import UploadFile as StarletteUploadFile
 from sqlmodel import Session, select
+from sqlalchemy import delete, text, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import selectinload
 from pydantic import BaseModel, Field, ConfigDict, ValidationError
 
-from schemas import MaintenanceCreate, TireMeta
+from schemas import FormDate, FutureMaintenanceIn, MaintenanceCreate, TireMeta
+from ttl_cache import MISS, TTLCache
+from config import Config
+
+logging.basicConfig(level=logging.DEBUG if Config.DEBUG else logging.INFO)
+logger = logging.getLogger(__name__)
 
 # Define dummy functions at module level to ensure they're always available
 def dummy_get_all_vehicles():
@@ -70,13 +94,13 @@ def dummy_sort_maintenance_records(*args, **kwargs):
 
 
 def _errors_dict(validation_error: ValidationError) -> Dict[str, str]:
-    errors: Dict[str, str] = {}
-    for item in validation_error.errors():
-        field = item.get("loc")[-1]
-        message = item.get("msg")
-        if isinstance(field, str) and isinstance(message, str):
-            errors.setdefault(field, message)
-    return errors
+    """Map each invalid field name to its first error message."""
+    # Walk the errors last-to-first so the first message seen for a field wins
+    return {
+        error["loc"][-1]: error["msg"]
+        for error in reversed(validation_error.errors())
+        if error["loc"] and isinstance(error["loc"][-1], str)
+    }
 
 # Initialize functions with dummy versions by default
 get_all_vehicles = dummy_get_all_vehicles
@@ -100,10 +124,105 @@ sort_maintenance_records = dummy_sort_maintenance_records
 # Limits
 MAX_TIRE_META_BYTES = 4096
 
+# Uploads
+UPLOAD_DIR = "uploads"
+UPLOAD_CHUNK_SIZE = 64 * 1024
+MAX_UPLOAD_BYTES = Config.MAX_FILE_SIZE_MB * 1024 * 1024
+# Two file fields per form plus room for the regular fields
+MAX_REQUEST_BYTES = 2 * MAX_UPLOAD_BYTES + 1024 * 1024
+# Multipart parser caps for the maintenance form (photo + oil analysis report)
+MAX_FORM_FILES = 2
+MAX_FORM_FIELDS = 64
+
+# PDF exports are built in a spooled file: in memory up to this size, on disk beyond it
+PDF_SPOOL_MAX_BYTES = 4 * 1024 * 1024
+
+
+def _upload_too_large() -> HTTPException:
+    return HTTPException(status_code=413, detail=f"File exceeds the {Config.MAX_FILE_SIZE_MB} MB upload limit.")
+
+
+def _copy_upload(source, destination_path: str) -> None:
+    written = 0
+    try:
+        with open(destination_path, "wb") as destination:
+            while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > MAX_UPLOAD_BYTES:
+                    raise _upload_too_large()
+                destination.write(chunk)
+    except HTTPException:
+        os.unlink(destination_path)
+        raise
+
+
+def _form_upload(form, field: str) -> Optional[StarletteUploadFile]:
+    """Return the uploaded file for a multipart field, or None if it was sent as plain text."""
+    value = form.get(field)
+    return value if isinstance(value, StarletteUploadFile) else None
+
+
+async def _save_upload(upload: Optional[UploadFile], prefix: str) -> Optional[str]:
+    """Copy an uploaded file into UPLOAD_DIR in fixed-size chunks and return its path."""
+    if not upload or not upload.filename:
+        return None
+    if upload.size is not None and upload.size > MAX_UPLOAD_BYTES:
+        raise _upload_too_large()
+    file_extension = os.path.splitext(upload.filename)[1]
+    file_path = os.path.join(UPLOAD_DIR, f"{prefix}_{secrets.token_hex(16)}{file_extension}")
+    await upload.seek(0)
+    # Blocking disk I/O runs in the threadpool so the event loop stays free
+    await run_in_threadpool(_copy_upload, upload.file, file_path)
+    return file_path
+
+# Upper bound on ids accepted by the "export selected vehicles" endpoints
+MAX_EXPORT_VEHICLE_IDS = 1000
+
+
+def _parse_vehicle_ids(vehicle_ids: Optional[str]) -> Optional[List[int]]:
+    """Parse a comma-separated vehicle id list once, rejecting malformed input with a 400."""
+    if not vehicle_ids:
+        return None
+    tokens = [token.strip() for token in vehicle_ids.split(",") if token.strip()]
+    if not tokens:
+        return None
+    if len(tokens) > MAX_EXPORT_VEHICLE_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_EXPORT_VEHICLE_IDS} vehicle ids can be exported at once.")
+    if not all(token.isdigit() for token in tokens):
+        raise HTTPException(status_code=400, detail="vehicle_ids must be a comma-separated list of vehicle ids.")
+    # Duplicates collapse while keeping the requested order
+    return list(dict.fromkeys(map(int, tokens)))
+
+
+async def _pdf_export_response(build, filename: str, **kwargs) -> StreamingResponse:
+    """Build a PDF into a spooled temp file in the threadpool and stream it back in chunks."""
+    buffer = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_BYTES)
+    try:
+        await run_in_threadpool(build, out=buffer, **kwargs)
+        buffer.seek(0)
+    except Exception:
+        buffer.close()
+        raise
+    return StreamingResponse(
+        iter(partial(buffer.read, UPLOAD_CHUNK_SIZE), b""),
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        background=BackgroundTask(buffer.close),
+    )
+
+async def _save_uploads(
+    oil_analysis_report: Optional[UploadFile], photo: Optional[UploadFile]
+) -> Tuple[Optional[str], Optional[str]]:
+    """Save the maintenance form's oil analysis report and photo concurrently."""
+    return tuple(await asyncio.gather(
+        _save_upload(oil_analysis_report, "oil_analysis"),
+        _save_upload(photo, "photo"),
+    ))
+
 # Simplified import system
 try:
     from database import engine, init_db, get_session, SessionLocal
-    from models import Vehicle, MaintenanceRecord
+    from models import Vehicle, MaintenanceRecord, FuelEntry
     from importer import import_csv, ImportResult
     from data_operations import (
         get_all_vehicles,
@@ -114,25 +233,41 @@ try:
         get_all_maintenance_records,
         get_maintenance_records_by_vehicle,
         get_maintenance_by_id,
+        has_existing_oil_analysis,
         create_maintenance_record,
         create_basic_maintenance_record,
         create_oil_analysis_record,
-        create_placeholder_oil_analysis,
         update_maintenance_record,
+        clear_oil_change_fields,
+        OIL_CHANGE_CLEARED_VALUES,
+        OIL_TYPE_RE,
         delete_maintenance_record,
         import_csv_data,
+        create_import_job,
+        run_import_job,
+        get_import_job,
         export_vehicles_csv,
         export_maintenance_csv,
         get_vehicle_names,
+        get_vehicle_summaries,
         get_maintenance_summary,
         get_home_dashboard_summary,
         get_current_mileage_from_all_sources,
         get_oil_change_interval_from_record,
         get_fuel_entries_for_vehicle,
         get_all_fuel_entries,
+        get_fuel_entries_for_vehicles,
+        get_latest_fuel_mileage,
+        create_fuel_entries,
+        sync_last_fuel_mileage,
+        iter_vehicles_csv,
+        iter_maintenance_csv,
+        export_vehicles_pdf as export_vehicles_pdf_func,
+        export_maintenance_pdf as export_maintenance_pdf_func,
         get_vehicle_health_status,
         sort_maintenance_records,
         get_all_vehicles_triggered_maintenance,
+        get_vehicles_with_health_and_triggers,
         get_accounts,
         get_account_by_id,
         get_account_by_name,
@@ -143,7 +278,23 @@ try:
         get_default_account,
         transfer_vehicle_to_account,
         get_account_vehicle_counts,
+        DEFAULT_OWNER_ID,
         get_all_future_maintenance,
+        get_future_maintenance_by_id,
+        create_future_maintenance,
+        mark_future_maintenance_completed,
+        get_vehicle_current_mileage,
+        update_future_maintenance,
+        get_future_maintenance_by_vehicle,
+        delete_future_maintenance,
+        get_notifications_bundle,
+        get_oil_status_for_all,
+        get_oil_management_records,
+        get_oil_analysis_records,
+        delete_oil_analysis_records,
+        invalidate_notifications_cache,
+        get_cached_notifications,
+        cache_notifications,
     )
     print("✅ Successfully imported all modules")
 except ImportError as e:
@@ -151,7 +302,7 @@ except ImportError as e:
     # Fallback for app package (for local development)
     try:
         from app.database import engine, init_db, get_session, SessionLocal
-        from app.models import Vehicle, MaintenanceRecord
+        from app.models import Vehicle, MaintenanceRecord, FuelEntry
         from app.importer import import_csv, ImportResult
         from app.data_operations import (
             get_all_vehicles,
@@ -162,25 +313,41 @@ except ImportError as e:
             get_all_maintenance_records,
             get_maintenance_records_by_vehicle,
             get_maintenance_by_id,
+            has_existing_oil_analysis,
             create_maintenance_record,
             create_basic_maintenance_record,
             create_oil_analysis_record,
-            create_placeholder_oil_analysis,
             update_maintenance_record,
+            clear_oil_change_fields,
+            OIL_CHANGE_CLEARED_VALUES,
+            OIL_TYPE_RE,
             delete_maintenance_record,
             import_csv_data,
+            create_import_job,
+            run_import_job,
+            get_import_job,
             export_vehicles_csv,
             export_maintenance_csv,
             get_vehicle_names,
+            get_vehicle_summaries,
             get_maintenance_summary,
             get_home_dashboard_summary,
             get_current_mileage_from_all_sources,
             get_oil_change_interval_from_record,
             get_fuel_entries_for_vehicle,
             get_all_fuel_entries,
+            get_fuel_entries_for_vehicles,
+            get_latest_fuel_mileage,
+            create_fuel_entries,
+            sync_last_fuel_mileage,
+            iter_vehicles_csv,
+            iter_maintenance_csv,
+            export_vehicles_pdf as export_vehicles_pdf_func,
+            export_maintenance_pdf as export_maintenance_pdf_func,
             get_vehicle_health_status,
             sort_maintenance_records,
             get_all_vehicles_triggered_maintenance,
+            get_vehicles_with_health_and_triggers,
             get_accounts,
             get_account_by_id,
             get_account_by_name,
@@ -191,7 +358,23 @@ except ImportError as e:
             get_default_account,
             transfer_vehicle_to_account,
             get_account_vehicle_counts,
+            DEFAULT_OWNER_ID,
             get_all_future_maintenance,
+            get_future_maintenance_by_id,
+            create_future_maintenance,
+            mark_future_maintenance_completed,
+            get_vehicle_current_mileage,
+            update_future_maintenance,
+            get_future_maintenance_by_vehicle,
+            delete_future_maintenance,
+            get_notifications_bundle,
+            get_oil_status_for_all,
+            get_oil_management_records,
+            get_oil_analysis_records,
+            delete_oil_analysis_records,
+            invalidate_notifications_cache,
+            get_cached_notifications,
+            cache_notifications,
         )
         print("✅ Successfully imported from app package")
     except ImportError as e2:
@@ -224,6 +407,18 @@ if os.getenv("ENV") == "development":
 
     app.add_middleware(LogRedirects)
 
+# Compress text responses (CSV exports, JSON APIs, pages) for clients that accept gzip;
+# streamed exports are compressed chunk by chunk
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
+@app.middleware("http")
+async def reject_oversized_requests(request: Request, call_next):
+    """Refuse bodies over the upload limit before any of the form is buffered."""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_REQUEST_BYTES:
+        return JSONResponse(status_code=413, content={"detail": "Request body too large."})
+    return await call_next(request)
+
 # Templates
 templates = Jinja2Templates(directory="./templates")
 
@@ -243,24 +438,120 @@ def zip_filter(a, b):
 
 templates.env.filters["zip"] = zip_filter
 
-# Static files
-if os.path.exists("static"):
-    app.mount("/static", StaticFiles(directory="static", check_dir=False), name="static")
+# Compiled templates are cached as bytecode across restarts; outside dev they never change on disk
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+templates.env.auto_reload = APP_IS_DEV
+
+_MAINTENANCE_FORM_TEMPLATE = templates.get_template("maintenance_form.html")
+_CLEANUP_OIL_ANALYSIS_TEMPLATE = templates.get_template("cleanup_oil_analysis.html")
+
+
+def render_maintenance_form(context: Dict[str, Any], status_code: int = 200) -> HTMLResponse:
+    """Render maintenance_form.html from the template loaded at import."""
+    template = templates.get_template("maintenance_form.html") if APP_IS_DEV else _MAINTENANCE_FORM_TEMPLATE
+    return HTMLResponse(template.render(context), status_code=status_code)
+
+# Static files (checked once at import; startup logging reuses the result)
+_STATIC_DIR = Path("static")
+_HAS_STATIC = _STATIC_DIR.is_dir()
+
+if _HAS_STATIC:
+    app.mount("/static", StaticFiles(directory=str(_STATIC_DIR), check_dir=False), name="static")
+
+# HTTP caching helpers: strong ETags let browsers revalidate with a bodiless 304
+_ICON_CACHE_CONTROL = "public, max-age=86400, immutable"
+
+
+def _compute_etag(content: bytes) -> str:
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _revalidated_json(request: Request, payload: Any, cache_control: str = "no-cache") -> Response:
+    """JSON response tagged with an ETag of its body; a matching If-None-Match gets a 304."""
+    response = ORJSONResponse(jsonable_encoder(payload))
+    etag = _compute_etag(response.body)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
+def _wants_json(request: Request) -> bool:
+    """True for fetch()/XHR callers that asked for JSON instead of a rendered page."""
+    return (
+        "application/json" in request.headers.get("accept", "")
+        or request.headers.get("x-requested-with") == "XMLHttpRequest"
+    )
+
+
+def _file_etag(path: Path) -> Optional[str]:
+    try:
+        return _compute_etag(path.read_bytes())
+    except OSError:
+        return None
+
+
+# Icons never change while the process runs, so hash them once at import
+_ICON_ETAGS = {
+    name: _file_etag(_STATIC_DIR / name)
+    for name in ("favicon.svg", "favicon.ico", "apple-touch-icon.png")
+}
+
+
+def _icon_response(request: Request, name: str) -> Response:
+    etag = _ICON_ETAGS.get(name)
+    if etag is None:
+        return FileResponse(_STATIC_DIR / name)
+    headers = {"ETag": etag, "Cache-Control": _ICON_CACHE_CONTROL}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(_STATIC_DIR / name, headers=headers)
 
 @app.get("/favicon.svg")
-async def favicon_svg():
-    return FileResponse("static/favicon.svg")
+async def favicon_svg(request: Request):
+    return _icon_response(request, "favicon.svg")
 
 @app.get("/favicon.ico")
-async def favicon_ico():
-    return FileResponse("static/favicon.ico")
+async def favicon_ico(request: Request):
+    return _icon_response(request, "favicon.ico")
 
 @app.get("/apple-touch-icon.png")
-async def apple_touch_icon():
-    return FileResponse("static/apple-touch-icon.png")
+async def apple_touch_icon(request: Request):
+    return _icon_response(request, "apple-touch-icon.png")
+
+
+# Account selector values that mean "no specific account"
+_SENTINEL_ACCOUNT_VALUES = frozenset({"", "all", "null", "none"})
+
+
+@dataclass(slots=True, frozen=True)
+class AccountContext:
+    """Account selection resolved for a single request."""
+    scope: str  # "all" or "single"
+    account: Optional[Any]  # Selected Account instance or None
+    account_id: Optional[str]
+    accounts: Tuple[Any, ...]  # All accounts for the owner
 
 
-def get_account_context(request: Request):
+def _match_account_value(raw_value: str, lookup) -> Tuple[bool, Optional[Any]]:
+    """Return (resolved, account) for one selection source; "all"-style values resolve to no account."""
+    value = raw_value.strip()
+    if value.lower() in _SENTINEL_ACCOUNT_VALUES:
+        return True, None
+    account = lookup(value)
+    return account is not None, account
+
+
+def get_account_context(request: Request) -> AccountContext:
     """
     Resolve the current account selection from the request.
 
@@ -269,59 +560,62 @@ def get_account_context(request: Request):
       2. Cookie `vmt.accountId` (account id) or legacy `selected_account` (name)
       3. Owner default account
 
-    Returns a dict with:
-      - scope: "all" or "single"
-      - account: Account instance or None
-      - account_id: selected account id or None
-      - accounts: list of all accounts for the owner
+    The result is cached on request.state for the rest of the request.
     """
     if hasattr(request.state, "account_context"):
         return request.state.account_context
 
-    selected_account = None
-    scope = "all"
+    # Sources in priority order; a value that matches no account falls through to the next
+    resolved, selected_account = False, None
+    value = request.query_params.get("accountId")
+    if value:
+        resolved, selected_account = _match_account_value(value, get_account_by_id)
+    if not resolved and (value := request.cookies.get("vmt.accountId")):
+        resolved, selected_account = _match_account_value(value, get_account_by_id)
+    if not resolved and (value := request.cookies.get("selected_account")):
+        resolved, selected_account = _match_account_value(value, get_account_by_name)
 
-    candidate_sources = [
-        ("id", request.query_params.get("accountId")),
-        ("id", request.cookies.get("vmt.accountId")),
-        ("name", request.cookies.get("selected_account")),
-    ]
+    if selected_account is None:
+        selected_account = get_default_account()
+    scope = "single" if selected_account else "all"
+
+    context = AccountContext(
+        scope=scope,
+        account=selected_account,
+        account_id=selected_account.id if selected_account else None,
+        accounts=tuple(get_accounts()),
+    )
+    request.state.account_context = context
+    return context
 
-    for source, raw_value in candidate_sources:
-        if not raw_value:
-            continue
 
-        value = raw_value.strip()
-        if value.lower() in ("", "all", "null", "none"):
-            scope = "all"
-            selected_account = None
-            break
+def get_request_vehicles(request: Request, account_id: Optional[str]):
+    """Return the account's vehicles, loading them at most once per request."""
+    cache = getattr(request.state, "vehicles_cache", None)
+    if cache is None:
+        cache = request.state.vehicles_cache = {}
+    if account_id not in cache:
+        cache[account_id] = get_all_vehicles(account_id=account_id)
+    return cache[account_id]
 
-        if source == "id":
-            account = get_account_by_id(value)
-        else:
-            account = get_account_by_name(value)
 
-        if account:
-            selected_account = account
-            scope = "single"
-            break
+def get_request_vehicle(request: Request, vehicle_id: int, account_id: Optional[str]):
+    """
+    Return one account-scoped vehicle, at most one lookup per request.
 
-    if selected_account is None:
-        default_account = get_default_account()
-        if default_account:
-            selected_account = default_account
-            scope = "single"
-
-    accounts = get_accounts()
-    context = {
-        "scope": scope,
-        "account": selected_account,
-        "account_id": selected_account.id if selected_account else None,
-        "accounts": accounts,
-    }
-    request.state.account_context = context
-    return context
+    Reuses the vehicle list when get_request_vehicles already loaded it (same
+    owner/account scoping as get_vehicle_by_id), otherwise memoizes the lookup.
+    """
+    loaded = getattr(request.state, "vehicles_cache", {}).get(account_id)
+    if loaded is not None:
+        return next((vehicle for vehicle in loaded if vehicle.id == vehicle_id), None)
+    lookups = getattr(request.state, "vehicle_lookups", None)
+    if lookups is None:
+        lookups = request.state.vehicle_lookups = {}
+    key = (vehicle_id, account_id)
+    if key not in lookups:
+        lookups[key] = get_vehicle_by_id(vehicle_id, account_id=account_id)
+    return lookups[key]
 
 
 def serialize_account(account, vehicle_count: int = 0, is_default: bool = False) -> Dict[str, Any]:
@@ -337,21 +631,39 @@ def serialize_account(account, vehicle_count: int = 0, is_default: bool = False)
     }
 
 
+# owner_user_id -> payload; account and vehicle writes clear it and the TTL bounds
+# staleness for writes made outside the request handlers
+_ACCOUNTS_PAYLOAD_TTL_SECONDS = 30
+_accounts_payload_cache = TTLCache(_ACCOUNTS_PAYLOAD_TTL_SECONDS)
+
+
+def invalidate_accounts_payload_cache() -> None:
+    """Drop cached accounts payloads; call after any account change or vehicle create/delete/transfer"""
+    _accounts_payload_cache.invalidate()
+
+
 def build_accounts_payload() -> Dict[str, Any]:
     """Return accounts data with counts and default information."""
-    accounts = get_accounts()
-    counts = get_account_vehicle_counts()
-    default_account = get_default_account()
-    default_id = default_account.id if default_account else None
+    payload, generation = _accounts_payload_cache.get(DEFAULT_OWNER_ID)
+    if payload is MISS:
+        accounts = get_accounts()
+        counts = get_account_vehicle_counts()
+        default_account = get_default_account()
+        default_id = default_account.id if default_account else None
 
-    serialized = [
-        serialize_account(account, counts.get(account.id, 0), is_default=(account.id == default_id))
-        for account in accounts
-    ]
+        payload = {
+            "accounts": [
+                serialize_account(account, counts.get(account.id, 0), is_default=(account.id == default_id))
+                for account in accounts
+            ],
+            "default_account_id": default_id,
+        }
+        _accounts_payload_cache.set(DEFAULT_OWNER_ID, payload, generation)
 
+    # Copies, so callers can't change the cached entries
     return {
-        "accounts": serialized,
-        "default_account_id": default_id,
+        "accounts": [dict(account) for account in payload["accounts"]],
+        "default_account_id": payload["default_account_id"],
     }
 
 
@@ -372,8 +684,21 @@ class VehicleTransferRequest(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class FuelEntryCreateRequest(BaseModel):
+    vehicle_id: int
+    date: FormDate
+    time: Optional[str] = Field(None, max_length=10)
+    mileage: int
+    fuel_amount: float
+    fuel_cost: float
+    fuel_type: str = Field(..., max_length=10)
+    driving_pattern: str = Field(..., max_length=20)
+    notes: Optional[str] = Field(None, max_length=500)
+    odometer_photo: Optional[str] = None
+
+
 def serialize_vehicle_for_api(vehicle: Vehicle) -> Dict[str, Any]:
-    """Serialize a vehicle object into a JSON-friendly dictionary."""
+    """Serialize a vehicle object into a dictionary orjson can encode directly."""
     account = getattr(vehicle, "account", None)
     return {
         "id": vehicle.id,
@@ -384,13 +709,16 @@ def serialize_vehicle_for_api(vehicle: Vehicle) -> Dict[str, Any]:
         "vin": vehicle.vin,
         "account_id": vehicle.account_id,
         "account_name": account.name if account else None,
-        "created_at": vehicle.created_at.isoformat() if getattr(vehicle, "created_at", None) else None,
-        "updated_at": vehicle.updated_at.isoformat() if getattr(vehicle, "updated_at", None) else None,
+        "created_at": getattr(vehicle, "created_at", None),
+        "updated_at": getattr(vehicle, "updated_at", None),
     }
 
 
 def serialize_maintenance_record(record: MaintenanceRecord) -> Dict[str, Any]:
-    """Serialize a maintenance record including its vehicle information."""
+    """Serialize a maintenance record including its vehicle information.
+
+    Dates stay date/datetime objects; orjson writes them as ISO strings.
+    """
     vehicle = getattr(record, "vehicle", None)
     account = getattr(vehicle, "account", None) if vehicle else None
     return {
@@ -399,39 +727,27 @@ def serialize_maintenance_record(record: MaintenanceRecord) -> Dict[str, Any]:
         "vehicle_name": vehicle.name if vehicle else None,
         "account_id": vehicle.account_id if vehicle else None,
         "account_name": account.name if account else None,
-        "date": record.date.isoformat() if record.date else None,
+        "date": record.date,
         "mileage": record.mileage,
         "description": record.description,
         "cost": record.cost,
-        "created_at": record.created_at.isoformat() if getattr(record, "created_at", None) else None,
-        "updated_at": record.updated_at.isoformat() if getattr(record, "updated_at", None) else None,
+        "created_at": getattr(record, "created_at", None),
+        "updated_at": getattr(record, "updated_at", None),
         "is_oil_change": getattr(record, "is_oil_change", False),
     }
 
 
-def serialize_fuel_entry_for_api(entry: Dict[str, Any]) -> Dict[str, Any]:
-    """Normalize fuel entry dictionaries returned from data operations."""
-    serialized = entry.copy()
-    for key in ("date", "created_at", "updated_at"):
-        value = serialized.get(key)
-        if value is not None and hasattr(value, "isoformat"):
-            serialized[key] = value.isoformat()
-        elif value is not None:
-            serialized[key] = str(value)
-    return serialized
-
-
 def resolve_account_filter(account_id: Optional[str], account_name: Optional[str]) -> Optional[str]:
     """Resolve account id or name query parameters to a canonical account id."""
     normalized_id = account_id.strip() if account_id else None
-    if normalized_id and normalized_id.lower() not in ("", "all", "null"):
+    if normalized_id and normalized_id.lower() not in _SENTINEL_ACCOUNT_VALUES:
         account = get_account_by_id(normalized_id)
         if not account:
             raise HTTPException(status_code=404, detail="Account not found.")
         return account.id
 
     normalized_name = account_name.strip() if account_name else None
-    if normalized_name and normalized_name.lower() not in ("", "all", "null"):
+    if normalized_name and normalized_name.lower() not in _SENTINEL_ACCOUNT_VALUES:
         account = get_account_by_name(normalized_name)
         if not account:
             raise HTTPException(status_code=404, detail="Account not found.")
@@ -445,10 +761,10 @@ async def startup_event():
     try:
         print("Starting Vehicle Maintenance Tracker...")
         print(f"Current working directory: {os.getcwd()}")
-        print(f"Templates directory exists: {os.path.exists('templates')}")
-        print(f"Static directory exists: {os.path.exists('static')}")
-        print(f"App directory exists: {os.path.exists('app')}")
-        print(f"App directory contents: {os.listdir('.') if os.path.exists('.') else 'No current dir'}")
+        print(f"Static directory exists: {_HAS_STATIC}")
+        
+        # Created once here so upload handlers can write without checking
+        os.makedirs(UPLOAD_DIR, exist_ok=True)
         
         init_db()
         
@@ -479,6 +795,22 @@ async def startup_event():
             except Exception as e:
                 print(f"⚠️ tire_meta migration error: {e}, but continuing startup...")
         
+        # Indexes added to existing tables after they were first created
+        try:
+            from migrate_maintenance_indexes import run as run_index_migration
+            print("Running maintenance index migration...")
+            run_index_migration()
+        except Exception as e:
+            print(f"⚠️ Maintenance index migration error: {e}, continuing startup...")
+        
+        # Stored last fuel mileage used by fuel entry gap detection
+        try:
+            from migrate_fuel_mileage import run as run_fuel_mileage_migration
+            print("Running last_fuel_mileage migration...")
+            run_fuel_mileage_migration()
+        except Exception as e:
+            print(f"⚠️ last_fuel_mileage migration error: {e}, continuing startup...")
+        
         # Ensure account and vehicle linkage migration runs for all environments
         try:
             from migrate_accounts import run_migration_with_existing_engine
@@ -497,12 +829,16 @@ async def startup_event():
         print(f"Startup warning (non-critical): {e}")
         # Don't crash the app on startup errors
 
+    # The oil management and cleanup queries read the generated oil analysis flag,
+    # so a database the deploy step hasn't migrated fails startup instead of every request
+    from migrate_oil_analysis_flag import ensure_applied as ensure_oil_analysis_flag
+    ensure_oil_analysis_flag()
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Home page with navigation and summary using centralized data operations"""
     try:
         # Get enhanced dashboard data using centralized function
-        from data_operations import get_home_dashboard_summary
         dashboard_data = get_home_dashboard_summary()
         
         return templates.TemplateResponse("index.html", {"request": request, "dashboard": dashboard_data})
@@ -540,10 +876,16 @@ async def migrate_photo_columns():
     except Exception as e:
         return {"success": False, "message": f"Migration error: {str(e)}"}
 
+_HEALTH_BODY = json.dumps({"status": "healthy", "message": "Vehicle Maintenance Tracker is running"}).encode()
+_HEALTH_ETAG = _compute_etag(_HEALTH_BODY)
+
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint for deployment platforms"""
-    return {"status": "healthy", "message": "Vehicle Maintenance Tracker is running"}
+    headers = {"ETag": _HEALTH_ETAG, "Cache-Control": "no-cache"}
+    if _etag_matches(request, _HEALTH_ETAG):
+        return Response(status_code=304, headers=headers)
+    return Response(content=_HEALTH_BODY, media_type="application/json", headers=headers)
 
 @app.get("/test")
 async def test_endpoint():
@@ -554,7 +896,6 @@ async def test_endpoint():
 async def test_dashboard():
     """Test endpoint to verify dashboard data is working"""
     try:
-        from data_operations import get_home_dashboard_summary
         dashboard_data = get_home_dashboard_summary()
         return {"success": True, "dashboard": dashboard_data}
     except Exception as e:
@@ -565,30 +906,16 @@ async def list_vehicles(request: Request):
     """List all vehicles using centralized data operations"""
     try:
         account_context = get_account_context(request)
-        account_id = account_context["account_id"] if account_context["scope"] != "all" else None
+        account_id = account_context.account_id if account_context.scope != "all" else None
 
-        vehicles = get_all_vehicles(account_id=account_id)
-        vehicle_health = get_vehicle_health_status(account_id=account_id)
-        triggered_maintenance = get_all_vehicles_triggered_maintenance(account_id=account_id)
-
-        if account_id:
-            allowed_vehicle_ids = {vehicle.id for vehicle in vehicles}
-            vehicle_health = [
-                status
-                for status in vehicle_health
-                if status.get("vehicle") and status["vehicle"].id in allowed_vehicle_ids
-            ]
-            triggered_maintenance = {
-                vehicle_id: items
-                for vehicle_id, items in triggered_maintenance.items()
-                if vehicle_id in allowed_vehicle_ids
-            }
+        # Vehicles, health and triggered reminders come from one account-scoped load
+        vehicles_data = get_vehicles_with_health_and_triggers(account_id=account_id)
 
         return templates.TemplateResponse("vehicles_list.html", {
             "request": request, 
-            "vehicles": vehicles, 
-            "vehicle_health": vehicle_health,
-            "triggered_maintenance": triggered_maintenance,
+            "vehicles": vehicles_data["vehicles"], 
+            "vehicle_health": vehicles_data["vehicle_health"],
+            "triggered_maintenance": vehicles_data["triggered_maintenance"],
             "account_context": account_context,
         })
     except Exception as e:
@@ -622,11 +949,11 @@ async def create_vehicle_route(
     """Create a new vehicle using centralized data operations"""
     try:
         account_context = get_account_context(request)
-        account = account_context.get("account")
+        account = account_context.account
         if account is None:
             account = get_default_account()
-        if account is None and account_context.get("accounts"):
-            account = account_context["accounts"][0]
+        if account is None and account_context.accounts:
+            account = account_context.accounts[0]
         if account is None:
             raise HTTPException(status_code=400, detail="No account available to assign this vehicle.")
 
@@ -638,6 +965,7 @@ async def create_vehicle_route(
         result = create_vehicle(name, make, model, year, vin, account_id=account.id)
         
         if result["success"]:
+            invalidate_accounts_payload_cache()
             return RedirectResponse(url=return_url or "/vehicles", status_code=303)
         else:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -654,8 +982,8 @@ async def edit_vehicle_form(
 ):
     """Form to edit existing vehicle"""
     account_context = get_account_context(request)
-    account_id = account_context["account_id"] if account_context["scope"] != "all" else None
-    vehicle = get_vehicle_by_id(vehicle_id, account_id=account_id)
+    account_id = account_context.account_id if account_context.scope != "all" else None
+    vehicle = get_request_vehicle(request, vehicle_id, account_id)
     if not vehicle:
         raise HTTPException(status_code=404, detail="Vehicle not found or inaccessible in this account.")
     
@@ -680,8 +1008,8 @@ async def update_vehicle_route(
     """Update an existing vehicle using centralized data operations"""
     try:
         account_context = get_account_context(request)
-        account_id = account_context["account_id"] if account_context["scope"] != "all" else None
-        vehicle = get_vehicle_by_id(vehicle_id, account_id=account_id)
+        account_id = account_context.account_id if account_context.scope != "all" else None
+        vehicle = get_request_vehicle(request, vehicle_id, account_id)
         if not vehicle:
             raise HTTPException(status_code=404, detail="Vehicle not found or inaccessible in this account.")
 
@@ -706,14 +1034,15 @@ async def delete_vehicle_route(request: Request, vehicle_id: int):
     """Delete a vehicle and all its maintenance records using centralized data operations"""
     try:
         account_context = get_account_context(request)
-        account_id = account_context["account_id"] if account_context["scope"] != "all" else None
-        vehicle = get_vehicle_by_id(vehicle_id, account_id=account_id)
+        account_id = account_context.account_id if account_context.scope != "all" else None
+        vehicle = get_request_vehicle(request, vehicle_id, account_id)
         if not vehicle:
             raise HTTPException(status_code=404, detail="Vehicle not found or inaccessible in this account.")
 
         result = delete_vehicle(vehicle_id)
         
         if result["success"]:
+            invalidate_accounts_payload_cache()
             return {"success": True, "message": "Vehicle deleted successfully"}
         else:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -730,9 +1059,9 @@ async def list_maintenance(
     """List maintenance records using centralized data operations"""
     try:
         account_context = get_account_context(request)
-        account_id = account_context["account_id"] if account_context["scope"] != "all" else None
+        account_id = account_context.account_id if account_context.scope != "all" else None
 
-        vehicles = get_all_vehicles(account_id=account_id)
+        vehicles = get_request_vehicles(request, account_id)
         allowed_vehicle_ids = {vehicle.id for vehicle in vehicles}
 
         vehicle = None
@@ -741,7 +1070,7 @@ async def list_maintenance(
         if vehicle_id:
             if allowed_vehicle_ids and vehicle_id not in allowed_vehicle_ids:
                 raise HTTPException(status_code=404, detail="Vehicle not found in this account.")
-            vehicle = get_vehicle_by_id(vehicle_id, account_id=account_id)
+            vehicle = get_request_vehicle(request, vehicle_id, account_id)
             if not vehicle:
                 raise HTTPException(status_code=404, detail="Vehicle not found or inaccessible in this account.")
             vehicle_name = vehicle.name
@@ -784,6 +1113,15 @@ async def list_maintenance(
     except Exception as e:
         return HTMLResponse(content=f"<h1>Error</h1><p>{str(e)}</p>")
 
+def oil_management_add_url(vehicle_param: Any, account_param: Any) -> str:
+    """Build the Oil Management add-oil URL, keeping vehicle/account selection."""
+    url = "/oil-management?open=add-oil"
+    if vehicle_param:
+        url += f"&vehicleId={quote_plus(str(vehicle_param))}"
+    if account_param:
+        url += f"&accountId={quote_plus(str(account_param))}"
+    return url
+
 @app.get("/maintenance/new", response_class=HTMLResponse)
 async def new_maintenance_form(
     request: Request, 
@@ -794,9 +1132,9 @@ async def new_maintenance_form(
 ):
     """Unified form handler for creating new maintenance, oil changes, and oil analysis"""
     account_context = get_account_context(request)
-    account_id = account_context["account_id"] if account_context["scope"] != "all" else None
+    account_id = account_context.account_id if account_context.scope != "all" else None
     incoming_params = dict(request.query_params)
-    vehicles_for_account = get_all_vehicles(account_id=account_id)
+    vehicles_for_account = get_request_vehicles(request, account_id)
     vehicle_options = [{"id": v.id, "name": v.name} for v in vehicles_for_account]
     allowed_vehicle_ids = {v.id for v in vehicles_for_account}
     
@@ -804,32 +1142,22 @@ async def new_maintenance_form(
     detected_form_type = determine_form_type(None, return_url, form_type)
 
     if detected_form_type == "oil_change":
-        params = [("open", "add-oil")]
-
         vehicle_param = (
             vehicle_id
             or incoming_params.get("vehicleId")
             or incoming_params.get("vehicle_id")
         )
-        if vehicle_param:
-            params.append(("vehicleId", str(vehicle_param)))
-
         account_param = (
             incoming_params.get("accountId")
             or incoming_params.get("account_id")
-            or (account_context["account_id"] if account_context["scope"] != "all" else None)
+            or (account_context.account_id if account_context.scope != "all" else None)
         )
-        if account_param:
-            params.append(("accountId", str(account_param)))
-
-        query_string = urlencode(params)
-        return RedirectResponse(url=f"/oil-management?{query_string}", status_code=303)
+        return RedirectResponse(url=oil_management_add_url(vehicle_param, account_param), status_code=303)
     
     # Pre-populate data from future maintenance if provided
     pre_populated_data = None
     if future_maintenance_id:
         try:
-            from data_operations import get_future_maintenance_by_id
             future_maintenance = get_future_maintenance_by_id(future_maintenance_id)
             if future_maintenance and (
                 not allowed_vehicle_ids or future_maintenance.vehicle_id in allowed_vehicle_ids
@@ -850,7 +1178,7 @@ async def new_maintenance_form(
     if vehicle_id and allowed_vehicle_ids and vehicle_id not in allowed_vehicle_ids:
         raise HTTPException(status_code=404, detail="Vehicle not found in this account.")
 
-    return templates.TemplateResponse("maintenance_form.html", {
+    return render_maintenance_form({
         "request": request, 
         "vehicles": vehicle_options, 
         "record": None,
@@ -865,15 +1193,70 @@ async def new_maintenance_form(
         "account_context": account_context,
     })
 
+_TIRE_POSITIONS = (("fl", "FL"), ("fr", "FR"), ("rl", "RL"), ("rr", "RR"))
+
+# Form fields handled by the route itself rather than MaintenanceCreate
+_PAYLOAD_EXTRAS = frozenset((
+    "service_type",
+    "rotation_pattern",
+    "description_notes",
+    "create_future_maintenance",
+    "tr_target_mileage",
+    "tr_target_date",
+    "tire_depths_json",
+))
+
+# Tire rotation pattern form values -> description label / TireMeta.pattern value
+_ROTATION_PATTERN_LABELS = {
+    "front_to_rear": "Front to Rear",
+    "cross": "Cross",
+    "five_tire": "5-Tire Rotation",
+    "custom": "Custom",
+}
+_ROTATION_PATTERN_SCHEMA = {
+    "front_to_rear": "front-to-rear",
+    "cross": "cross",
+    "five_tire": "five-tire",
+    "custom": "custom",
+}
+
+_CONTROL_WHITESPACE_RE = re.compile(r"[\r\n\t]+")
+
+
+def _clean_fragment(value: Optional[str]) -> Optional[str]:
+    """Collapse line breaks/tabs to spaces and strip; empty results become None."""
+    if value is None:
+        return None
+    if "\r" in value or "\n" in value or "\t" in value:
+        value = _CONTROL_WHITESPACE_RE.sub(" ", value)
+    return value.strip() or None
+
+
+def _summarize_tire_meta(meta: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Format tread depths as "FL 8/7/8; FR ..." for the maintenance description."""
+    if not isinstance(meta, dict):
+        return None
+    segments = []
+    for code, label in _TIRE_POSITIONS:
+        section = meta.get(code)
+        if not isinstance(section, dict):
+            continue
+        depths = (section.get("i"), section.get("m"), section.get("o"))
+        if depths == (None, None, None):
+            continue
+        display = "/".join(str(int(depth)) if isinstance(depth, (int, float)) else "—" for depth in depths)
+        segments.append(f"{label} {display}")
+    return "; ".join(segments) or None
+
 @app.post("/maintenance")
-async def create_maintenance_route(
-    request: Request,
-    oil_analysis_report: UploadFile = File(None),
-    photo: UploadFile = File(None),
-):
+async def create_maintenance_route(request: Request):
     """Create a new maintenance record using centralized data operations."""
+    # Parsed here rather than via File() params so the multipart limits apply;
+    # exceeding them raises a 400 before any handler work
+    form = await request.form(max_files=MAX_FORM_FILES, max_fields=MAX_FORM_FIELDS)
+    oil_analysis_report = _form_upload(form, "oil_analysis_report")
+    photo = _form_upload(form, "photo")
     try:
-        form = await request.form()
         data = dict(form)
 
         service_type = data.get("service_type")
@@ -884,41 +1267,16 @@ async def create_maintenance_route(
         target_date_raw = data.get("tr_target_date")
         raw_tire_json = data.get("tire_depths_json")
 
-        payload_extras = {
-            "service_type",
-            "rotation_pattern",
-            "description_notes",
-            "create_future_maintenance",
-            "tr_target_mileage",
-            "tr_target_date",
-            "tire_depths_json",
-        }
-        payload_input = {key: value for key, value in data.items() if key not in payload_extras}
-
-        pattern_labels = {
-            "front_to_rear": "Front to Rear",
-            "cross": "Cross",
-            "five_tire": "5-Tire Rotation",
-            "custom": "Custom",
-        }
-        pattern_label = pattern_labels.get(rotation_pattern, rotation_pattern if rotation_pattern else "")
-
-        pattern_schema_map = {
-            "front_to_rear": "front-to-rear",
-            "cross": "cross",
-            "five_tire": "five-tire",
-            "custom": "custom",
-        }
-        pattern_schema_value = None
-        if rotation_pattern:
-            pattern_schema_value = pattern_schema_map.get(rotation_pattern, "unknown")
+        payload_input = {key: value for key, value in data.items() if key not in _PAYLOAD_EXTRAS}
 
         account_context = get_account_context(request)
-        account_id = account_context["account_id"] if account_context["scope"] != "all" else None
-        vehicles_for_account = get_all_vehicles(account_id=account_id)
-        vehicle_options = [{"id": v.id, "name": v.name} for v in vehicles_for_account]
+        account_id = account_context.account_id if account_context.scope != "all" else None
 
         def render_with_errors(errors: Dict[str, str]):
+            if _wants_json(request):
+                return JSONResponse({"errors": errors}, status_code=422)
+            # Vehicle options are only needed when re-rendering the form
+            vehicle_options = [{"id": v.id, "name": v.name} for v in get_request_vehicles(request, account_id)]
             detected_form_type = determine_form_type(
                 None,
                 data.get("return_url"),
@@ -944,138 +1302,77 @@ async def create_maintenance_route(
                 "form": data,
                 "errors": errors,
             }
-            return templates.TemplateResponse("maintenance_form.html", context, status_code=422)
-
-        if raw_tire_json and len(raw_tire_json.encode("utf-8")) > MAX_TIRE_META_BYTES:
-            return render_with_errors({"tire_depths_json": "Tire tread data is too large."})
+            return render_maintenance_form(context, status_code=422)
 
+        # Tread data, pattern and reminder fields only matter for tire rotations
+        is_rotation = service_type == "tire_rotation"
+        pattern_label = ""
         tire_meta = None
-        tire_meta_model: Optional[TireMeta] = None
-        if raw_tire_json:
-            try:
-                parsed_meta = json.loads(raw_tire_json)
-                if not isinstance(parsed_meta, dict):
-                    raise ValueError("Tire data must be an object.")
-
-                meta_payload: Dict[str, Any] = {
-                    key: parsed_meta.get(key)
-                    for key in ("fl", "fr", "rl", "rr")
-                    if key in parsed_meta
-                }
-                if pattern_schema_value:
-                    meta_payload["pattern"] = pattern_schema_value
-
-                tire_meta_model = TireMeta.model_validate(meta_payload)
-                if tire_meta_model.has_measurements():
-                    if tire_meta_model.measured_at is None:
-                        tire_meta_model = tire_meta_model.model_copy(update={"measured_at": datetime.utcnow()})
-                    tire_meta = tire_meta_model.model_dump(exclude_none=True)
-                else:
-                    tire_meta_model = None
-            except ValidationError as exc:
-                error_messages = "; ".join(
-                    {err.get("msg", "Invalid tire depth values") for err in exc.errors()}
-                )
-                return render_with_errors({"tire_depths_json": error_messages})
-            except Exception as exc:  # noqa: BLE001
-                print(f"⚠️ invalid tire_depths_json: {exc}")
-                return render_with_errors({"tire_depths_json": "Unable to read tire tread data."})
-
-        create_future_flag = isinstance(create_future_raw, str) and create_future_raw.strip().lower() == "true"
+        create_future_flag = False
         target_mileage = None
-        if target_mileage_raw not in (None, "", "None"):
-            try:
-                target_mileage = int(str(target_mileage_raw).replace(",", ""))
-            except (TypeError, ValueError):
+        target_date = None
+        if is_rotation:
+            pattern_label = _ROTATION_PATTERN_LABELS.get(rotation_pattern, rotation_pattern if rotation_pattern else "")
+            pattern_schema_value = None
+            if rotation_pattern:
+                pattern_schema_value = _ROTATION_PATTERN_SCHEMA.get(rotation_pattern, "unknown")
+
+            if raw_tire_json and len(raw_tire_json.encode("utf-8")) > MAX_TIRE_META_BYTES:
+                return render_with_errors({"tire_depths_json": "Tire tread data is too large."})
+
+            if raw_tire_json:
+                try:
+                    # Parse and validate in one pass straight from the JSON string
+                    tire_meta_model = TireMeta.model_validate_json(raw_tire_json)
+                    if pattern_schema_value:
+                        tire_meta_model = tire_meta_model.model_copy(update={"pattern": pattern_schema_value})
+                    if tire_meta_model.has_measurements():
+                        if tire_meta_model.measured_at is None:
+                            tire_meta_model = tire_meta_model.model_copy(update={"measured_at": datetime.now(timezone.utc)})
+                        tire_meta = tire_meta_model.model_dump(exclude_none=True)
+                except ValidationError as exc:
+                    error_messages = "; ".join(
+                        {err.get("msg", "Invalid tire depth values") for err in exc.errors()}
+                    )
+                    return render_with_errors({"tire_depths_json": error_messages})
+                except Exception as exc:  # noqa: BLE001
+                    print(f"⚠️ invalid tire_depths_json: {exc}")
+                    return render_with_errors({"tire_depths_json": "Unable to read tire tread data."})
+
+            create_future_flag = isinstance(create_future_raw, str) and create_future_raw.strip().lower() == "true"
+            if target_mileage_raw not in (None, "", "None"):
                 try:
-                    target_mileage = int(float(target_mileage_raw))
+                    target_mileage = int(str(target_mileage_raw).replace(",", ""))
                 except (TypeError, ValueError):
-                    print(f"⚠️ invalid tire rotation target mileage: {target_mileage_raw}")
-                    target_mileage = None
+                    try:
+                        target_mileage = int(float(target_mileage_raw))
+                    except (TypeError, ValueError):
+                        print(f"⚠️ invalid tire rotation target mileage: {target_mileage_raw}")
+                        target_mileage = None
 
-        target_date = target_date_raw.strip() if isinstance(target_date_raw, str) and target_date_raw.strip() else None
-        if isinstance(notes_value, str):
-            notes_value = notes_value.strip()
-            if not notes_value:
-                notes_value = None
+            target_date = target_date_raw.strip() if isinstance(target_date_raw, str) and target_date_raw.strip() else None
+            if isinstance(notes_value, str):
+                notes_value = notes_value.strip()
+                if not notes_value:
+                    notes_value = None
 
         try:
             payload = MaintenanceCreate(**payload_input)
         except ValidationError as exc:
             return render_with_errors(_errors_dict(exc))
 
-        vehicle = get_vehicle_by_id(payload.vehicle_id, account_id=account_id)
+        vehicle = get_request_vehicle(request, payload.vehicle_id, account_id)
         if not vehicle:
             raise HTTPException(status_code=404, detail="Vehicle not found or inaccessible in this account.")
 
-        if payload.future_maintenance_id:
-            from data_operations import get_future_maintenance_by_id
-
-            future_record = get_future_maintenance_by_id(payload.future_maintenance_id)
-            if not future_record or future_record.vehicle_id != payload.vehicle_id:
-                raise HTTPException(status_code=404, detail="Future maintenance not found for this vehicle.")
-
-        pdf_file_path = None
-        if oil_analysis_report and oil_analysis_report.filename:
-            upload_dir = "uploads"
-            os.makedirs(upload_dir, exist_ok=True)
-            import uuid
-
-            file_extension = os.path.splitext(oil_analysis_report.filename)[1]
-            unique_filename = f"oil_analysis_{uuid.uuid4().hex}{file_extension}"
-            pdf_file_path = os.path.join(upload_dir, unique_filename)
-            with open(pdf_file_path, "wb") as buffer:
-                buffer.write(await oil_analysis_report.read())
-
-        photo_path = None
-        if photo and photo.filename:
-            upload_dir = "uploads"
-            os.makedirs(upload_dir, exist_ok=True)
-            import uuid
-
-            file_extension = os.path.splitext(photo.filename)[1]
-            unique_filename = f"photo_{uuid.uuid4().hex}{file_extension}"
-            photo_path = os.path.join(upload_dir, unique_filename)
-            with open(photo_path, "wb") as buffer:
-                buffer.write(await photo.read())
+        pdf_file_path, photo_path = await _save_uploads(oil_analysis_report, photo)
 
         def dec_to_float(value: Optional[Decimal]) -> Optional[float]:
             return float(value) if value is not None else None
 
-        def clean_fragment(value: Optional[str]) -> Optional[str]:
-            if value is None:
-                return None
-            cleaned = re.sub(r"[\r\n\t]+", " ", value)
-            cleaned = cleaned.strip()
-            return cleaned or None
-
-        def summarize_tire_meta(meta: Optional[Dict[str, Any]]) -> Optional[str]:
-            if not isinstance(meta, dict):
-                return None
-            segments = []
-            order = (("fl", "FL"), ("fr", "FR"), ("rl", "RL"), ("rr", "RR"))
-            for code, label in order:
-                section = meta.get(code)
-                if not isinstance(section, dict):
-                    continue
-                depths = [section.get(key) for key in ("i", "m", "o")]
-                if not any(depth is not None for depth in depths):
-                    continue
-                display_values = []
-                for depth in depths:
-                    if depth is None:
-                        display_values.append("—")
-                    else:
-                        try:
-                            display_values.append(str(int(depth)))
-                        except (TypeError, ValueError):
-                            display_values.append("—")
-                segments.append(f"{label} {'/'.join(display_values)}")
-            return "; ".join(segments) if segments else None
-
-        notes_value = clean_fragment(notes_value)
-        description_for_record = clean_fragment(payload.description)
-        if service_type == "tire_rotation":
+        description_for_record = _clean_fragment(payload.description)
+        if is_rotation:
+            notes_value = _clean_fragment(notes_value)
             description_parts = ["Tire Rotation"]
             if pattern_label:
                 description_parts.append(f"Pattern: {pattern_label}")
@@ -1083,8 +1380,8 @@ async def create_maintenance_route(
                 description_parts.append(f"{payload.mileage:,} mi")
             if notes_value:
                 description_parts.append(f"Notes: {notes_value}")
-            description_for_record = clean_fragment(" · ".join(description_parts))
-            tread_summary = summarize_tire_meta(tire_meta)
+            description_for_record = _clean_fragment(" · ".join(description_parts))
+            tread_summary = _summarize_tire_meta(tire_meta)
             if tread_summary:
                 description_for_record = f"{description_for_record} | Tread (I/M/O): {tread_summary}"
 
@@ -1095,14 +1392,32 @@ async def create_maintenance_route(
         date_str = payload.date_str or "01/01/1900"
         cost_value = float(payload.cost) if payload.cost is not None else 0.0
 
+        is_oil_change_flag = bool(payload.is_oil_change)
+        # Any oil detail marks the record as an oil change, saved in the same insert
+        is_oil_record = bool(is_oil_change_flag or payload.oil_type or payload.oil_brand)
+        # The 3000 mile default is only stored; a reminder is scheduled only for an
+        # oil change with an interval entered (the form's help text promises as much)
+        oil_change_interval = payload.oil_change_interval
+        if is_oil_record:
+            oil_change_interval = oil_change_interval or 3000
+        reminder_interval = payload.oil_change_interval if is_oil_change_flag else None
+
         result = create_maintenance_record(
             vehicle_id=payload.vehicle_id,
             date=date_str,
             description=payload_description,
             cost=cost_value,
             mileage=payload.mileage,
-            oil_change_interval=payload.oil_change_interval,
-            is_oil_change=payload.is_oil_change,
+            oil_change_interval=oil_change_interval,
+            is_oil_change=is_oil_record,
+            oil_change_reminder_interval=reminder_interval,
+            oil_type=payload.oil_type,
+            oil_brand=payload.oil_brand,
+            oil_filter_brand=payload.oil_filter_brand,
+            oil_filter_part_number=payload.oil_filter_part_number,
+            oil_cost=dec_to_float(payload.oil_cost),
+            filter_cost=dec_to_float(payload.filter_cost),
+            labor_cost=dec_to_float(payload.labor_cost),
             oil_analysis_date=payload.oil_analysis_date,
             next_oil_analysis_date=payload.next_oil_analysis_date,
             oil_analysis_cost=dec_to_float(payload.oil_analysis_cost),
@@ -1119,13 +1434,18 @@ async def create_maintenance_route(
             photo_path=photo_path,
             photo_description=payload.photo_description,
             tire_meta=tire_meta,
+            future_maintenance_id=payload.future_maintenance_id,
+            # The linked placeholder analysis is written in the same transaction as the record
+            placeholder_analysis_description=(
+                (f"Oil analysis for {payload_description}" if payload_description else "Oil analysis")
+                if payload.link_oil_analysis
+                else None
+            ),
         )
 
-        if result["success"] and service_type == "tire_rotation":
+        if result["success"] and is_rotation:
             try:
                 if create_future_flag and (target_mileage is not None or target_date):
-                    from data_operations import create_future_maintenance
-
                     fm_payload = {
                         "vehicle_id": payload.vehicle_id,
                         "maintenance_type": "Tire Rotation",
@@ -1139,128 +1459,25 @@ async def create_maintenance_route(
             except Exception as exc:  # noqa: BLE001
                 print("Failed to create future tire rotation reminder", exc)
 
-        is_oil_change_flag = bool(payload.is_oil_change)
-        oil_type = payload.oil_type
-        oil_brand = payload.oil_brand
-
-        if result["success"] and (is_oil_change_flag or oil_type or oil_brand):
-            try:
-                from data_operations import update_maintenance_record
-
-                update_result = update_maintenance_record(
-                    record_id=result["record"].id,
-                    vehicle_id=payload.vehicle_id,
-                    date=date_str,
-                    description=payload_description,
-                    cost=cost_value,
-                    mileage=payload.mileage,
-                    oil_change_interval=payload.oil_change_interval or 3000,
-                    is_oil_change=True,
-                    oil_type=payload.oil_type,
-                    oil_brand=payload.oil_brand,
-                    oil_filter_brand=payload.oil_filter_brand,
-                    oil_filter_part_number=payload.oil_filter_part_number,
-                    oil_cost=dec_to_float(payload.oil_cost),
-                    filter_cost=dec_to_float(payload.filter_cost),
-                    labor_cost=dec_to_float(payload.labor_cost),
-                )
-                if not update_result["success"]:
-                    print(f"Warning: Failed to update oil change fields: {update_result.get('error', 'Unknown error')}")
-            except Exception as exc:  # noqa: BLE001
-                print(f"Warning: Exception updating oil change fields: {exc}")
-
         if not result["success"]:
-            raise HTTPException(status_code=400, detail=result["error"])
-
-        if payload.link_oil_analysis:
-            try:
-                oil_analysis_result = create_placeholder_oil_analysis(
-                    payload.vehicle_id,
-                    date_str,
-                    f"Oil analysis for {payload_description}" if payload_description else "Oil analysis",
-                    payload.mileage,
-                    result["record"].id,
-                )
-                if not oil_analysis_result.get("success"):
-                    print(f"Failed to create placeholder oil analysis: {oil_analysis_result.get('error')}")
-            except Exception as exc:  # noqa: BLE001
-                print(f"Error creating placeholder oil analysis: {exc}")
-
-        if payload.future_maintenance_id:
-            try:
-                from data_operations import mark_future_maintenance_completed
-
-                mark_future_maintenance_completed(payload.future_maintenance_id)
-            except Exception as exc:  # noqa: BLE001
-                print(f"Error marking future maintenance as completed: {exc}")
-
-        # Additional oil analysis linking
-        if is_oil_change_flag:
-            from data_operations import get_maintenance_records_by_vehicle
-
-            vehicle_records = get_maintenance_records_by_vehicle(payload.vehicle_id)
-            if payload.link_oil_analysis:
-                existing_analysis = [
-                    record
-                    for record in vehicle_records
-                    if record.mileage == payload.mileage
-                    and (
-                        record.oil_analysis_date
-                        or record.oil_analysis_cost
-                        or record.iron_level
-                        or record.aluminum_level
-                        or record.copper_level
-                        or (record.description and "analysis" in record.description.lower())
-                    )
-                ]
-                if not existing_analysis:
-                    try:
-                        from data_operations import create_maintenance_record as create_maintenance_record_fn
-
-                        create_maintenance_record_fn(
-                            vehicle_id=payload.vehicle_id,
-                            date=date_str,  # Same date as oil change
-                            description=(
-                                f"Oil Analysis - {payload.mileage:,} miles"
-                                if payload.mileage is not None
-                                else "Oil Analysis"
-                            ),
-                            cost=0.0,  # Analysis cost separate from oil change cost
-                            mileage=payload.mileage,  # Same mileage as oil change - this creates the link!
-                            is_oil_change=False,  # This is an analysis record, not an oil change
-                            # Set as analysis record with oil change data for reference
-                            oil_analysis_date=date_str,  # Mark as analysis record
-                            oil_type=payload.oil_type,  # Copy oil change data
-                            oil_brand=payload.oil_brand,
-                            oil_filter_brand=payload.oil_filter_brand,
-                            oil_filter_part_number=payload.oil_filter_part_number,
-                            oil_cost=dec_to_float(payload.oil_cost),
-                            filter_cost=dec_to_float(payload.filter_cost),
-                            labor_cost=dec_to_float(payload.labor_cost),
-                        )
-                    except Exception as exc:  # noqa: BLE001
-                        print(f"Error creating oil analysis: {exc}")
-                else:
-                    if payload.mileage is not None:
-                        print(f"Oil analysis already exists at {payload.mileage:,} miles")
-                    else:
-                        print("Oil analysis already exists for this entry")
-
-        analysis_fields = [
-            payload.oil_analysis_date,
-            payload.next_oil_analysis_date,
-            payload.oil_analysis_cost,
-            payload.iron_level,
-            payload.aluminum_level,
-            payload.copper_level,
-            payload.viscosity,
-            payload.tbn,
-            payload.fuel_dilution,
-            payload.coolant_contamination,
-            payload.driving_conditions,
-            payload.oil_consumption_notes,
-        ]
-        if any(field is not None for field in analysis_fields):
+            raise HTTPException(status_code=404 if result.get("not_found") else 400, detail=result["error"])
+
+        # Any oil analysis detail means this was an analysis entry; stops at the first one set
+        is_oil_analysis_entry = (
+            payload.oil_analysis_date is not None
+            or payload.next_oil_analysis_date is not None
+            or payload.oil_analysis_cost is not None
+            or payload.iron_level is not None
+            or payload.aluminum_level is not None
+            or payload.copper_level is not None
+            or payload.viscosity is not None
+            or payload.tbn is not None
+            or payload.fuel_dilution is not None
+            or payload.coolant_contamination is not None
+            or payload.driving_conditions is not None
+            or payload.oil_consumption_notes is not None
+        )
+        if is_oil_analysis_entry:
             return RedirectResponse(url="/oil-management", status_code=303)
 
         return RedirectResponse(url=(payload.return_url or "/maintenance"), status_code=303)
@@ -1271,6 +1488,18 @@ async def create_maintenance_route(
         print(f"❌ Error creating maintenance record: {exc}")
         raise HTTPException(status_code=500, detail=f"Failed to create maintenance record: {str(exc)}")
 
+# Descriptions mentioning any of these are not oil changes, even if flagged as one
+_NON_OIL_KEYWORDS = (
+    'fuel filter', 'air filter', 'brake', 'tire', 'battery', 'spark plug', 'belt', 'hose', 'gasket',
+    'sensor', 'pump', 'alternator', 'starter', 'transmission', 'clutch', 'suspension', 'exhaust',
+    'coolant', 'thermostat', 'radiator', 'water pump',
+)
+_NON_OIL_RE = re.compile("|".join(map(re.escape, _NON_OIL_KEYWORDS)), re.IGNORECASE)
+_ANALYSIS_RE = re.compile("analysis", re.IGNORECASE)
+# Descriptions that mark a record as an oil change even when the flag is unset
+_OIL_CHANGE_KEYWORDS = ('oil change', 'oil/filter', 'oil & filter', 'oil and filter', 'oil+filter')
+_OIL_CHANGE_RE = re.compile("|".join(map(re.escape, _OIL_CHANGE_KEYWORDS)), re.IGNORECASE)
+
 def determine_form_type(record=None, return_url=None, form_type_param=None):
     """Unified function to determine what type of form to display"""
     
@@ -1280,22 +1509,19 @@ def determine_form_type(record=None, return_url=None, form_type_param=None):
     
     # 2. Check if editing existing record - analyze record data
     if record:
-        # Oil analysis detection - comprehensive check
+        description = record.description or ""
+
+        # Oil analysis detection - column checks first, description scan only if they are all empty
         if (record.oil_analysis_date or record.oil_analysis_cost or 
             record.iron_level or record.aluminum_level or record.copper_level or
-            (record.description and 'analysis' in record.description.lower())):
+            (description and _ANALYSIS_RE.search(description))):
             return "oil_analysis"
         
         # Oil change detection - be more specific about what constitutes an oil change
         # Only consider it an oil change if it has oil-specific data AND doesn't contain non-oil keywords
-        is_oil_change_by_data = (record.oil_type or record.oil_brand or record.oil_filter_brand)
-        has_non_oil_keywords = (record.description and any(keyword in record.description.lower() 
-                              for keyword in ['fuel filter', 'air filter', 'brake', 'tire', 'battery', 'spark plug', 'belt', 'hose', 'gasket', 'sensor', 'pump', 'alternator', 'starter', 'transmission', 'clutch', 'suspension', 'exhaust', 'coolant', 'thermostat', 'radiator', 'water pump']))
-        
-        if is_oil_change_by_data and not has_non_oil_keywords:
-            return "oil_change"
-        elif record.is_oil_change and not has_non_oil_keywords:
-            return "oil_change"
+        if record.is_oil_change or record.oil_type or record.oil_brand or record.oil_filter_brand:
+            if not (description and _NON_OIL_RE.search(description)):
+                return "oil_change"
     
     # 3. Check return URL context
     if return_url:
@@ -1327,30 +1553,13 @@ async def edit_maintenance_form(
         # Auto-fix incorrectly marked oil change records
         if (record.is_oil_change and 
             record.description and 
-            any(keyword in record.description.lower() 
-                for keyword in ['fuel filter', 'air filter', 'brake', 'tire', 'battery', 'spark plug', 'belt', 'hose', 'gasket', 'sensor', 'pump', 'alternator', 'starter', 'transmission', 'clutch', 'suspension', 'exhaust', 'coolant', 'thermostat', 'radiator', 'water pump'])):
+            _NON_OIL_RE.search(record.description)):
             # This is incorrectly marked as oil change - auto-fix it
-            from data_operations import update_maintenance_record
-            update_result = update_maintenance_record(
-                record_id=record_id,
-                vehicle_id=record.vehicle_id,
-                date=record.date.strftime('%m/%d/%Y'),
-                description=record.description,
-                cost=record.cost or 0.0,  # Handle None cost
-                mileage=record.mileage,
-                is_oil_change=False,  # Fix the incorrect marking
-                oil_change_interval=None,
-                oil_type=None,
-                oil_brand=None,
-                oil_filter_brand=None,
-                oil_filter_part_number=None,
-                oil_cost=None,
-                filter_cost=None,
-                labor_cost=None
-            )
+            update_result = clear_oil_change_fields(record_id)
             if update_result.get("success"):
-                # Refresh the record after fixing
-                record = get_maintenance_by_id(record_id)
+                # Apply the same reset to the loaded record instead of fetching it again
+                for field, value in OIL_CHANGE_CLEARED_VALUES.items():
+                    setattr(record, field, value)
                 detected_form_type = "maintenance"  # Now it should be detected as maintenance
         
         vehicles = get_vehicle_names()
@@ -1358,7 +1567,6 @@ async def edit_maintenance_form(
         # Check if this record has linked oil analysis (for oil change forms)
         has_linked_oil_analysis = False
         if detected_form_type == "oil_change" and record.is_oil_change:
-            from data_operations import get_maintenance_records_by_vehicle
             vehicle_records = get_maintenance_records_by_vehicle(record.vehicle_id)
             linked_analysis = [
                 r for r in vehicle_records 
@@ -1366,7 +1574,7 @@ async def edit_maintenance_form(
             ]
             has_linked_oil_analysis = len(linked_analysis) > 0
         
-        return templates.TemplateResponse("maintenance_form.html", {
+        return render_maintenance_form({
             "request": request, 
             "vehicles": vehicles, 
             "record": record,
@@ -1416,10 +1624,32 @@ async def notifications_page(request: Request):
         print(f"Error loading notifications page: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to load notifications page: {str(e)}")
 
+# Every template the accounts page renders; it has no other server-side inputs
+_ACCOUNTS_PAGE_TEMPLATES = ("accounts.html", "nav.html", "partials/head_resources.html")
+
+
+def _accounts_page_source_tag() -> str:
+    sources = b"".join(Path("templates", name).read_bytes() for name in _ACCOUNTS_PAGE_TEMPLATES)
+    return hashlib.blake2b(sources, digest_size=16).hexdigest()
+
+
+# Templates only change with a deploy outside dev, so their hash is taken once
+_ACCOUNTS_PAGE_SOURCE_TAG = _accounts_page_source_tag()
+
+
 @app.get("/accounts", response_class=HTMLResponse)
 async def accounts_page(request: Request):
     """Manage Accounts (soft multi-tenancy labels stored client-side)."""
-    return templates.TemplateResponse("accounts.html", {"request": request})
+    # Tagged from the template sources and the accounts cache generation, so a
+    # matching If-None-Match is answered before anything is rendered
+    source_tag = _accounts_page_source_tag() if APP_IS_DEV else _ACCOUNTS_PAGE_SOURCE_TAG
+    etag = f'"{source_tag}-{_accounts_payload_cache.generation}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response = templates.TemplateResponse("accounts.html", {"request": request})
+    response.headers.update(headers)
+    return response
 
 @app.get("/oil-analysis/{record_id}")
 async def oil_analysis_redirect(record_id: int):
@@ -1475,8 +1705,8 @@ async def update_maintenance_route(
     """Update an existing maintenance record using centralized data operations"""
     try:
         account_context = get_account_context(request)
-        account_id = account_context["account_id"] if account_context["scope"] != "all" else None
-        vehicle = get_vehicle_by_id(vehicle_id, account_id=account_id)
+        account_id = account_context.account_id if account_context.scope != "all" else None
+        vehicle = get_request_vehicle(request, vehicle_id, account_id)
         if not vehicle:
             raise HTTPException(status_code=404, detail="Vehicle not found or inaccessible in this account.")
 
@@ -1484,41 +1714,8 @@ async def update_maintenance_route(
         if not existing_record or existing_record.vehicle_id != vehicle_id:
             raise HTTPException(status_code=404, detail="Maintenance record not found for this vehicle.")
 
-        # Handle PDF file upload for oil analysis
-        pdf_file_path = None
-        if oil_analysis_report and oil_analysis_report.filename:
-            # Create uploads directory if it doesn't exist
-            upload_dir = "uploads"
-            os.makedirs(upload_dir, exist_ok=True)
-            
-            # Generate unique filename
-            import uuid
-            file_extension = os.path.splitext(oil_analysis_report.filename)[1]
-            unique_filename = f"oil_analysis_{uuid.uuid4().hex}{file_extension}"
-            pdf_file_path = os.path.join(upload_dir, unique_filename)
-            
-            # Save the uploaded file
-            with open(pdf_file_path, "wb") as buffer:
-                content = await oil_analysis_report.read()
-                buffer.write(content)
-        
-        # Handle photo upload for documentation
-        photo_path = None
-        if photo and photo.filename:
-            # Create uploads directory if it doesn't exist
-            upload_dir = "uploads"
-            os.makedirs(upload_dir, exist_ok=True)
-            
-            # Generate unique filename
-            import uuid
-            file_extension = os.path.splitext(photo.filename)[1]
-            unique_filename = f"photo_{uuid.uuid4().hex}{file_extension}"
-            photo_path = os.path.join(upload_dir, unique_filename)
-            
-            # Save the uploaded file
-            with open(photo_path, "wb") as buffer:
-                content = await photo.read()
-                buffer.write(content)
+        # Stream uploads to disk in chunks off the event loop
+        pdf_file_path, photo_path = await _save_uploads(oil_analysis_report, photo)
         
         # Handle empty date_str by using existing record's date
         if not date_str or date_str.strip() == "":
@@ -1544,33 +1741,21 @@ async def update_maintenance_route(
         if result["success"]:
             # If oil analysis linking was requested, create or link oil analysis record
             # Check if this is an oil change (either from form, existing record, or description)
-            updated_record = get_maintenance_by_id(record_id)
+            updated_record = result["record"]
             
             # Detect oil change from description if not explicitly marked
-            description_indicates_oil_change = False
-            if updated_record and updated_record.description:
-                oil_keywords = ['oil change', 'oil/filter', 'oil & filter', 'oil and filter', 'oil+filter']
-                description_indicates_oil_change = any(keyword in updated_record.description.lower() for keyword in oil_keywords)
+            description_indicates_oil_change = bool(
+                updated_record and updated_record.description and _OIL_CHANGE_RE.search(updated_record.description)
+            )
             
             is_oil_change_record = is_oil_change or (updated_record and updated_record.is_oil_change) or description_indicates_oil_change
             
             # Handle oil analysis linking/unlinking
             if is_oil_change_record:
-                vehicle_records = get_maintenance_records_by_vehicle(vehicle_id)
-                
                 # Simple mileage-based oil analysis creation
                 if link_oil_analysis:
                     # Check if oil analysis already exists at this mileage
-                    existing_analysis = [
-                        r for r in vehicle_records 
-                        if r.mileage == mileage and (
-                            r.oil_analysis_date or r.oil_analysis_cost or 
-                            r.iron_level or r.aluminum_level or r.copper_level or
-                            "analysis" in r.description.lower()
-                        )
-                    ]
-                    
-                    if not existing_analysis:
+                    if not has_existing_oil_analysis(vehicle_id, mileage):
                         # Create new oil analysis placeholder at same mileage
                         try:
                             oil_analysis_result = create_maintenance_record(
@@ -1603,9 +1788,20 @@ async def update_maintenance_route(
             # Use return_url if provided, otherwise use smart redirect logic
             if return_url:
                 return RedirectResponse(url=return_url, status_code=303)
-            elif any(field is not None for field in [oil_analysis_date, next_oil_analysis_date, oil_analysis_cost, 
-                                                 iron_level, aluminum_level, copper_level, viscosity, tbn,
-                                                 fuel_dilution, coolant_contamination, driving_conditions, oil_consumption_notes]):
+            elif (
+                oil_analysis_date is not None
+                or next_oil_analysis_date is not None
+                or oil_analysis_cost is not None
+                or iron_level is not None
+                or aluminum_level is not None
+                or copper_level is not None
+                or viscosity is not None
+                or tbn is not None
+                or fuel_dilution is not None
+                or coolant_contamination is not None
+                or driving_conditions is not None
+                or oil_consumption_notes is not None
+            ):
                 # This was an oil analysis record, redirect to oil analysis page
                 return RedirectResponse(url="/oil-management", status_code=303)
             else:
@@ -1626,30 +1822,21 @@ async def maintenance_oil_new_redirect(
     """
     Redirect to the Oil Management add-oil flow, preserving vehicle/account context.
     """
-    params: Dict[str, str] = {"open": "add-oil"}
     incoming = dict(request.query_params)
-
     vehicle_param = vehicle_id or incoming.get("vehicleId") or incoming.get("vehicle_id")
-    if vehicle_param:
-        params["vehicleId"] = str(vehicle_param)
-
     account_param = account_id or incoming.get("accountId") or incoming.get("account_id")
-    if account_param:
-        params["accountId"] = str(account_param)
-
-    query_string = urlencode(params)
-    return RedirectResponse(url=f"/oil-management?{query_string}", status_code=302)
+    return RedirectResponse(url=oil_management_add_url(vehicle_param, account_param), status_code=302)
 
 @app.delete("/maintenance/{record_id}")
 async def delete_maintenance(request: Request, record_id: int):
     """Delete a maintenance record using centralized data operations"""
     try:
         account_context = get_account_context(request)
-        account_id = account_context["account_id"] if account_context["scope"] != "all" else None
+        account_id = account_context.account_id if account_context.scope != "all" else None
         record = get_maintenance_by_id(record_id)
         if not record:
             raise HTTPException(status_code=404, detail="Maintenance record not found.")
-        vehicle = get_vehicle_by_id(record.vehicle_id, account_id=account_id)
+        vehicle = get_request_vehicle(request, record.vehicle_id, account_id)
         if not vehicle:
             raise HTTPException(status_code=404, detail="Maintenance record not accessible in this account.")
 
@@ -1673,8 +1860,6 @@ async def update_vehicle_mileage(
     """Update vehicle mileage by creating a mileage update record"""
     try:
         # Get current mileage for validation
-        from data_operations import get_vehicle_current_mileage, create_maintenance_record
-        
         current_mileage_info = get_vehicle_current_mileage(vehicle_id)
         current_mileage = current_mileage_info.get("current_mileage", 0)
         
@@ -1706,64 +1891,50 @@ async def update_vehicle_mileage(
         raise HTTPException(status_code=500, detail=f"Failed to update mileage: {str(e)}")
 
 @app.delete("/api/fuel/{entry_id}")
-async def delete_fuel_entry(entry_id: int):
+def delete_fuel_entry(entry_id: int, session: Session = Depends(get_session)):
     """Delete a fuel entry from the database"""
     try:
-        from database import SessionLocal
-        from models import FuelEntry
-        
-        session = SessionLocal()
-        try:
-            # Find and delete the fuel entry
-            fuel_entry = session.execute(
-                select(FuelEntry).where(FuelEntry.id == entry_id)
-            ).scalar_one_or_none()
-            
-            if not fuel_entry:
-                raise HTTPException(status_code=404, detail="Fuel entry not found")
-            
-            # Store vehicle ID for response
-            vehicle_id = fuel_entry.vehicle_id
-            
-            # Delete the entry
-            session.delete(fuel_entry)
-            session.commit()
-            
-            return {
-                "success": True, 
-                "message": "Fuel entry deleted successfully",
-                "vehicle_id": vehicle_id
-            }
-            
-        except Exception as e:
+        # Single DELETE ... RETURNING: no separate SELECT to find the entry first
+        vehicle_id = session.execute(
+            delete(FuelEntry).where(FuelEntry.id == entry_id).returning(FuelEntry.vehicle_id)
+        ).scalar_one_or_none()
+        if vehicle_id is None:
             session.rollback()
-            raise
-        finally:
-            session.close()
+            raise HTTPException(status_code=404, detail="Fuel entry not found")
+        sync_last_fuel_mileage(session, [vehicle_id])
+        session.commit()
+        invalidate_mpg_summary_cache()
+        invalidate_notifications_cache()
+        
+        return {
+            "success": True, 
+            "message": "Fuel entry deleted successfully",
+            "vehicle_id": vehicle_id
+        }
             
     except HTTPException:
         raise
     except Exception as e:
+        session.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to delete fuel entry: {str(e)}")
 
-@app.get("/api/fuel/entries")
-async def get_fuel_entries(
+@app.get("/api/fuel/entries", response_class=ORJSONResponse)
+def get_fuel_entries(
     accountId: Optional[str] = Query(None),
     accountName: Optional[str] = Query(None),
 ):
     """Get all fuel entries from the database with optional account filtering."""
     try:
-        from data_operations import get_all_fuel_entries
-
         account_id = resolve_account_filter(accountId, accountName)
         entries = get_all_fuel_entries(account_id=account_id)
-        serialized_entries = [serialize_fuel_entry_for_api(entry) for entry in entries]
 
-        return {
+        # Returned directly so the payload skips jsonable_encoder and is encoded by orjson,
+        # which writes the date columns as ISO strings itself
+        return ORJSONResponse({
             "success": True,
             "account_id": account_id,
-            "entries": serialized_entries,
-        }
+            "entries": entries,
+        })
 
     except HTTPException:
         raise
@@ -1771,106 +1942,118 @@ async def get_fuel_entries(
         print(f"Error getting fuel entries: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get fuel entries: {str(e)}")
 
-@app.get("/api/fuel/mpg-summary")
-async def get_fuel_mpg_summary(
+# MPG summaries per account filter; fuel entry writes clear the cache and the TTL
+# bounds staleness after vehicle renames/transfers
+_MPG_SUMMARY_TTL_SECONDS = 60
+_mpg_summary_cache = TTLCache(_MPG_SUMMARY_TTL_SECONDS)
+
+
+def invalidate_mpg_summary_cache() -> None:
+    _mpg_summary_cache.invalidate()
+
+
+def _fuel_entry_datetime(entry: Dict[str, Any]) -> Optional[datetime]:
+    """Fill-up date of a fuel entry dict as a datetime, or None if missing/unparseable."""
+    value = entry.get("date")
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    if isinstance(value, str):
+        # fromisoformat covers the stored formats in one C-level call; strptime is
+        # only the fallback for loosely formatted values such as "2024-1-5"
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+        for fmt in ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"):
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+    return None
+
+
+@app.get("/api/fuel/mpg-summary", response_class=ORJSONResponse)
+def get_fuel_mpg_summary(
     accountId: Optional[str] = Query(None),
     accountName: Optional[str] = Query(None),
 ):
     """Get MPG summary for all vehicles"""
     try:
-        from data_operations import get_all_vehicles, get_fuel_entries_for_vehicle
-
         account_id = resolve_account_filter(accountId, accountName)
+        cached, generation = _mpg_summary_cache.get(account_id)
+        if cached is not MISS:
+            return ORJSONResponse(cached)
+
         vehicles = get_all_vehicles(account_id=account_id)
+        entries_by_vehicle = get_fuel_entries_for_vehicles([v.id for v in vehicles], account_id=account_id)
         summary = []
         
-        def to_datetime(value):
-            if isinstance(value, datetime):
-                return value
-            if isinstance(value, date):
-                return datetime.combine(value, datetime.min.time())
-            if isinstance(value, str):
-                for fmt in ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"):
-                    try:
-                        return datetime.strptime(value, fmt)
-                    except ValueError:
-                        continue
-                try:
-                    return datetime.fromisoformat(value)
-                except ValueError:
-                    return None
-            return None
-
         for vehicle in vehicles:
-            fuel_entries = get_fuel_entries_for_vehicle(vehicle.id, account_id=account_id)
+            fuel_entries = entries_by_vehicle.get(vehicle.id)
+            if not fuel_entries:
+                # No fill-ups recorded: skip the per-entry calculations entirely
+                summary.append({
+                    "vehicle_id": vehicle.id,
+                    "vehicle_name": vehicle.name,
+                    "account_id": vehicle.account_id,
+                    "mpg": None,
+                    "entries_count": 0,
+                    "avg_price_per_gal": None,
+                    "miles_traveled": None,
+                    "gallons_filled": 0,
+                    "avg_days_between_fills": None,
+                    "calculation_details": {
+                        "total_miles": 0,
+                        "total_gallons": 0,
+                        "formula": "Need at least 2 fuel entries"
+                    }
+                })
+                continue
+
+            # One pass over the entries collects the totals, the fill-up dates and
+            # the entries with a valid odometer reading (positive number)
+            total_cost = 0
+            total_gallons_all = 0
+            date_values = []
+            valid_mileage_entries = []
+            for entry in fuel_entries:
+                total_cost += entry.get("fuel_cost") or 0
+                total_gallons_all += entry.get("fuel_amount") or 0
+                entry_date = _fuel_entry_datetime(entry)
+                if entry_date:
+                    date_values.append(entry_date)
+                mileage = entry.get('mileage')
+                if isinstance(mileage, (int, float)) and mileage > 0:
+                    valid_mileage_entries.append(entry)
 
-            total_cost = sum((entry.get("fuel_cost") or 0) for entry in fuel_entries)
-            total_gallons_all = sum((entry.get("fuel_amount") or 0) for entry in fuel_entries)
             avg_price_per_gal = (
                 float(total_cost) / float(total_gallons_all)
                 if total_gallons_all
                 else None
             )
 
-            date_values = [dt for dt in (to_datetime(entry.get("date")) for entry in fuel_entries) if dt]
+            date_values.sort()
             avg_days_between = None
             if len(date_values) >= 2:
-                date_values.sort()
-                diffs = []
-                for i in range(len(date_values) - 1):
-                    diff = (date_values[i + 1] - date_values[i]).days
-                    if diff >= 0:
-                        diffs.append(diff)
-                if diffs:
-                    avg_days_between = sum(diffs) / len(diffs)
-
-            # Calculate miles_traveled from fuel entry odometer readings
-            # Filter entries with valid odometer readings (non-None, positive values)
-            valid_mileage_entries = [
-                entry for entry in fuel_entries
-                if entry.get('mileage') is not None
-                and isinstance(entry.get('mileage'), (int, float))
-                and entry.get('mileage') > 0
-            ]
+                # Consecutive gaps of a sorted list are never negative
+                diffs = [(later - earlier).days for earlier, later in pairwise(date_values)]
+                avg_days_between = sum(diffs) / len(diffs)
+
+            # Lowest to highest mileage; sorted once and shared by the miles-traveled
+            # and MPG calculations below.
+            valid_mileage_entries.sort(key=itemgetter('mileage'))
+            sorted_by_mileage = valid_mileage_entries
+            mileages = [entry['mileage'] for entry in sorted_by_mileage]
+            # deltas[i] is the distance from fill-up i to i + 1 (never negative once sorted)
+            deltas = [next_mileage - mileage for mileage, next_mileage in pairwise(mileages)]
             
-            miles_traveled = None
-            if len(valid_mileage_entries) >= 2:
-                # Sort by mileage (lowest to highest)
-                sorted_valid_entries = sorted(valid_mileage_entries, key=lambda x: x['mileage'])
-                
-                # Sum positive deltas between consecutive entries
-                total_miles = 0
-                for i in range(len(sorted_valid_entries) - 1):
-                    current_mileage = sorted_valid_entries[i]['mileage']
-                    next_mileage = sorted_valid_entries[i + 1]['mileage']
-                    delta = max(0, next_mileage - current_mileage)
-                    total_miles += delta
-                
-                miles_traveled = total_miles if total_miles > 0 else None
+            total_miles = sum(deltas)
+            miles_traveled = total_miles if total_miles > 0 else None
             
             if len(fuel_entries) >= 2:
                 # 🎯 SIMPLE MPG: Sort by mileage, not date!
-                print(f"🎯 SIMPLE MPG for {vehicle.name}:")
-                print(f"  Total entries: {len(fuel_entries)}")
-                
-                # Show all entries
-                for i, entry in enumerate(fuel_entries):
-                    print(f"    Entry {i}: Mileage={entry['mileage']}, Fuel={entry['fuel_amount']}")
-                
-                # Sort by mileage (lowest to highest) - filter invalid entries for MPG calculations
-                # This ensures backwards compatibility while avoiding errors from None/0 mileage
-                valid_for_mpg = [
-                    entry for entry in fuel_entries
-                    if entry.get('mileage') is not None
-                    and isinstance(entry.get('mileage'), (int, float))
-                    and entry.get('mileage') > 0
-                ]
-                sorted_by_mileage = sorted(valid_for_mpg, key=lambda x: x['mileage']) if valid_for_mpg else []
-                
-                print(f"  Sorted by mileage (lowest to highest):")
-                for i, entry in enumerate(sorted_by_mileage):
-                    print(f"    Mileage {i}: {entry['mileage']}, Fuel={entry['fuel_amount']}")
-                
                 # Enhanced MPG calculation with three types
                 # Initialize variables
                 lifetime_mpg = None
@@ -1883,72 +2066,48 @@ async def get_fuel_mpg_summary(
                 
                 # Only calculate if we have at least 2 valid entries
                 if len(sorted_by_mileage) >= 2:
-                    print(f"  🚗 {vehicle.name} MPG Calculations:")
-                    
                     # 1. LIFETIME MPG (never resets, accumulates from first entry)
-                    lifetime_miles = sorted_by_mileage[-1]['mileage'] - sorted_by_mileage[0]['mileage']
+                    lifetime_miles = mileages[-1] - mileages[0]
                     lifetime_gallons = sum(entry['fuel_amount'] for entry in sorted_by_mileage[1:])
                     lifetime_mpg = lifetime_miles / lifetime_gallons if lifetime_gallons > 0 else None
                     
-                    if lifetime_mpg is not None:
-                        print(f"    Lifetime MPG: {lifetime_miles:,} miles ÷ {lifetime_gallons} gallons = {lifetime_mpg:.2f} MPG")
-                    else:
-                        print(f"    Lifetime MPG: Unable to calculate (insufficient data)")
-                    
                     # 2. DETECT GAPS (>500 miles between consecutive entries)
-                    for i in range(len(sorted_by_mileage) - 1):
-                        current_mileage = sorted_by_mileage[i]['mileage']
-                        next_mileage = sorted_by_mileage[i + 1]['mileage']
-                        gap = next_mileage - current_mileage
-                        
-                        if gap > 500:
-                            gaps_detected.append({
-                                'between_entries': f"{current_mileage:,} and {next_mileage:,}",
-                                'gap_miles': gap,
-                                'suggested_missing_fuel': gap / 25  # Assume 25 MPG average
-                            })
+                    gaps_detected = [
+                        {
+                            'between_entries': f"{mileages[i]:,} and {mileages[i + 1]:,}",
+                            'gap_miles': gap,
+                            'suggested_missing_fuel': gap / 25  # Assume 25 MPG average
+                        }
+                        for i, gap in enumerate(deltas)
+                        if gap > 500
+                    ]
                     
                     # 3. CURRENT MPG (last 2 entries only, resets on gaps)
                     # Check if last entry has a gap
-                    last_gap = sorted_by_mileage[-1]['mileage'] - sorted_by_mileage[-2]['mileage']
+                    last_gap = deltas[-1]
                     if last_gap <= 500:  # No gap detected
-                        current_miles = sorted_by_mileage[-1]['mileage'] - sorted_by_mileage[-2]['mileage']
+                        current_miles = last_gap
                         current_gallons = sorted_by_mileage[-1]['fuel_amount']
                         current_mpg = current_miles / current_gallons if current_gallons > 0 else None
-                        if current_mpg is not None:
-                            print(f"    Current MPG: {current_miles:,} miles ÷ {current_gallons} gallons = {current_mpg:.2f} MPG")
-                        else:
-                            print(f"    Current MPG: Unable to calculate (insufficient data)")
-                    else:
-                        print(f"    Current MPG: RESET (gap detected: {last_gap:,} miles)")
                     
                     # 4. ENTRIES-BASED MPG (last 5 entries, resets on gaps)
-                    entries_count = min(5, len(sorted_by_mileage))
+                    # The window starts at the 5th-from-last entry and stops at the first gap
+                    start_idx = len(sorted_by_mileage) - min(5, len(sorted_by_mileage))
+                    end_idx = start_idx + 1
+                    while end_idx < len(sorted_by_mileage) and deltas[end_idx - 1] <= 500:
+                        end_idx += 1
+                    valid_entries_for_entries_mpg = sorted_by_mileage[start_idx:end_idx]
                     
-                    if entries_count >= 2:
-                        # Check for gaps in the last 5 entries
-                        valid_entries_for_entries_mpg = []
-                        start_idx = len(sorted_by_mileage) - entries_count
-                        for i in range(start_idx, len(sorted_by_mileage)):
-                            if i == start_idx or (sorted_by_mileage[i]['mileage'] - sorted_by_mileage[i-1]['mileage']) <= 500:
-                                valid_entries_for_entries_mpg.append(sorted_by_mileage[i])
-                            else:
-                                break  # Stop at first gap
-                        
-                        if len(valid_entries_for_entries_mpg) >= 2:
-                            entries_miles = valid_entries_for_entries_mpg[-1]['mileage'] - valid_entries_for_entries_mpg[0]['mileage']
-                            entries_gallons = sum(entry['fuel_amount'] for entry in valid_entries_for_entries_mpg[1:])
-                            entries_mpg = entries_miles / entries_gallons if entries_gallons > 0 else None
-                            if entries_mpg is not None:
-                                print(f"    Entries MPG ({len(valid_entries_for_entries_mpg)} entries): {entries_miles:,} miles ÷ {entries_gallons} gallons = {entries_mpg:.2f} MPG")
-                            else:
-                                print(f"    Entries MPG: Unable to calculate (insufficient data)")
-                        else:
-                            print(f"    Entries MPG: RESET (insufficient valid entries after gap removal)")
-                    else:
-                        print(f"    Entries MPG: Need at least 2 entries")
-                else:
-                    print(f"  🚗 {vehicle.name} MPG Calculations: Need at least 2 entries with valid mileage")
+                    if len(valid_entries_for_entries_mpg) >= 2:
+                        entries_miles = mileages[end_idx - 1] - mileages[start_idx]
+                        entries_gallons = sum(entry['fuel_amount'] for entry in valid_entries_for_entries_mpg[1:])
+                        entries_mpg = entries_miles / entries_gallons if entries_gallons > 0 else None
+                
+                logger.debug(
+                    "MPG for %s: %d entries (%d with mileage), lifetime=%s current=%s entries=%s, %d gap(s)",
+                    vehicle.name, len(fuel_entries), len(sorted_by_mileage),
+                    lifetime_mpg, current_mpg, entries_mpg, len(gaps_detected),
+                )
                 
                 # Store results
                 mpg = lifetime_mpg  # Keep backward compatibility for now
@@ -1995,18 +2154,20 @@ async def get_fuel_mpg_summary(
                     }
                 })
         
-        return {
+        response = {
             "success": True,
             "account_id": account_id,
             "summary": summary
         }
+        _mpg_summary_cache.set(account_id, response, generation)
+        return ORJSONResponse(response)
         
     except Exception as e:
         print(f"Error getting MPG summary: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get MPG summary: {str(e)}")
 
 @app.get("/import", response_class=HTMLResponse)
-async def import_form(request: Request):
+def import_form(request: Request):
     """Form to import CSV data using centralized data operations"""
     vehicles = get_vehicle_names()
     return templates.TemplateResponse("import.html", {"request": request, "vehicles": vehicles})
@@ -2014,47 +2175,77 @@ async def import_form(request: Request):
 @app.post("/import")
 async def import_data(
     request: Request,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     vehicle_id: int = Form(...),
     handle_duplicates: str = Form("skip")
 ):
-    """Import CSV data using centralized data operations"""
+    """Queue a CSV import as a background job and redirect to its status page"""
     try:
         # Validate vehicle exists using centralized function
         vehicle = get_vehicle_by_id(vehicle_id)
         if not vehicle:
             raise HTTPException(status_code=400, detail="Selected vehicle not found")
         
-        file_content = await file.read()
-        # Use centralized import function with vehicle_id
-        result = import_csv_data(file_content.decode('utf-8'), vehicle_id)
-        return templates.TemplateResponse("import_result.html", {"request": request, "result": result})
-    except HTTPException:
-        raise
-    except Exception as e:
+        # Spool the upload to a temp file in chunks; the job streams rows from it
+        # after the response is sent, off the request path
+        csv_fd, csv_path = tempfile.mkstemp(prefix="import_", suffix=".csv")
+        try:
+            os.close(csv_fd)
+            await file.seek(0)
+            await run_in_threadpool(_copy_upload, file.file, csv_path)
+            job_id = create_import_job()
+            if job_id is None:
+                raise HTTPException(status_code=503, detail="Too many imports in progress; try again shortly")
+            background_tasks.add_task(run_import_job, job_id, csv_path, vehicle_id)
+        except BaseException:
+            # Until the job owns it (and deletes it when done), the file is ours to remove
+            try:
+                os.unlink(csv_path)
+            except OSError:
+                pass
+            raise
+        return RedirectResponse(url=f"/import/status/{job_id}", status_code=303)
+    except HTTPException:
+        raise
+    except Exception as e:
         return HTMLResponse(content=f"<h1>Import Error</h1><p>{str(e)}</p>")
 
+@app.get("/import/status/{job_id}")
+async def import_status(request: Request, job_id: str):
+    """Show the progress or result of a background CSV import"""
+    job = get_import_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    if _wants_json(request):
+        return {"job_id": job_id, "status": job["status"], "error": job.get("error")}
+    if job["status"] == "failed":
+        return HTMLResponse(content=f"<h1>Import Error</h1><p>{html.escape(job['error'])}</p>")
+    pending = job["status"] != "done"
+    return templates.TemplateResponse("import_result.html", {"request": request, "result": job["result"], "pending": pending})
+
 @app.get("/api/export/vehicles")
 async def export_vehicles_csv(vehicle_ids: Optional[str] = Query(None)):
     """Export vehicles to CSV using centralized data operations"""
     try:
-        from data_operations import export_vehicles_csv as export_vehicles_func
-        
-        if vehicle_ids:
+        vehicle_id_list = _parse_vehicle_ids(vehicle_ids)
+        if vehicle_id_list:
             # Export specific vehicles
-            vehicle_id_list = [int(id.strip()) for id in vehicle_ids.split(',')]
-            csv_content = export_vehicles_func(vehicle_ids=vehicle_id_list)
+            csv_rows = iter_vehicles_csv(vehicle_ids=vehicle_id_list)
             filename = f"vehicles_selected_export.csv"
         else:
             # Export all vehicles
-            csv_content = export_vehicles_func()
+            csv_rows = iter_vehicles_csv()
             filename = "vehicles_export.csv"
         
-        return Response(
-            content=csv_content,
+        # Rows are formatted and sent in chunks as they are read instead of buffered whole
+        return StreamingResponse(
+            csv_rows,
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
 
@@ -2062,19 +2253,18 @@ async def export_vehicles_csv(vehicle_ids: Optional[str] = Query(None)):
 async def export_maintenance_csv(vehicle_id: Optional[int] = Query(None)):
     """Export maintenance records to CSV using centralized data operations"""
     try:
-        from data_operations import export_maintenance_csv as export_maintenance_func
-        
         if vehicle_id:
             # Export single vehicle maintenance
-            csv_content = export_maintenance_func(vehicle_id=vehicle_id)
+            csv_rows = iter_maintenance_csv(vehicle_id=vehicle_id)
             filename = f"maintenance_vehicle_{vehicle_id}_export.csv"
         else:
             # Export all maintenance
-            csv_content = export_maintenance_func()
+            csv_rows = iter_maintenance_csv()
             filename = "maintenance_export.csv"
         
-        return Response(
-            content=csv_content,
+        # Rows are formatted and sent in chunks as they are read instead of buffered whole
+        return StreamingResponse(
+            csv_rows,
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -2085,29 +2275,27 @@ async def export_maintenance_csv(vehicle_id: Optional[int] = Query(None)):
 async def export_vehicles_pdf(vehicle_ids: Optional[str] = Query(None)):
     """Export vehicles to PDF using centralized data operations"""
     try:
-        from data_operations import export_vehicles_pdf as export_vehicles_pdf_func
-        
-        if vehicle_ids:
-            vehicle_id_list = [int(id.strip()) for id in vehicle_ids.split(',')]
-            pdf_content = export_vehicles_pdf_func(vehicle_ids=vehicle_id_list)
-        else:
-            pdf_content = export_vehicles_pdf_func()
-        
-        return Response(
-            content=pdf_content,
-            media_type="application/pdf",
-            headers={"Content-Disposition": "attachment; filename=vehicles_export.pdf"}
+        return await _pdf_export_response(
+            export_vehicles_pdf_func, "vehicles_export.pdf", vehicle_ids=_parse_vehicle_ids(vehicle_ids)
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDF export failed: {str(e)}")
 
 @app.get("/api/vehicles/names")
-async def get_vehicle_names_for_export():
+def get_vehicle_names_for_export(request: Request):
     """Get vehicle names and IDs for export selection"""
     try:
-        from data_operations import get_vehicle_names
         vehicles = get_vehicle_names()
-        return {"success": True, "vehicles": vehicles}
+        response = ORJSONResponse({"success": True, "vehicles": vehicles})
+        # Names come from a 30s server cache, so let the browser reuse them for as long
+        etag = _compute_etag(response.body)
+        headers = {"ETag": etag, "Cache-Control": "private, max-age=30"}
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+        return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get vehicle names: {str(e)}")
 
@@ -2115,14 +2303,8 @@ async def get_vehicle_names_for_export():
 async def export_maintenance_pdf(vehicle_id: Optional[int] = Query(None)):
     """Export maintenance records to PDF using centralized data operations"""
     try:
-        from data_operations import export_maintenance_pdf as export_maintenance_pdf_func
-        
-        pdf_content = export_maintenance_pdf_func(vehicle_id=vehicle_id)
-        
-        return Response(
-            content=pdf_content,
-            media_type="application/pdf",
-            headers={"Content-Disposition": "attachment; filename=maintenance_export.pdf"}
+        return await _pdf_export_response(
+            export_maintenance_pdf_func, "maintenance_export.pdf", vehicle_id=vehicle_id
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDF export failed: {str(e)}")
@@ -2130,35 +2312,22 @@ async def export_maintenance_pdf(vehicle_id: Optional[int] = Query(None)):
 @app.get("/fuel", response_class=HTMLResponse)
 async def fuel_redirect():
     """Redirect old fuel route to new fuel system"""
-    from fastapi.responses import RedirectResponse
     return RedirectResponse(url="/fuel-new", status_code=301)
 
 @app.get("/fuel-new", response_class=HTMLResponse)
-async def fuel_tracking_new(request: Request):
+def fuel_tracking_new(request: Request):
     """New, clean fuel tracking page"""
     try:
         account_context = get_account_context(request)
-        account_id = account_context["account_id"] if account_context["scope"] != "all" else None
-        vehicles = get_all_vehicles(account_id=account_id)
-
-        vehicles_dict = [
-            {
-                "id": vehicle.id,
-                "name": vehicle.name,
-                "year": vehicle.year,
-                "make": vehicle.make,
-                "model": vehicle.model,
-                "vin": vehicle.vin,
-                "account_id": vehicle.account_id,
-            }
-            for vehicle in vehicles
-        ]
+        account_id = account_context.account_id if account_context.scope != "all" else None
+        # Column-only rows as dicts: rendered in the picker and embedded via tojson
+        vehicles = get_vehicle_summaries(account_id=account_id)
 
         return templates.TemplateResponse(
             "fuel_tracking_new.html",
             {
                 "request": request,
-                "vehicles": vehicles_dict,
+                "vehicles": vehicles,
                 "account_context": account_context,
             },
         )
@@ -2173,80 +2342,97 @@ async def migrate_database():
 # Debug endpoint removed for production
 
 @app.get("/migrate-oil-change-fields")
-async def migrate_oil_change_fields():
+def migrate_oil_change_fields(session: Session = Depends(get_session)):
     """Migration endpoint to add enhanced oil change fields to MaintenanceRecord table"""
     try:
-        from database import SessionLocal
-        from sqlalchemy import text
+        # List of all the new columns we need to add
+        new_columns = [
+            ("is_oil_change", "BOOLEAN DEFAULT FALSE"),
+            ("oil_type", "VARCHAR(20)"),
+            ("oil_brand", "VARCHAR(50)"),
+            ("oil_filter_brand", "VARCHAR(50)"),
+            ("oil_filter_part_number", "VARCHAR(50)"),
+            ("oil_cost", "DECIMAL(10,2)"),
+            ("filter_cost", "DECIMAL(10,2)"),
+            ("labor_cost", "DECIMAL(10,2)"),
+            ("oil_analysis_report", "TEXT"),
+            ("oil_analysis_date", "DATE"),
+            ("next_oil_analysis_date", "DATE"),
+            ("oil_analysis_cost", "DECIMAL(10,2)"),
+            ("iron_level", "DECIMAL(8,2)"),
+            ("aluminum_level", "DECIMAL(8,2)"),
+            ("copper_level", "DECIMAL(8,2)"),
+            ("viscosity", "DECIMAL(8,2)"),
+            ("tbn", "DECIMAL(8,2)"),
+            ("fuel_dilution", "DECIMAL(5,2)"),
+            ("coolant_contamination", "BOOLEAN"),
+            ("driving_conditions", "VARCHAR(50)"),
+            ("oil_consumption_notes", "TEXT")
+        ]
         
-        session = SessionLocal()
-        try:
-            # List of all the new columns we need to add
-            new_columns = [
-                ("is_oil_change", "BOOLEAN DEFAULT FALSE"),
-                ("oil_type", "VARCHAR(20)"),
-                ("oil_brand", "VARCHAR(50)"),
-                ("oil_filter_brand", "VARCHAR(50)"),
-                ("oil_filter_part_number", "VARCHAR(50)"),
-                ("oil_cost", "DECIMAL(10,2)"),
-                ("filter_cost", "DECIMAL(10,2)"),
-                ("labor_cost", "DECIMAL(10,2)"),
-                ("oil_analysis_report", "TEXT"),
-                ("oil_analysis_date", "DATE"),
-                ("next_oil_analysis_date", "DATE"),
-                ("oil_analysis_cost", "DECIMAL(10,2)"),
-                ("iron_level", "DECIMAL(8,2)"),
-                ("aluminum_level", "DECIMAL(8,2)"),
-                ("copper_level", "DECIMAL(8,2)"),
-                ("viscosity", "DECIMAL(8,2)"),
-                ("tbn", "DECIMAL(8,2)"),
-                ("fuel_dilution", "DECIMAL(5,2)"),
-                ("coolant_contamination", "BOOLEAN"),
-                ("driving_conditions", "VARCHAR(50)"),
-                ("oil_consumption_notes", "TEXT")
-            ]
-            
-            added_columns = []
-            existing_columns = []
-            
-            for column_name, column_type in new_columns:
-                # Check if column already exists
-                result = session.execute(text(f"""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_name = 'maintenancerecord' AND column_name = '{column_name}'
-                """))
-                
-                if not result.fetchone():
-                    # Add the column
-                    session.execute(text(f"ALTER TABLE maintenancerecord ADD COLUMN {column_name} {column_type}"))
-                    added_columns.append(column_name)
-                else:
-                    existing_columns.append(column_name)
-            
-            session.commit()
-            
-            return {
-                "success": True, 
-                "message": f"Migration completed successfully!",
-                "added_columns": added_columns,
-                "existing_columns": existing_columns,
-                "total_columns_processed": len(new_columns)
-            }
-                
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
-            
+        # One round-trip for the current columns instead of a probe per column
+        present = {
+            row[0]
+            for row in session.execute(text("""
+                SELECT column_name 
+                FROM information_schema.columns 
+                WHERE table_name = 'maintenancerecord'
+            """))
+        }
+        missing_columns = [(name, column_type) for name, column_type in new_columns if name not in present]
+        existing_columns = [name for name, _ in new_columns if name in present]
+        added_columns = []
+        failed_columns = []
+        
+        if missing_columns:
+            try:
+                # Single ALTER TABLE for every missing column (one lock acquisition);
+                # the names come from the list above
+                with session.begin_nested():
+                    session.execute(text(
+                        "ALTER TABLE maintenancerecord "
+                        + ", ".join(
+                            f"ADD COLUMN IF NOT EXISTS {name} {column_type}"
+                            for name, column_type in missing_columns
+                        )
+                    ))
+                added_columns = [name for name, _ in missing_columns]
+            except SQLAlchemyError:
+                # Something in the batch failed: retry column by column, each in its own
+                # savepoint, so the good ones land and the response names the bad ones
+                for name, column_type in missing_columns:
+                    try:
+                        with session.begin_nested():
+                            session.execute(text(
+                                f"ALTER TABLE maintenancerecord ADD COLUMN IF NOT EXISTS {name} {column_type}"
+                            ))
+                        added_columns.append(name)
+                    except SQLAlchemyError as e:
+                        failed_columns.append({"column": name, "error": str(e)})
+        
+        session.commit()
+        
+        return {
+            "success": not failed_columns, 
+            "message": (
+                "Migration completed successfully!"
+                if not failed_columns
+                else f"Migration completed with {len(failed_columns)} failed column(s)"
+            ),
+            "added_columns": added_columns,
+            "existing_columns": existing_columns,
+            "failed_columns": failed_columns,
+            "total_columns_processed": len(new_columns)
+        }
+
     except Exception as e:
+        session.rollback()
         return {"success": False, "error": f"Migration failed: {str(e)}"}
 
 @app.post("/api/fuel/entry")
-async def create_fuel_entry(
+def create_fuel_entry(
     vehicle_id: int = Form(...),
-    date: str = Form(...),
+    date: FormDate = Form(...),
     time: str = Form(...),
     mileage: int = Form(...),
     fuel_amount: float = Form(...),
@@ -2258,99 +2444,87 @@ async def create_fuel_entry(
 ):
     """Create a new fuel entry in the database"""
     try:
-        from database import SessionLocal
-        from models import FuelEntry
-        from datetime import datetime
-        from data_operations import parse_date_string
-        
-        # Parse the date string
-        try:
-            parsed_date = parse_date_string(date)
-        except ValueError as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
-        
-        # Check for gaps before creating entry
-        from data_operations import get_fuel_entries_for_vehicle
-        existing_entries = get_fuel_entries_for_vehicle(vehicle_id)
+        # Check for a gap against the highest mileage already recorded for the vehicle
+        previous_mileage = get_latest_fuel_mileage(vehicle_id)
         gaps_detected = []
         
-        if existing_entries:
-            # Sort by mileage to find the closest previous entry
-            sorted_entries = sorted(existing_entries, key=lambda x: x['mileage'])
-            last_entry = sorted_entries[-1]
-            
-            # Check for gap
-            gap = mileage - last_entry['mileage']
+        if previous_mileage is not None:
+            gap = mileage - previous_mileage
             if gap > 500:
                 gaps_detected.append({
                     'gap_miles': gap,
-                    'previous_mileage': last_entry['mileage'],
+                    'previous_mileage': previous_mileage,
                     'current_mileage': mileage,
                     'suggested_missing_fuel': gap / 25  # Assume 25 MPG average
                 })
-                print(f"⚠️ GAP DETECTED: {gap:,} miles between {last_entry['mileage']:,} and {mileage:,}")
+                logger.debug("Gap detected: %s miles between %s and %s", gap, previous_mileage, mileage)
         
-        # Create the fuel entry
-        session = SessionLocal()
-        try:
-            fuel_entry = FuelEntry(
-                vehicle_id=vehicle_id,
-                date=parsed_date,
-                time=time,
-                mileage=mileage,
-                fuel_amount=fuel_amount,
-                fuel_cost=fuel_cost,
-                fuel_type=fuel_type,
-                driving_pattern=driving_pattern,
-                notes=notes,
-                odometer_photo=odometer_photo,
-                created_at=datetime.now().date(),
-                updated_at=datetime.now().date()
-            )
-            
-            session.add(fuel_entry)
-            session.commit()
-            session.refresh(fuel_entry)
-            
-            print(f"Fuel entry created: Vehicle {vehicle_id}, Mileage {mileage:,}, Date {parsed_date}")
-            
-            result = {
-                "success": True,
-                "message": "Fuel entry created successfully",
-                "entry_id": fuel_entry.id,
-                "mileage": mileage,
-                "date": str(parsed_date)
-            }
-            
-            # Add gap detection info to result
-            if gaps_detected:
-                result["gaps_detected"] = gaps_detected
-                result["gap_warning"] = f"Gap detected: {gap:,} miles between {last_entry['mileage']:,} and {mileage:,}"
-                result["requires_user_choice"] = True
-            
-            return result
-            
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        # Create the fuel entry through the bulk insert path (one INSERT ... RETURNING)
+        created = create_fuel_entries([{
+            "vehicle_id": vehicle_id,
+            "date": date,
+            "time": time,
+            "mileage": mileage,
+            "fuel_amount": fuel_amount,
+            "fuel_cost": fuel_cost,
+            "fuel_type": fuel_type,
+            "driving_pattern": driving_pattern,
+            "notes": notes,
+            "odometer_photo": odometer_photo,
+        }])
+        if not created["success"]:
+            raise Exception(created["error"])
+        invalidate_mpg_summary_cache()
+        
+        logger.debug("Fuel entry created: vehicle=%s mileage=%s date=%s", vehicle_id, mileage, date)
+        
+        result = {
+            "success": True,
+            "message": "Fuel entry created successfully",
+            "entry_id": created["entry_ids"][0],
+            "mileage": mileage,
+            "date": str(date)
+        }
+        
+        # Add gap detection info to result
+        if gaps_detected:
+            result["gaps_detected"] = gaps_detected
+            result["gap_warning"] = f"Gap detected: {gap:,} miles between {previous_mileage:,} and {mileage:,}"
+            result["requires_user_choice"] = True
+        
+        return result
             
     except Exception as e:
-        print(f"Error creating fuel entry: {e}")
+        logger.error("Error creating fuel entry: %s", e)
         return {
             "success": False,
             "error": f"Failed to create fuel entry: {str(e)}"
         }
 
+@app.post("/api/fuel/entries/bulk")
+async def create_fuel_entries_bulk(entries: List[FuelEntryCreateRequest]):
+    """Create many fuel entries in one transaction using batched inserts"""
+    result = await run_in_threadpool(
+        create_fuel_entries, [entry.model_dump() for entry in entries]
+    )
+    if not result["success"]:
+        return {
+            "success": False,
+            "error": f"Failed to create fuel entries: {result['error']}"
+        }
+    if result["entry_ids"]:
+        invalidate_mpg_summary_cache()
+    return {
+        "success": True,
+        "message": f"Created {len(result['entry_ids'])} fuel entries",
+        "entry_ids": result["entry_ids"],
+    }
+
 @app.put("/api/fuel/{entry_id}")
-async def update_fuel_entry(
+def update_fuel_entry(
     entry_id: int,
     vehicle_id: int = Form(...),
-    date: str = Form(...),
+    date: FormDate = Form(...),
     time: str = Form(...),
     mileage: int = Form(...),
     fuel_amount: float = Form(...),
@@ -2358,71 +2532,59 @@ async def update_fuel_entry(
     fuel_type: str = Form(...),
     driving_pattern: str = Form(...),
     notes: Optional[str] = Form(None),
-    odometer_photo: Optional[str] = Form(None)
+    odometer_photo: Optional[str] = Form(None),
+    session: Session = Depends(get_session),
 ):
     """Update an existing fuel entry in the database"""
     try:
-        from database import SessionLocal
-        from models import FuelEntry
-        from datetime import datetime
-        from data_operations import parse_date_string
-        
-        # Parse the date string
-        try:
-            parsed_date = parse_date_string(date)
-        except ValueError as e:
+        # Only the current vehicle_id is read (locked), so both vehicles' stored
+        # last mileage can be recomputed if the entry moves between them
+        previous_vehicle_id = session.execute(
+            select(FuelEntry.vehicle_id).where(FuelEntry.id == entry_id).with_for_update()
+        ).scalar_one_or_none()
+        if previous_vehicle_id is None:
+            session.rollback()
             return {
                 "success": False,
-                "error": str(e)
+                "error": "Fuel entry not found"
             }
         
-        # Update the fuel entry
-        session = SessionLocal()
-        try:
-            fuel_entry = session.execute(
-                select(FuelEntry).where(FuelEntry.id == entry_id)
-            ).scalar_one_or_none()
-            
-            if not fuel_entry:
-                return {
-                    "success": False,
-                    "error": "Fuel entry not found"
-                }
-            
-            # Update the fields
-            fuel_entry.vehicle_id = vehicle_id
-            fuel_entry.date = parsed_date
-            fuel_entry.time = time
-            fuel_entry.mileage = mileage
-            fuel_entry.fuel_amount = fuel_amount
-            fuel_entry.fuel_cost = fuel_cost
-            fuel_entry.fuel_type = fuel_type
-            fuel_entry.driving_pattern = driving_pattern
-            fuel_entry.notes = notes
-            fuel_entry.odometer_photo = odometer_photo
-            fuel_entry.updated_at = datetime.now().date()
-            
-            session.commit()
-            session.refresh(fuel_entry)
-            
-            print(f"Fuel entry updated: ID {entry_id}, Vehicle {vehicle_id}, Mileage {mileage:,}, Date {parsed_date}")
-            
-            return {
-                "success": True,
-                "message": "Fuel entry updated successfully",
-                "entry_id": fuel_entry.id,
-                "mileage": mileage,
-                "date": str(parsed_date)
-            }
-            
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+        session.execute(
+            update(FuelEntry)
+            .where(FuelEntry.id == entry_id)
+            .values(
+                vehicle_id=vehicle_id,
+                date=date,
+                time=time,
+                mileage=mileage,
+                fuel_amount=fuel_amount,
+                fuel_cost=fuel_cost,
+                fuel_type=fuel_type,
+                driving_pattern=driving_pattern,
+                notes=notes,
+                odometer_photo=odometer_photo,
+            )
+        )
+        sync_last_fuel_mileage(session, [previous_vehicle_id, vehicle_id])
+        session.commit()
+        invalidate_mpg_summary_cache()
+        invalidate_notifications_cache()
+        
+        logger.debug(
+            "Fuel entry updated: id=%s vehicle=%s mileage=%s date=%s", entry_id, vehicle_id, mileage, date
+        )
+        
+        return {
+            "success": True,
+            "message": "Fuel entry updated successfully",
+            "entry_id": entry_id,
+            "mileage": mileage,
+            "date": str(date)
+        }
             
     except Exception as e:
-        print(f"Error updating fuel entry: {e}")
+        session.rollback()
+        logger.error("Error updating fuel entry: %s", e)
         return {
             "success": False,
             "error": f"Failed to update fuel entry: {str(e)}"
@@ -2433,40 +2595,10 @@ async def update_fuel_entry(
 # ============================================================================
 
 @app.post("/api/future-maintenance")
-async def create_future_maintenance_api(
-    vehicle_id: int = Form(...),
-    maintenance_type: str = Form(...),
-    target_date: str = Form(),
-    target_mileage: int = Form(),
-    mileage_reminder: int = Form(100),
-    date_reminder: int = Form(30),
-    estimated_cost: float = Form(),
-    parts_link: str = Form(),
-    notes: str = Form(),
-    is_recurring: bool = Form(False),
-    recurrence_interval_miles: int = Form(),
-    recurrence_interval_months: int = Form()
-):
+def create_future_maintenance_api(payload: FutureMaintenanceIn):
     """Create a new future maintenance reminder"""
     try:
-        from data_operations import create_future_maintenance
-        
-        result = create_future_maintenance(
-            vehicle_id=vehicle_id,
-            maintenance_type=maintenance_type,
-            target_date=target_date,
-            target_mileage=target_mileage,
-            mileage_reminder=mileage_reminder,
-            date_reminder=date_reminder,
-            estimated_cost=estimated_cost,
-            parts_link=parts_link,
-            notes=notes,
-            is_recurring=is_recurring,
-            recurrence_interval_miles=recurrence_interval_miles,
-            recurrence_interval_months=recurrence_interval_months
-        )
-        
-        return result
+        return create_future_maintenance(**payload.model_dump())
         
     except Exception as e:
         return {
@@ -2475,42 +2607,10 @@ async def create_future_maintenance_api(
         }
 
 @app.put("/api/future-maintenance/{future_maintenance_id}")
-async def update_future_maintenance_api(
-    future_maintenance_id: int,
-    vehicle_id: int = Form(...),
-    maintenance_type: str = Form(...),
-    target_date: str = Form(),
-    target_mileage: int = Form(),
-    mileage_reminder: int = Form(100),
-    date_reminder: int = Form(30),
-    estimated_cost: float = Form(),
-    parts_link: str = Form(),
-    notes: str = Form(),
-    is_recurring: bool = Form(False),
-    recurrence_interval_miles: int = Form(),
-    recurrence_interval_months: int = Form()
-):
+def update_future_maintenance_api(future_maintenance_id: int, payload: FutureMaintenanceIn):
     """Update an existing future maintenance reminder"""
     try:
-        from data_operations import update_future_maintenance
-        
-        result = update_future_maintenance(
-            future_maintenance_id=future_maintenance_id,
-            vehicle_id=vehicle_id,
-            maintenance_type=maintenance_type,
-            target_date=target_date,
-            target_mileage=target_mileage,
-            mileage_reminder=mileage_reminder,
-            date_reminder=date_reminder,
-            estimated_cost=estimated_cost,
-            parts_link=parts_link,
-            notes=notes,
-            is_recurring=is_recurring,
-            recurrence_interval_miles=recurrence_interval_miles,
-            recurrence_interval_months=recurrence_interval_months
-        )
-        
-        return result
+        return update_future_maintenance(future_maintenance_id=future_maintenance_id, **payload.model_dump())
         
     except Exception as e:
         return {
@@ -2519,16 +2619,14 @@ async def update_future_maintenance_api(
         }
 
 @app.get("/api/future-maintenance/vehicle/{vehicle_id}")
-async def get_future_maintenance_by_vehicle_api(vehicle_id: int):
+def get_future_maintenance_by_vehicle_api(request: Request, vehicle_id: int):
     """Get future maintenance reminders for a specific vehicle"""
     try:
-        from data_operations import get_future_maintenance_by_vehicle
-        
         future_maintenance = get_future_maintenance_by_vehicle(vehicle_id)
-        return {
+        return _revalidated_json(request, {
             "success": True,
             "future_maintenance": future_maintenance
-        }
+        })
         
     except Exception as e:
         print(f"Error in get_future_maintenance_by_vehicle_api: {e}")
@@ -2538,17 +2636,15 @@ async def get_future_maintenance_by_vehicle_api(vehicle_id: int):
         }
 
 @app.get("/api/future-maintenance/single/{future_maintenance_id}")
-async def get_future_maintenance_by_id_api(future_maintenance_id: int):
+def get_future_maintenance_by_id_api(request: Request, future_maintenance_id: int):
     """Get a specific future maintenance reminder by ID"""
     try:
-        from data_operations import get_future_maintenance_by_id
-        
         future_maintenance = get_future_maintenance_by_id(future_maintenance_id)
         if future_maintenance:
-            return {
+            return _revalidated_json(request, {
                 "success": True,
                 "future_maintenance": future_maintenance
-            }
+            })
         else:
             return {
                 "success": False,
@@ -2563,14 +2659,14 @@ async def get_future_maintenance_by_id_api(future_maintenance_id: int):
         }
 
 @app.get("/api/future-maintenance")
-async def get_future_maintenance_api():
+def get_future_maintenance_api(request: Request):
     """Get all future maintenance reminders"""
     try:
         future_maintenance = get_all_future_maintenance()
-        return {
+        return _revalidated_json(request, {
             "success": True,
             "future_maintenance": future_maintenance
-        }
+        })
         
     except Exception as e:
         print(f"Error in get_future_maintenance_api: {e}")
@@ -2581,18 +2677,19 @@ async def get_future_maintenance_api():
 
 
 @app.get("/api/accounts")
-async def get_accounts_api():
+def get_accounts_api(request: Request):
     """Return all accounts with vehicle counts and default information."""
     payload = build_accounts_payload()
-    return {"success": True, **payload}
+    return _revalidated_json(request, {"success": True, **payload})
 
 
 @app.post("/api/accounts")
-async def create_account_api(payload: AccountCreateRequest):
+def create_account_api(payload: AccountCreateRequest):
     """Create a new account for the current owner."""
     result = create_account(payload.name, set_default=payload.set_default)
     if not result.get("success"):
         raise HTTPException(status_code=400, detail=result.get("error", "Failed to create account."))
+    invalidate_accounts_payload_cache()
 
     account_name = result["account"].name
     payload_data = build_accounts_payload()
@@ -2604,15 +2701,13 @@ async def create_account_api(payload: AccountCreateRequest):
 
 
 @app.patch("/api/accounts/{account_id}")
-async def rename_account_api(account_id: str, payload: AccountRenameRequest):
+def rename_account_api(account_id: str, payload: AccountRenameRequest):
     """Rename an existing account."""
-    account = get_account_by_id(account_id)
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found.")
-
     result = rename_account(account_id, payload.name)
     if not result.get("success"):
-        raise HTTPException(status_code=400, detail=result.get("error", "Failed to rename account."))
+        status_code = 404 if result.get("not_found") else 400
+        raise HTTPException(status_code=status_code, detail=result.get("error", "Failed to rename account."))
+    invalidate_accounts_payload_cache()
 
     payload_data = build_accounts_payload()
     return {
@@ -2623,63 +2718,57 @@ async def rename_account_api(account_id: str, payload: AccountRenameRequest):
 
 
 @app.delete("/api/accounts/{account_id}")
-async def delete_account_api(account_id: str):
+def delete_account_api(account_id: str):
     """Delete an account if it has no vehicles."""
-    account = get_account_by_id(account_id)
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found.")
-
     result = delete_account(account_id)
     if not result.get("success"):
-        raise HTTPException(status_code=400, detail=result.get("error", "Failed to delete account."))
+        status_code = 404 if result.get("not_found") else 400
+        raise HTTPException(status_code=status_code, detail=result.get("error", "Failed to delete account."))
+    invalidate_accounts_payload_cache()
 
     payload_data = build_accounts_payload()
     return {
         "success": True,
-        "message": f"Account '{account.name}' deleted.",
+        "message": f"Account '{result['account_name']}' deleted.",
         **payload_data,
     }
 
 
 @app.post("/api/accounts/{account_id}/default")
-async def set_default_account_api(account_id: str):
+def set_default_account_api(account_id: str):
     """Mark an account as the default selection."""
-    account = get_account_by_id(account_id)
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found.")
-
     result = set_default_account(account_id)
     if not result.get("success"):
-        raise HTTPException(status_code=400, detail=result.get("error", "Failed to set account as default."))
+        status_code = 404 if result.get("not_found") else 400
+        raise HTTPException(status_code=status_code, detail=result.get("error", "Failed to set account as default."))
+    invalidate_accounts_payload_cache()
 
     payload_data = build_accounts_payload()
     return {
         "success": True,
-        "message": f"'{account.name}' set as default account.",
+        "message": f"'{result['account'].name}' set as default account.",
         **payload_data,
     }
 
 
 @app.post("/api/vehicles/{vehicle_id}/transfer")
-async def transfer_vehicle_api(request: Request, vehicle_id: int, payload: VehicleTransferRequest):
+def transfer_vehicle_api(request: Request, vehicle_id: int, payload: VehicleTransferRequest):
     """Move a vehicle to another account."""
     account_context = get_account_context(request)
-    account_id = account_context["account_id"] if account_context["scope"] != "all" else None
+    account_id = account_context.account_id if account_context.scope != "all" else None
 
-    vehicle = get_vehicle_by_id(vehicle_id, account_id=account_id)
+    vehicle = get_request_vehicle(request, vehicle_id, account_id)
     if not vehicle:
         raise HTTPException(status_code=404, detail="Vehicle not found.")
 
-    target_account = get_account_by_id(payload.account_id)
-    if not target_account:
-        raise HTTPException(status_code=404, detail="Target account not found.")
-
     result = transfer_vehicle_to_account(vehicle_id, payload.account_id)
     if not result.get("success"):
-        raise HTTPException(status_code=400, detail=result.get("error", "Failed to transfer vehicle."))
+        status_code = 404 if result.get("not_found") else 400
+        raise HTTPException(status_code=status_code, detail=result.get("error", "Failed to transfer vehicle."))
+    invalidate_accounts_payload_cache()
 
     vehicle_obj = result.get("vehicle", vehicle)
-    message = result.get("message", f"Vehicle moved to {target_account.name}.")
+    message = result["message"]
     payload_data = build_accounts_payload()
     return {
         "success": True,
@@ -2692,41 +2781,40 @@ async def transfer_vehicle_api(request: Request, vehicle_id: int, payload: Vehic
     }
 
 
-@app.get("/api/vehicles")
-async def list_vehicles_api(
+@app.get("/api/vehicles", response_class=ORJSONResponse)
+def list_vehicles_api(
     accountId: Optional[str] = Query(None),
     accountName: Optional[str] = Query(None),
 ):
     """List vehicles filtered by account when provided."""
     account_id = resolve_account_filter(accountId, accountName)
     vehicles = get_all_vehicles(account_id=account_id)
-    return {
+    # Returned directly so orjson encodes the rows without a jsonable_encoder pass
+    return ORJSONResponse({
         "success": True,
         "account_id": account_id,
         "vehicles": [serialize_vehicle_for_api(vehicle) for vehicle in vehicles],
-    }
+    })
 
 
-@app.get("/api/maintenance")
-async def list_maintenance_api(
+@app.get("/api/maintenance", response_class=ORJSONResponse)
+def list_maintenance_api(
     accountId: Optional[str] = Query(None),
     accountName: Optional[str] = Query(None),
 ):
     """List maintenance records filtered by account when provided."""
     account_id = resolve_account_filter(accountId, accountName)
     records = get_all_maintenance_records(account_id=account_id)
-    return {
+    return ORJSONResponse({
         "success": True,
         "account_id": account_id,
         "records": [serialize_maintenance_record(record) for record in records],
-    }
+    })
 
 @app.delete("/api/future-maintenance/{future_maintenance_id}")
-async def delete_future_maintenance_api(future_maintenance_id: int):
+def delete_future_maintenance_api(future_maintenance_id: int):
     """Delete a future maintenance reminder"""
     try:
-        from data_operations import delete_future_maintenance
-        
         result = delete_future_maintenance(future_maintenance_id)
         return result
         
@@ -2737,27 +2825,49 @@ async def delete_future_maintenance_api(future_maintenance_id: int):
             "error": f"Failed to delete future maintenance: {str(e)}"
         }
 
+# The badge is polled; browsers may reuse a response briefly, then revalidate by ETag
+_NOTIFICATIONS_CACHE_CONTROL = "private, max-age=30"
+
+
 @app.get("/api/notifications")
-async def get_notifications_api():
+async def get_notifications_api(request: Request):
     """Get all maintenance notifications (oil changes + future maintenance)"""
+    # Payload cached in data_operations and cleared by its write paths
+    cached, generation = get_cached_notifications()
+    if cached is not None:
+        return _revalidated_json(request, cached, _NOTIFICATIONS_CACHE_CONTROL)
+
     try:
-        from data_operations import (
-            get_all_vehicles,
-            get_triggered_future_maintenance,
-            get_vehicle_current_mileage,
-            get_oil_status_for_all,
-        )
-        
         notifications = []
         total_count = 0
         has_overdue = False
         
-        # Get all vehicles to map vehicle_id to account_id
-        vehicles = get_all_vehicles()
-        vehicle_to_account = {vehicle.id: vehicle.account_id for vehicle in vehicles}
+        # Vehicles, current mileage and triggered reminders in one batched load, and the
+        # oil statuses alongside it; the two sync DB helpers are independent, so they run
+        # concurrently in the threadpool and the event loop stays free
+        bundle, oil_statuses = await asyncio.gather(
+            run_in_threadpool(get_notifications_bundle),
+            run_in_threadpool(get_oil_status_for_all),
+        )
+        vehicles = bundle["vehicles"]
+        triggered_maintenance = bundle["triggered_maintenance"]
+        vehicle_to_account = {vehicle["id"]: vehicle["account_id"] for vehicle in vehicles}
+        
+        # Maintenance page link per (account, vehicle): accountId and vehicleId when set.
+        # Notifications for the same vehicle share one string
+        link_urls = {}
+        
+        def maintenance_link(account_id, vehicle_id):
+            key = (account_id, vehicle_id)
+            link_url = link_urls.get(key)
+            if link_url is None:
+                params = urlencode(
+                    [(name, value) for name, value in (("accountId", account_id), ("vehicleId", vehicle_id)) if value]
+                )
+                link_url = link_urls[key] = f"/maintenance?{params}" if params else "/maintenance"
+            return link_url
         
         # Oil change notifications using unified status helper
-        oil_statuses = get_oil_status_for_all()
         for status in oil_statuses:
             if status["state"] not in ("soon", "due"):
                 continue
@@ -2766,61 +2876,42 @@ async def get_notifications_api():
                 has_overdue = True
             
             vehicle_id = status['vehicle_id']
-            account_id = vehicle_to_account.get(vehicle_id)
-            
-            # Build link_url: always include accountId, include vehicleId if available
-            # If account_id is None, use empty string or omit it (shouldn't happen for vehicles)
-            link_url = f"/maintenance?accountId={account_id}" if account_id else "/maintenance"
-            if vehicle_id:
-                link_url += f"&vehicleId={vehicle_id}" if account_id else f"?vehicleId={vehicle_id}"
             
             notifications.append(
                 {
                     "type": "Oil Change",
                     "vehicle": status["vehicle_name"],
                     "urgency": urgency,
-                    "link_url": link_url,
+                    "link_url": maintenance_link(vehicle_to_account.get(vehicle_id), vehicle_id),
                 }
             )
             total_count += 1
         
         for vehicle in vehicles:
-            mileage_info = get_vehicle_current_mileage(vehicle.id)
-            current_mileage = mileage_info.get('current_mileage', 0) or 0
-            
-            try:
-                future_maintenance = get_triggered_future_maintenance(vehicle.id, current_mileage)
-                for item in future_maintenance:
-                    maintenance_type = (item.get('maintenance_type') or "").lower()
-                    if "oil" in maintenance_type:
-                        # Oil reminders already handled via unified helper
-                        continue
-                    if item['urgency'] in ['high', 'medium']:  # Only show overdue and due soon
-                        if item['urgency'] == 'high':
-                            has_overdue = True
-                        
-                        # Build link_url: always include accountId, include vehicleId if available
-                        # Vehicles always have account_id (required field), but handle gracefully if missing
-                        link_url = f"/maintenance?accountId={vehicle.account_id}" if vehicle.account_id else "/maintenance"
-                        if vehicle.id:
-                            link_url += f"&vehicleId={vehicle.id}" if vehicle.account_id else f"?vehicleId={vehicle.id}"
-                        
-                        notifications.append({
-                            'type': item['maintenance_type'],
-                            'vehicle': f"{vehicle.year} {vehicle.make} {vehicle.model}",
-                            'urgency': item['urgency'],
-                            'link_url': link_url
-                        })
-                        total_count += 1
-            except Exception as e:
-                continue
-        
-        return {
+            for item in triggered_maintenance.get(vehicle["id"], []):
+                if OIL_TYPE_RE.search(item.get('maintenance_type') or ""):
+                    # Oil reminders already handled via unified helper
+                    continue
+                if item['urgency'] in ['high', 'medium']:  # Only show overdue and due soon
+                    if item['urgency'] == 'high':
+                        has_overdue = True
+                    
+                    notifications.append({
+                        'type': item['maintenance_type'],
+                        'vehicle': f"{vehicle['year']} {vehicle['make']} {vehicle['model']}",
+                        'urgency': item['urgency'],
+                        'link_url': maintenance_link(vehicle["account_id"], vehicle["id"])
+                    })
+                    total_count += 1
+        
+        payload = {
             "success": True,
             "notifications": notifications,
             "total_count": total_count,
             "has_overdue": has_overdue
         }
+        cache_notifications(payload, generation)
+        return _revalidated_json(request, payload, _NOTIFICATIONS_CACHE_CONTROL)
         
     except Exception as e:
         print(f"Error in get_notifications_api: {e}")
@@ -2834,79 +2925,39 @@ async def get_notifications_api():
             "has_overdue": False
         }
 
-@app.get("/cleanup-oil-analysis", response_class=HTMLResponse)
+# Maintenance/debug tools that scan or bulk-delete records; only mounted when
+# ENABLE_DEBUG_ROUTES=true is set explicitly (ENV defaults to dev, so it can't gate them)
+debug_router = APIRouter()
+
+@debug_router.get("/cleanup-oil-analysis", response_class=HTMLResponse)
 async def cleanup_oil_analysis():
     """Clean up oil analysis records for testing"""
     try:
-        from data_operations import get_all_maintenance_records, delete_maintenance_record
-        
-        # Get all maintenance records
-        all_records = get_all_maintenance_records()
-        
         # Find oil analysis records (records with oil analysis data)
-        oil_analysis_records = [
-            record for record in all_records 
-            if (record.oil_analysis_date or record.oil_analysis_cost or 
-                record.iron_level or record.aluminum_level or record.copper_level or
-                "analysis" in record.description.lower())
-        ]
+        oil_analysis_records = get_oil_analysis_records()
         
-        deleted_count = 0
         errors = []
         
-        # Delete each oil analysis record
-        for record in oil_analysis_records:
-            try:
-                result = delete_maintenance_record(record.id)
-                if result.get("success", False):
-                    deleted_count += 1
-                else:
-                    errors.append(f"Failed to delete record {record.id}: {result.get('error', 'Unknown error')}")
-            except Exception as e:
-                errors.append(f"Error deleting record {record.id}: {str(e)}")
-        
-        # Generate HTML response
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Oil Analysis Cleanup</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; background-color: #f5f5f5; }}
-                .container {{ max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-                .success {{ color: #27ae60; background: #d5f4e6; padding: 15px; border-radius: 5px; margin: 10px 0; }}
-                .error {{ color: #e74c3c; background: #fadbd8; padding: 15px; border-radius: 5px; margin: 10px 0; }}
-                .info {{ color: #3498db; background: #ebf3fd; padding: 15px; border-radius: 5px; margin: 10px 0; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>Oil Analysis Cleanup Results</h1>
-                
-                <div class="info">
-                    <h3>Found {len(oil_analysis_records)} oil analysis records</h3>
-                </div>
-                
-                <div class="success">
-                    <h3>✅ Successfully deleted: {deleted_count} records</h3>
-                </div>
-                
-                {f'<div class="error"><h3>❌ Errors: {len(errors)}</h3><ul>{"".join(f"<li>{error}</li>" for error in errors)}</ul></div>' if errors else ''}
-                
-                <div class="info">
-                    <h3>Deleted Records:</h3>
-                    <ul>
-                        {"".join(f"<li>ID {record.id}: {record.description} (Mileage: {record.mileage:,})</li>" for record in oil_analysis_records)}
-                    </ul>
-                </div>
-                
-                <p><a href="/oil-analysis/1">← Back to Oil Analysis</a></p>
-            </div>
-        </body>
-        </html>
-        """
+        # Delete every oil analysis record in one statement
+        result = delete_oil_analysis_records([record.id for record in oil_analysis_records])
+        if result.get("success", False):
+            deleted_ids = set(result["deleted_ids"])
+            errors.extend(
+                f"Failed to delete record {record.id}: Maintenance record not found"
+                for record in oil_analysis_records if record.id not in deleted_ids
+            )
+        else:
+            deleted_ids = set()
+            errors.append(f"Failed to delete records: {result.get('error', 'Unknown error')}")
+        deleted_count = len(deleted_ids)
         
-        return HTMLResponse(content=html_content)
+        template = (
+            templates.get_template("cleanup_oil_analysis.html") if APP_IS_DEV else _CLEANUP_OIL_ANALYSIS_TEMPLATE
+        )
+        # Rendered here rather than streamed so template errors reach the except below
+        return HTMLResponse(
+            content=template.render(records=oil_analysis_records, deleted_count=deleted_count, errors=errors)
+        )
         
     except Exception as e:
         error_html = f"""
@@ -2922,12 +2973,10 @@ async def cleanup_oil_analysis():
         """
         return HTMLResponse(content=error_html)
 
-@app.get("/debug-oil-linking/{vehicle_id}")
+@debug_router.get("/debug-oil-linking/{vehicle_id}")
 async def debug_oil_linking(vehicle_id: int):
     """Debug oil change linking issues"""
     try:
-        from data_operations import get_maintenance_records_by_vehicle
-        
         # Get all maintenance records for this vehicle
         records = get_maintenance_records_by_vehicle(vehicle_id)
         
@@ -2973,8 +3022,11 @@ async def debug_oil_linking(vehicle_id: int):
         }
         
         # Check for mileage matches
+        oil_changes_by_mileage = defaultdict(list)
+        for oc in oil_change_records:
+            oil_changes_by_mileage[oc.mileage].append(oc)
         for analysis in oil_analysis_records:
-            matches = [oc for oc in oil_change_records if oc.mileage == analysis.mileage]
+            matches = oil_changes_by_mileage.get(analysis.mileage, [])
             if matches:
                 debug_info["mileage_matches"].append({
                     "analysis_id": analysis.id,
@@ -2987,24 +3039,29 @@ async def debug_oil_linking(vehicle_id: int):
     except Exception as e:
         return {"error": str(e)}
 
+if os.getenv("ENABLE_DEBUG_ROUTES", "false").lower() == "true":
+    app.include_router(debug_router)
+
+# Sort key for vehicles with no oil activity: the import placeholder date, so they sort last
+_NO_ACTIVITY_DATE = date(1900, 1, 1)
+
 @app.get("/oil-management", response_class=HTMLResponse)
 async def oil_management_new(request: Request):
     """New Oil Management page with collapsible cards and smart linking"""
     try:
-        from data_operations import (
-            get_all_vehicles,
-            get_maintenance_records_by_vehicle,
-            get_oil_status_for_all,
-        )
-        
         account_context = get_account_context(request)
-        account_id = account_context["account_id"] if account_context["scope"] != "all" else None
+        account_id = account_context.account_id if account_context.scope != "all" else None
 
         # Get vehicles scoped to the active account (or all)
         vehicles = get_all_vehicles(account_id=account_id)
         oil_status_list = get_oil_status_for_all(account_id=account_id)
         oil_status_map = {status["vehicle_id"]: status for status in oil_status_list}
 
+        # Records and active oil change reminders for every vehicle, one query each, bucketed by vehicle_id
+        oil_rows = get_oil_management_records([vehicle.id for vehicle in vehicles], account_id=account_id)
+        records_by_vehicle = oil_rows["records"]
+        future_oil_changes_by_vehicle = oil_rows["future_oil_changes"]
+
         def _format_date(value):
             if isinstance(value, date):
                 return value.strftime("%m/%d/%Y")
@@ -3019,49 +3076,33 @@ async def oil_management_new(request: Request):
                 return value
 
         vehicles_oil_data = []
+        most_recent_vehicle_id = None
+        most_recent_activity_date = None
         
         for vehicle in vehicles:
-            # Get all maintenance records for this vehicle under the same account scope
-            records = get_maintenance_records_by_vehicle(vehicle.id, account_id=account_id)
+            # All maintenance records for this vehicle under the same account scope
+            records = records_by_vehicle.get(vehicle.id, [])
             
             # Filter oil changes (records marked as oil changes)
             oil_changes = [r for r in records if r.is_oil_change]
             oil_changes.sort(key=lambda x: x.date, reverse=True)  # Most recent first
             
-            # Get future maintenance records for oil changes
-            from database import get_session
-            from models import FutureMaintenance
-            from sqlmodel import select
-            
-            session = next(get_session())
-            try:
-                future_maintenance = session.execute(
-                    select(FutureMaintenance)
-                    .where(FutureMaintenance.vehicle_id == vehicle.id)
-                    .where(FutureMaintenance.is_active == True)
-                ).scalars().all()
-                future_oil_changes = [fm for fm in future_maintenance if fm.maintenance_type == "Oil Change"]
-            finally:
-                session.close()
+            # Active future maintenance records for oil changes
+            future_oil_changes = future_oil_changes_by_vehicle.get(vehicle.id, [])
             
             # Filter oil analysis records
-            oil_analysis = [
-                r for r in records 
-                if (r.oil_analysis_date or r.oil_analysis_cost or 
-                    r.iron_level or r.aluminum_level or r.copper_level or
-                    (r.description and "analysis" in r.description.lower()))
-            ]
+            oil_analysis = [r for r in records if r.is_oil_analysis]
             oil_analysis.sort(key=lambda x: x.date, reverse=True)  # Most recent first
             
             # Determine analysis status
             analysis_status = 'none'
             if oil_analysis:
                 # Check if any analysis is linked to oil changes
-                linked_analysis = []
-                for analysis in oil_analysis:
-                    matching_oil_changes = [oc for oc in oil_changes if oc.mileage == analysis.mileage]
-                    if matching_oil_changes:
-                        linked_analysis.append(analysis)
+                oil_change_by_mileage = {oc.mileage: oc for oc in oil_changes}
+                linked_analysis = [
+                    analysis for analysis in oil_analysis
+                    if analysis.mileage in oil_change_by_mileage
+                ]
                 
                 if linked_analysis:
                     analysis_status = 'linked'
@@ -3098,6 +3139,41 @@ async def oil_management_new(request: Request):
                 except (TypeError, ValueError):
                     next_due_miles = None
 
+            # JSON-safe copy for the page script, built in the same pass
+            json_vehicle_data = {
+                'vehicle': {
+                    'id': vehicle.id,
+                    'name': vehicle.name
+                },
+                'latest_mileage': latest_mileage,
+                'latest_date_str': latest_date.strftime('%Y-%m-%d') if latest_date else None,
+                'analysis_status': analysis_status,
+                'oil_changes': [
+                    {
+                        'id': oil_change.id,
+                        'mileage': oil_change.mileage,
+                        'date': oil_change.date.strftime('%Y-%m-%d'),
+                        'oil_type': oil_change.oil_type,
+                        'oil_brand': oil_change.oil_brand,
+                        'cost': float(oil_change.cost) if oil_change.cost else None
+                    }
+                    for oil_change in oil_changes
+                ],
+                'oil_analysis': [
+                    {
+                        'id': analysis.id,
+                        'mileage': analysis.mileage,
+                        'date': analysis.date.strftime('%Y-%m-%d'),
+                        'oil_analysis_report': analysis.oil_analysis_report
+                    }
+                    for analysis in oil_analysis
+                ],
+            }
+            # The latest oil change is the head of oil_changes, so reuse its converted entry
+            json_vehicle_data['latest_oil_change'] = (
+                json_vehicle_data['oil_changes'][0] if latest_oil_change else None
+            )
+
             vehicles_oil_data.append({
                 'vehicle': vehicle,
                 'oil_changes': oil_changes,
@@ -3115,73 +3191,19 @@ async def oil_management_new(request: Request):
                     'next_due_miles': next_due_miles,
                     'next_due_date': _format_date(status.get('due_date')),
                 },
+                'json_data': json_vehicle_data,
             })
-        
-        # Find the vehicle with the most recent activity for default expansion
-        most_recent_vehicle_id = None
-        if vehicles_oil_data:
-            # Find vehicle with most recent activity
-            most_recent_activity_date = None
-            for vehicle_data in vehicles_oil_data:
-                if vehicle_data['most_recent_activity']:
-                    if not most_recent_activity_date or vehicle_data['most_recent_activity'] > most_recent_activity_date:
-                        most_recent_activity_date = vehicle_data['most_recent_activity']
-                        most_recent_vehicle_id = vehicle_data['vehicle'].id
+
+            # Track the vehicle with the most recent activity for default expansion
+            if most_recent_activity and (
+                not most_recent_activity_date or most_recent_activity > most_recent_activity_date
+            ):
+                most_recent_activity_date = most_recent_activity
+                most_recent_vehicle_id = vehicle.id
         
         # Sort by most recent activity by default (most recent first)
-        vehicles_oil_data.sort(key=lambda x: x['most_recent_activity'] or date(1900, 1, 1), reverse=True)
-        
-        # Convert data to JSON-serializable format
-        json_safe_data = []
-        for vehicle_data in vehicles_oil_data:
-            # Convert vehicle data
-            json_vehicle_data = {
-                'vehicle': {
-                    'id': vehicle_data['vehicle'].id,
-                    'name': vehicle_data['vehicle'].name
-                },
-                'latest_mileage': vehicle_data['latest_mileage'],
-                'latest_date_str': vehicle_data['latest_date'].strftime('%Y-%m-%d') if vehicle_data['latest_date'] else None,
-                'analysis_status': vehicle_data['analysis_status'],
-                'oil_changes': [],
-                'oil_analysis': []
-            }
-            
-            # Convert latest oil change
-            if vehicle_data['latest_oil_change']:
-                latest = vehicle_data['latest_oil_change']
-                json_vehicle_data['latest_oil_change'] = {
-                    'id': latest.id,
-                    'mileage': latest.mileage,
-                    'date': latest.date.strftime('%Y-%m-%d'),
-                    'oil_type': latest.oil_type,
-                    'oil_brand': latest.oil_brand,
-                    'cost': float(latest.cost) if latest.cost else None
-                }
-            else:
-                json_vehicle_data['latest_oil_change'] = None
-                
-            # Convert oil changes
-            for oil_change in vehicle_data['oil_changes']:
-                json_vehicle_data['oil_changes'].append({
-                    'id': oil_change.id,
-                    'mileage': oil_change.mileage,
-                    'date': oil_change.date.strftime('%Y-%m-%d'),
-                    'oil_type': oil_change.oil_type,
-                    'oil_brand': oil_change.oil_brand,
-                    'cost': float(oil_change.cost) if oil_change.cost else None
-                })
-                
-            # Convert analysis records
-            for analysis in vehicle_data['oil_analysis']:
-                json_vehicle_data['oil_analysis'].append({
-                    'id': analysis.id,
-                    'mileage': analysis.mileage,
-                    'date': analysis.date.strftime('%Y-%m-%d'),
-                    'oil_analysis_report': analysis.oil_analysis_report
-                })
-                
-            json_safe_data.append(json_vehicle_data)
+        vehicles_oil_data.sort(key=lambda x: x['most_recent_activity'] or _NO_ACTIVITY_DATE, reverse=True)
+        json_safe_data = [vehicle_data['json_data'] for vehicle_data in vehicles_oil_data]
         
         return templates.TemplateResponse("oil_management_new.html", {
             "request": request,
@@ -3201,11 +3223,8 @@ async def oil_management_new(request: Request):
 @app.get("/uploads/{filename}")
 async def serve_photo(filename: str):
     """Serve uploaded photos"""
-    import os
-    from fastapi.responses import FileResponse
-    
-    file_path = f"uploads/{filename}"
-    if os.path.exists(file_path):
+    file_path = os.path.join(UPLOAD_DIR, filename)
+    if os.path.isfile(file_path):
         return FileResponse(file_path)
     else:
         raise HTTPException(status_code=404, detail="Photo not found")
@@ -3214,10 +3233,6 @@ async def serve_photo(filename: str):
 async def view_oil_analysis_pdf(record_id: int):
     """View uploaded oil analysis PDF"""
     try:
-        from data_operations import get_maintenance_by_id
-        import os
-        from fastapi.responses import FileResponse
-        
         record = get_maintenance_by_id(record_id)
         if not record:
             raise HTTPException(status_code=404, detail="Oil analysis record not found")
@@ -0,0 +1,38 @@
+from sqlalchemy import text, inspect
+from database import engine
+
+
+def column_exists(engine, table, column):
+    inspector = inspect(engine)
+    columns = [c["name"] for c in inspector.get_columns(table)]
+    return column in columns
+
+
+# Vehicles that have fuel entries but no stored last mileage yet
+BACKFILL_SQL = """
+UPDATE vehicle
+SET last_fuel_mileage = (
+    SELECT MAX(fuelentry.mileage) FROM fuelentry WHERE fuelentry.vehicle_id = vehicle.id
+)
+WHERE last_fuel_mileage IS NULL
+  AND EXISTS (SELECT 1 FROM fuelentry WHERE fuelentry.vehicle_id = vehicle.id)
+"""
+
+
+def run():
+    with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            conn.execute(text("ALTER TABLE vehicle ADD COLUMN IF NOT EXISTS last_fuel_mileage INTEGER"))
+        elif column_exists(engine, "vehicle", "last_fuel_mileage"):
+            print("✅ last_fuel_mileage already exists (SQLite)")
+        else:
+            print("Adding last_fuel_mileage to SQLite…")
+            conn.execute(text("ALTER TABLE vehicle ADD COLUMN last_fuel_mileage INTEGER"))
+
+        conn.execute(text(BACKFILL_SQL))
+
+    print("🎉 last_fuel_mileage migration complete")
+
+
+if __name__ == "__main__":
+    run()
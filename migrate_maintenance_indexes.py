@@ -0,0 +1,61 @@
+from sqlalchemy import text
+from database import engine
+
+
+# (index name, table, columns, partial index predicate) for lookup paths that create_all
+# only covers on new tables
+INDEXES = (
+    ("ix_maintenancerecord_vehicle_mileage", "maintenancerecord", "vehicle_id, mileage", None),
+    ("ix_fuelentry_vehicle_mileage", "fuelentry", "vehicle_id, mileage", None),
+    ("ix_maintenancerecord_vehicle_date", "maintenancerecord", "vehicle_id, date", None),
+    ("ix_futuremaintenance_vehicle_type_active", "futuremaintenance", "vehicle_id, maintenance_type", "is_active"),
+)
+
+
+def _where(predicate):
+    if predicate is None:
+        return ""
+    # SQLite stores booleans as integers and only uses a partial index whose WHERE
+    # matches the query's, which SQLAlchemy renders as "= 1"
+    return f" WHERE {predicate}" if engine.dialect.name == "postgresql" else f" WHERE {predicate} = 1"
+
+
+# An index left INVALID by an interrupted concurrent build, excluding one another
+# process is still building (pg_stat_progress_create_index, PostgreSQL 12+)
+INVALID_INDEX_SQL = """
+SELECT 1 FROM pg_index i
+WHERE i.indexrelid = to_regclass(:name)
+  AND NOT i.indisvalid
+  AND NOT EXISTS (SELECT 1 FROM pg_stat_progress_create_index p WHERE p.index_relid = i.indexrelid)
+"""
+
+
+def create_index_concurrently(conn, name, definition):
+    """CREATE INDEX CONCURRENTLY IF NOT EXISTS on an AUTOCOMMIT connection (PostgreSQL).
+
+    A failed concurrent build leaves an INVALID index behind that IF NOT EXISTS would
+    skip on every later run, so one is dropped and rebuilt first.
+    """
+    if conn.execute(text(INVALID_INDEX_SQL), {"name": name}).first():
+        print(f"⚠️ {name} is INVALID from an interrupted build, rebuilding it")
+        conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+    conn.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}"))
+
+
+def run():
+    if engine.dialect.name == "postgresql":
+        # Build concurrently so live tables stay writable; CONCURRENTLY cannot run
+        # inside a transaction, hence autocommit
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            for name, table, columns, predicate in INDEXES:
+                create_index_concurrently(conn, name, f"ON {table} ({columns}){_where(predicate)}")
+    else:
+        with engine.begin() as conn:
+            for name, table, columns, predicate in INDEXES:
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns}){_where(predicate)}"))
+
+    print("🎉 maintenance index migration complete")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,59 @@
+from sqlalchemy import text, inspect
+from database import engine
+from migrate_maintenance_indexes import create_index_concurrently
+from models import OIL_ANALYSIS_SQL
+
+
+def column_exists(engine, table, column):
+    inspector = inspect(engine)
+    columns = [c["name"] for c in inspector.get_columns(table)]
+    return column in columns
+
+
+INDEX_NAME = "ix_maintenancerecord_vehicle_oil_analysis"
+
+
+def ensure_applied():
+    """Raise if run() has not been applied to this database.
+
+    Adding the STORED column rewrites maintenancerecord under an exclusive lock on
+    PostgreSQL, so it runs as a deploy step (make dev-migrate / preDeployCommand)
+    rather than at app startup; startup only checks for it.
+    """
+    if not column_exists(engine, "maintenancerecord", "is_oil_analysis"):
+        raise RuntimeError(
+            "maintenancerecord.is_oil_analysis is missing; run "
+            "`python3 migrate_oil_analysis_flag.py` (make dev-migrate) before starting the app"
+        )
+
+
+def run():
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE maintenancerecord ADD COLUMN IF NOT EXISTS is_oil_analysis BOOLEAN "
+                f"GENERATED ALWAYS AS ({OIL_ANALYSIS_SQL}) STORED"
+            ))
+        # Same concurrent build (and INVALID index recovery) as the other maintenance indexes
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            create_index_concurrently(conn, INDEX_NAME, "ON maintenancerecord (vehicle_id, is_oil_analysis)")
+    else:
+        with engine.begin() as conn:
+            if column_exists(engine, "maintenancerecord", "is_oil_analysis"):
+                print("✅ is_oil_analysis already exists (SQLite)")
+            else:
+                # SQLite can only add VIRTUAL generated columns to an existing table
+                print("Adding is_oil_analysis to SQLite…")
+                conn.execute(text(
+                    "ALTER TABLE maintenancerecord ADD COLUMN is_oil_analysis BOOLEAN "
+                    f"GENERATED ALWAYS AS ({OIL_ANALYSIS_SQL}) VIRTUAL"
+                ))
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON maintenancerecord (vehicle_id, is_oil_analysis)"
+            ))
+
+    print("🎉 is_oil_analysis migration complete")
+
+
+if __name__ == "__main__":
+    run()
@@ -3,10 +3,21 @@ from typing import Optional, List
 from datetime import date as date_type, datetime
 from pydantic import ConfigDict
 from uuid import uuid4
-from sqlalchemy import UniqueConstraint, Column, JSON
+from sqlalchemy import UniqueConstraint, Boolean, Column, Computed, Index, JSON, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 
 
+# Same test the oil pages used to apply in Python: any analysis data, or "analysis" in the description
+OIL_ANALYSIS_SQL = (
+    "oil_analysis_date IS NOT NULL"
+    " OR COALESCE(oil_analysis_cost, 0) <> 0"
+    " OR COALESCE(iron_level, 0) <> 0"
+    " OR COALESCE(aluminum_level, 0) <> 0"
+    " OR COALESCE(copper_level, 0) <> 0"
+    " OR COALESCE(lower(description) LIKE '%analysis%', FALSE)"
+)
+
+
 def generate_uuid() -> str:
     """Return a UUID4 string as a string value."""
     return str(uuid4())
@@ -40,6 +51,8 @@ class Vehicle(SQLModel, table=True):
     make: str = Field(max_length=50)
     model: str = Field(max_length=50)
     vin: Optional[str] = Field(default=None, max_length=17, unique=True)  # Prevent duplicate VINs
+    # Highest fuel entry odometer reading; maintained by the fuel entry write paths
+    last_fuel_mileage: Optional[int] = Field(default=None)
     
     # Email notification fields (temporarily commented out until database migration)
     # email_notification_email: Optional[str] = Field(default=None, max_length=255, description="Email address for maintenance notifications")
@@ -70,6 +83,11 @@ class Vehicle(SQLModel, table=True):
 class MaintenanceRecord(SQLModel, table=True):
     """Maintenance record model"""
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        Index("ix_maintenancerecord_vehicle_mileage", "vehicle_id", "mileage"),
+        Index("ix_maintenancerecord_vehicle_date", "vehicle_id", "date"),
+        Index("ix_maintenancerecord_vehicle_oil_analysis", "vehicle_id", "is_oil_analysis"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     vehicle_id: int = Field(foreign_key="vehicle.id")
@@ -105,6 +123,12 @@ class MaintenanceRecord(SQLModel, table=True):
     driving_conditions: Optional[str] = Field(default=None, max_length=50, description="Driving conditions (severe, normal, towing)")
     oil_consumption_notes: Optional[str] = Field(default=None, max_length=500, description="Notes about oil consumption between changes")
     
+    # Generated by the database from the fields above; never set it directly
+    is_oil_analysis: Optional[bool] = Field(
+        default=None,
+        sa_column=Column(Boolean, Computed(OIL_ANALYSIS_SQL, persisted=True)),
+    )
+    
     # Oil Analysis Linking
     linked_oil_change_id: Optional[int] = Field(default=None, description="ID of the oil change this analysis is linked to")
     
@@ -122,6 +146,9 @@ class MaintenanceRecord(SQLModel, table=True):
 class FuelEntry(SQLModel, table=True):
     """Fuel entry model for tracking fill-ups"""
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        Index("ix_fuelentry_vehicle_mileage", "vehicle_id", "mileage"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     vehicle_id: int = Field(foreign_key="vehicle.id")
@@ -134,8 +161,19 @@ class FuelEntry(SQLModel, table=True):
     driving_pattern: str = Field(max_length=20, description="highway, city, mixed")
     notes: Optional[str] = Field(default=None, max_length=500)
     odometer_photo: Optional[str] = Field(default=None, description="Base64 encoded image or file path")
-    created_at: Optional[date_type] = Field(default_factory=date_type.today)
-    updated_at: Optional[date_type] = Field(default_factory=date_type.today)
+    # Stamped with the database's CURRENT_DATE on insert (and update, for updated_at)
+    created_at: Optional[date_type] = Field(
+        default=None,
+        sa_column_kwargs={"default": func.current_date(), "server_default": text("CURRENT_DATE")},
+    )
+    updated_at: Optional[date_type] = Field(
+        default=None,
+        sa_column_kwargs={
+            "default": func.current_date(),
+            "onupdate": func.current_date(),
+            "server_default": text("CURRENT_DATE"),
+        },
+    )
     
     # Relationship to vehicle
     vehicle: Vehicle = Relationship(back_populates="fuel_entries")
@@ -144,6 +182,13 @@ class FuelEntry(SQLModel, table=True):
 class FutureMaintenance(SQLModel, table=True):
     """Future maintenance reminder model"""
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        # Active reminders of one type per vehicle (e.g. the oil management page's "Oil Change")
+        Index(
+            "ix_futuremaintenance_vehicle_type_active", "vehicle_id", "maintenance_type",
+            postgresql_where=text("is_active"), sqlite_where=text("is_active = 1"),
+        ),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     vehicle_id: int = Field(foreign_key="vehicle.id")
@@ -1,9 +1,10 @@
 from decimal import Decimal, InvalidOperation
 import re
 from typing import Optional, Literal
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
+from pydantic_core import core_schema
 
 
 def to_decimal(val):
@@ -43,6 +44,54 @@ def normalize_date_str(val: Optional[str]) -> Optional[str]:
   raise ValueError("Invalid date format (use MM/DD/YYYY or YYYY-MM-DD)")
 
 
+def parse_date_string(date_string) -> date:
+  """Parse a date given as MM/DD/YYYY (current) or YYYY-MM-DD (legacy); date objects pass through"""
+  if isinstance(date_string, date):
+    return date_string
+  text = str(date_string).strip() if date_string is not None else ""
+  if not text or text == "0":
+    raise ValueError("Date string cannot be empty")
+  for fmt in ("%m/%d/%Y", "%Y-%m-%d"):
+    try:
+      return datetime.strptime(text, fmt).date()
+    except ValueError:
+      pass
+  raise ValueError("Invalid date format. Use MM/DD/YYYY or YYYY-MM-DD")
+
+
+class FormDate(date):
+  """Date field (form or JSON) accepting the app's MM/DD/YYYY as well as ISO YYYY-MM-DD.
+
+  Validates to a plain date; bad input fails request validation with a 422
+  instead of reaching the handler.
+  """
+
+  @classmethod
+  def __get_pydantic_core_schema__(cls, source, handler):
+    return core_schema.no_info_before_validator_function(parse_date_string, core_schema.date_schema())
+
+
+class FutureMaintenanceIn(BaseModel):
+  """JSON body for creating or updating a future maintenance reminder.
+
+  Defaults match data_operations.create_future_maintenance; a "0" target
+  date or 0 target mileage means "not set".
+  """
+
+  vehicle_id: int
+  maintenance_type: str
+  target_date: str = "0"
+  target_mileage: int = 0
+  mileage_reminder: int = 100
+  date_reminder: int = 30
+  estimated_cost: float = 0.0
+  parts_link: str = ""
+  notes: str = ""
+  is_recurring: bool = False
+  recurrence_interval_miles: int = 0
+  recurrence_interval_months: int = 0
+
+
 class BaseForm(BaseModel):
   @field_validator("*", mode="before")
   @classmethod
@@ -0,0 +1,71 @@
+import pathlib
+import sys
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel, create_engine, select
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import data_operations
+from models import Account, FuelEntry, Vehicle
+
+
+@pytest.fixture()
+def session_factory(monkeypatch):
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(data_operations, "SessionLocal", TestSessionLocal)
+
+    with TestSessionLocal() as session:
+        account = Account(name="Family", owner_user_id=data_operations.DEFAULT_OWNER_ID)
+        session.add(account)
+        session.commit()
+        session.add(Vehicle(name="Truck", make="Ford", model="F-150", year=2020, account_id=account.id))
+        session.commit()
+
+    return TestSessionLocal
+
+
+def _entry(mileage, date="01/15/2026"):
+    return {
+        "vehicle_id": 1, "date": date, "mileage": mileage, "fuel_amount": 12.5,
+        "fuel_cost": 40.0, "fuel_type": "87", "driving_pattern": "mixed",
+    }
+
+
+def test_create_fuel_entries_returns_ids_in_input_order(session_factory, monkeypatch):
+    monkeypatch.setattr(data_operations, "_FUEL_INSERT_BATCH", 2)
+    result = data_operations.create_fuel_entries([_entry(m) for m in (41000, 40000, 42000)])
+
+    assert result["success"] is True
+    with session_factory() as session:
+        rows = {e.id: e for e in session.execute(select(FuelEntry)).scalars()}
+    assert [rows[i].mileage for i in result["entry_ids"]] == [41000, 40000, 42000]
+    assert all(e.created_at is not None and e.time is None for e in rows.values())
+
+
+def test_create_fuel_entries_rejects_bad_date_without_inserting(session_factory):
+    result = data_operations.create_fuel_entries([_entry(40000), _entry(41000, date="15/01/2026")])
+
+    assert result == {"success": False, "error": "Entry 2: Invalid date format. Use MM/DD/YYYY or YYYY-MM-DD"}
+    with session_factory() as session:
+        assert session.execute(select(FuelEntry)).first() is None
+
+
+def test_last_fuel_mileage_tracks_inserts_and_deletes(session_factory):
+    data_operations.create_fuel_entries([_entry(41000), _entry(40000)])
+    assert data_operations.get_latest_fuel_mileage(1) == 41000
+
+    data_operations.create_fuel_entries([_entry(39000)])
+    assert data_operations.get_latest_fuel_mileage(1) == 41000
+
+    with session_factory() as session:
+        session.execute(delete(FuelEntry).where(FuelEntry.mileage == 41000))
+        data_operations.sync_last_fuel_mileage(session, [1])
+        session.commit()
+    assert data_operations.get_latest_fuel_mileage(1) == 40000
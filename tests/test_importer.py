@@ -0,0 +1,94 @@
+import pathlib
+import sys
+from collections import OrderedDict
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel, create_engine, select
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from importer import import_csv
+from models import Account, MaintenanceRecord, Vehicle
+
+
+@pytest.fixture()
+def session():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with TestSessionLocal() as session:
+        account = Account(name="Family", owner_user_id="kory")
+        session.add(account)
+        session.commit()
+        vehicle = Vehicle(name="Truck", make="Ford", model="F-150", year=2020, account_id=account.id)
+        session.add(vehicle)
+        session.commit()
+        session.add(MaintenanceRecord(
+            vehicle_id=vehicle.id, date=date(2024, 1, 5), mileage=30000, description="Oil change", cost=50.0,
+        ))
+        session.commit()
+        yield session
+
+
+CSV = (
+    "Date,Mileage,Description,Cost\n"
+    "01/05/2024,30000,Oil change,$55.00\n"
+    "03/10/2024,32000,Brakes,$300\n"
+    ",33k,Wipers,\n"
+    "03/10/2024,32000,Brakes,$300\n"
+).encode()
+
+
+def descriptions(session):
+    return sorted(
+        (r.description, r.mileage, r.cost)
+        for r in session.execute(select(MaintenanceRecord)).scalars()
+    )
+
+
+def test_import_skips_existing_and_in_file_duplicates(session):
+    result = import_csv(CSV, 1, session, "skip")
+
+    assert (result.total_rows, result.imported_rows, result.duplicate_rows) == (4, 2, 2)
+    assert descriptions(session) == [
+        ("Brakes", 32000, 300.0),
+        ("Oil change", 30000, 50.0),
+        ("Wipers", 33000, None),
+    ]
+    wipers = session.execute(
+        select(MaintenanceRecord).where(MaintenanceRecord.description == "Wipers")
+    ).scalar_one()
+    assert wipers.date == date(1900, 1, 1) and wipers.date_estimated
+
+
+def test_import_replace_overwrites_duplicates(session):
+    result = import_csv(CSV, 1, session, "replace")
+
+    assert result.duplicate_rows == 0
+    assert descriptions(session) == [
+        ("Brakes", 32000, 300.0),
+        ("Oil change", 30000, 55.0),
+        ("Wipers", 33000, None),
+    ]
+
+
+def test_import_job_registry_never_evicts_unfinished_jobs(monkeypatch):
+    import data_operations
+
+    monkeypatch.setattr(data_operations, "_IMPORT_JOB_LIMIT", 2)
+    monkeypatch.setattr(data_operations, "_import_jobs", OrderedDict())
+    running = data_operations.create_import_job()
+    data_operations._import_jobs[running]["status"] = "running"
+    finished = data_operations.create_import_job()
+    data_operations._import_jobs[finished]["status"] = "done"
+
+    newest = data_operations.create_import_job()
+
+    assert list(data_operations._import_jobs) == [running, newest]
+    # Full of unfinished jobs: new ones are refused rather than growing the registry
+    assert data_operations.create_import_job() is None
+    assert list(data_operations._import_jobs) == [running, newest]
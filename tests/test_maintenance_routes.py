@@ -0,0 +1,296 @@
+import pathlib
+import sys
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel, create_engine
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from fastapi.testclient import TestClient
+
+import data_operations
+import database
+import main
+from models import Account, FutureMaintenance, MaintenanceRecord, Vehicle
+
+
+@pytest.fixture()
+def client(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'routes.db'}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(data_operations, "SessionLocal", TestSessionLocal)
+    # A few helpers import SessionLocal from database at call time
+    monkeypatch.setattr(database, "SessionLocal", TestSessionLocal)
+
+    with TestSessionLocal() as session:
+        account = Account(name="Family", owner_user_id=data_operations.DEFAULT_OWNER_ID, is_default=True)
+        session.add(account)
+        session.commit()
+        session.add(Vehicle(name="Truck", make="Ford", model="F-150", year=2020, account_id=account.id))
+        session.commit()
+
+    def clear_caches():
+        data_operations.invalidate_vehicle_cache()
+        data_operations.invalidate_oil_analysis_cache()
+        data_operations.invalidate_notifications_cache()
+        main.invalidate_accounts_payload_cache()
+
+    clear_caches()
+    yield TestClient(main.app), TestSessionLocal
+    clear_caches()
+
+
+def _future_maintenance(session_factory):
+    with session_factory() as session:
+        return [
+            (fm.maintenance_type, fm.target_mileage)
+            for fm in session.execute(select(FutureMaintenance)).scalars()
+        ]
+
+
+def _oil_change_form(**overrides):
+    form = {
+        "vehicle_id": "1",
+        "date_str": "01/05/2026",
+        "mileage": "50000",
+        "description": "Oil change",
+        "is_oil_change": "true",
+        "oil_change_interval": "",
+    }
+    form.update(overrides)
+    return form
+
+
+def test_oil_change_with_blank_interval_creates_no_reminder(client):
+    test_client, session_factory = client
+
+    response = test_client.post("/maintenance", data=_oil_change_form(), follow_redirects=False)
+
+    assert response.status_code == 303
+    assert _future_maintenance(session_factory) == []
+    with session_factory() as session:
+        record = session.execute(select(MaintenanceRecord)).scalar_one()
+    # The default interval is still stored on the record
+    assert record.is_oil_change and record.oil_change_interval == 3000
+
+
+def test_oil_change_with_interval_schedules_reminder(client):
+    test_client, session_factory = client
+
+    response = test_client.post(
+        "/maintenance", data=_oil_change_form(oil_change_interval="5000"), follow_redirects=False
+    )
+
+    assert response.status_code == 303
+    assert _future_maintenance(session_factory) == [("Oil Change", 55000)]
+
+
+def test_oil_details_without_oil_change_flag_create_no_reminder(client):
+    test_client, session_factory = client
+
+    response = test_client.post(
+        "/maintenance",
+        data=_oil_change_form(is_oil_change="false", oil_type="Synthetic", oil_change_interval="5000"),
+        follow_redirects=False,
+    )
+
+    assert response.status_code == 303
+    assert _future_maintenance(session_factory) == []
+
+
+def test_csv_export_query_error_returns_500(client, monkeypatch):
+    test_client, _ = client
+
+    def failing_select(session, vehicle_ids=None):
+        raise RuntimeError("database went away")
+
+    monkeypatch.setattr(data_operations, "_select_export_vehicles", failing_select)
+    response = test_client.get("/api/export/vehicles")
+
+    assert response.status_code == 500
+
+
+def test_csv_export_error_mid_stream_is_not_swallowed(client, monkeypatch):
+    test_client, _ = client
+
+    def failing_rows(header, rows):
+        yield "Vehicle Name,Date,Description,Cost,Mileage\r\n"
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr(data_operations, "_iter_csv_chunks", failing_rows)
+    with pytest.raises(RuntimeError, match="connection reset"):
+        test_client.get("/api/export/maintenance")
+
+
+
+@pytest.fixture()
+def spool_dir(tmp_path, monkeypatch):
+    path = tmp_path / "spool"
+    path.mkdir()
+    monkeypatch.setattr(main.tempfile, "tempdir", str(path))
+    return path
+
+
+def _post_import(test_client):
+    return test_client.post(
+        "/import", data={"vehicle_id": "1"}, files={"file": ("records.csv", b"Date,Mileage\n")}
+    )
+
+
+def test_import_removes_spooled_upload_when_copy_fails(client, spool_dir, monkeypatch):
+    test_client, _ = client
+
+    def failing_copy(source, destination_path):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(main, "_copy_upload", failing_copy)
+    _post_import(test_client)
+
+    assert list(spool_dir.iterdir()) == []
+
+
+def test_import_refused_when_job_registry_is_full(client, spool_dir, monkeypatch):
+    test_client, _ = client
+    monkeypatch.setattr(main, "create_import_job", lambda: None)
+
+    response = _post_import(test_client)
+
+    assert response.status_code == 503
+    assert list(spool_dir.iterdir()) == []
+
+
+def _future_maintenance_modal_payload(**overrides):
+    # The maintenance list modal JSON-encodes its non-empty form values, all as strings
+    payload = {
+        "vehicle_id": "1",
+        "maintenance_type": "Brake Fluid",
+        "target_mileage": "60000",
+        "target_date": "2027-01-15",
+        "mileage_reminder": "500",
+        "date_reminder": "30",
+        "estimated_cost": "89.50",
+        "notes": "Flush and fill",
+        "is_recurring": "on",
+        "recurrence_interval_miles": "30000",
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_future_maintenance_api_accepts_modal_payload(client):
+    test_client, session_factory = client
+
+    response = test_client.post("/api/future-maintenance", json=_future_maintenance_modal_payload())
+
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    with session_factory() as session:
+        record = session.execute(select(FutureMaintenance)).scalar_one()
+    assert record.maintenance_type == "Brake Fluid"
+    assert record.target_mileage == 60000
+    assert record.target_date == date(2027, 1, 15)
+    assert record.mileage_reminder == 500
+    assert record.estimated_cost == 89.5
+    assert record.is_recurring is True
+    assert record.recurrence_interval_miles == 30000
+    # Fields the modal left blank are omitted and take the defaults
+    assert record.parts_link in ("", None)
+    assert record.recurrence_interval_months == 0
+
+    response = test_client.put(
+        f"/api/future-maintenance/{record.id}",
+        json=_future_maintenance_modal_payload(target_mileage="65000", is_recurring="false"),
+    )
+    assert response.status_code == 200
+    with session_factory() as session:
+        record = session.execute(select(FutureMaintenance)).scalar_one()
+    assert record.target_mileage == 65000
+    assert record.is_recurring is False
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        _future_maintenance_modal_payload(target_mileage="soon"),
+        _future_maintenance_modal_payload(is_recurring="maybe"),
+        {"vehicle_id": "1"},
+    ],
+)
+def test_future_maintenance_api_rejects_invalid_payload(client, payload):
+    test_client, session_factory = client
+
+    response = test_client.post("/api/future-maintenance", json=payload)
+
+    assert response.status_code == 422
+    assert _future_maintenance(session_factory) == []
+
+
+def _accounts_and_vehicles(session_factory):
+    with session_factory() as session:
+        accounts = sorted(
+            (account.name, account.is_default) for account in session.execute(select(Account)).scalars()
+        )
+        vehicles = [(vehicle.name, vehicle.account_id) for vehicle in session.execute(select(Vehicle)).scalars()]
+    return accounts, vehicles
+
+
+@pytest.mark.parametrize(
+    "method, url, body",
+    [
+        ("PATCH", "/api/accounts/missing", {"name": "Renamed"}),
+        ("DELETE", "/api/accounts/missing", None),
+        ("POST", "/api/accounts/missing/default", None),
+        ("POST", "/api/vehicles/1/transfer", {"accountId": "missing"}),
+        ("POST", "/api/vehicles/999/transfer", {"accountId": "missing"}),
+    ],
+)
+def test_account_writes_against_missing_rows_return_404(client, method, url, body):
+    test_client, session_factory = client
+    before = _accounts_and_vehicles(session_factory)
+
+    response = test_client.request(method, url, json=body)
+
+    assert response.status_code == 404
+    assert _accounts_and_vehicles(session_factory) == before
+
+
+def test_transfer_checks_target_account_before_vehicle(client):
+    _, session_factory = client
+    with session_factory() as session:
+        family_id = session.execute(select(Account.id)).scalar_one()
+
+    missing_target = data_operations.transfer_vehicle_to_account(999, "missing")
+    assert missing_target["not_found"] is True
+    assert missing_target["error"] == "Target account not found."
+
+    missing_vehicle = data_operations.transfer_vehicle_to_account(999, family_id)
+    assert missing_vehicle["not_found"] is True
+    assert missing_vehicle["error"] == "Vehicle not found."
+
+
+def test_accounts_page_revalidates_without_rendering(client, monkeypatch):
+    test_client, _ = client
+    first = test_client.get("/accounts")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+
+    render = main.templates.TemplateResponse
+
+    def fail_render(*args, **kwargs):
+        raise AssertionError("a matching If-None-Match should not render the page")
+
+    monkeypatch.setattr(main.templates, "TemplateResponse", fail_render)
+    response = test_client.get("/accounts", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    # An account change moves the tag on
+    main.invalidate_accounts_payload_cache()
+    monkeypatch.setattr(main.templates, "TemplateResponse", render)
+    assert test_client.get("/accounts", headers={"If-None-Match": etag}).status_code == 200
@@ -0,0 +1,39 @@
+import pathlib
+import sys
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from ttl_cache import MISS, TTLCache
+
+
+def test_value_built_across_an_invalidation_is_not_stored():
+    cache = TTLCache(30)
+    value, generation = cache.get("key")
+    assert value is MISS
+
+    cache.invalidate()
+    cache.set("key", False, generation)
+    assert cache.get("key")[0] is MISS
+
+    _, generation = cache.get("key")
+    cache.set("key", False, generation)
+    assert cache.get("key")[0] is False
+
+
+def test_expired_entries_are_misses():
+    cache = TTLCache(0)
+    cache.set("key", "value", cache.get("key")[1])
+    assert cache.get("key")[0] is MISS
+
+
+def test_max_entries_evicts_oldest():
+    cache = TTLCache(30, max_entries=2)
+    generation = cache.get("a")[1]
+    for key in ("a", "b", "c"):
+        cache.set(key, key, generation)
+
+    assert len(cache) == 2
+    assert cache.get("a")[0] is MISS
+    assert cache.get("c")[0] == "c"
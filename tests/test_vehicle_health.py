@@ -0,0 +1,140 @@
+import pathlib
+import sys
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel, create_engine
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import data_operations
+from models import Account, FuelEntry, FutureMaintenance, MaintenanceRecord, Vehicle
+
+
+@pytest.fixture()
+def seeded_session(monkeypatch):
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(data_operations, "SessionLocal", TestSessionLocal)
+
+    with TestSessionLocal() as session:
+        account = Account(name="Family", owner_user_id=data_operations.DEFAULT_OWNER_ID)
+        other = Account(name="Work", owner_user_id=data_operations.DEFAULT_OWNER_ID)
+        session.add_all([account, other])
+        session.commit()
+
+        truck = Vehicle(name="Truck", make="Ford", model="F-150", year=2020, account_id=account.id)
+        car = Vehicle(name="Car", make="Honda", model="Civic", year=2018, account_id=other.id)
+        session.add_all([truck, car])
+        session.commit()
+
+        session.add_all([
+            MaintenanceRecord(
+                vehicle_id=truck.id, date=date.today(), mileage=40000,
+                description="Oil change", cost=60.0, is_oil_change=True, oil_change_interval=5000,
+            ),
+            FuelEntry(
+                vehicle_id=truck.id, date=date.today(), mileage=44800, fuel_amount=20.0,
+                fuel_cost=70.0, fuel_type="87", driving_pattern="mixed",
+            ),
+            FutureMaintenance(
+                vehicle_id=truck.id, maintenance_type="Tire Rotation", target_mileage=44850,
+                mileage_reminder=100, target_date=date.today() + timedelta(days=90),
+            ),
+            MaintenanceRecord(vehicle_id=car.id, date=date.today(), mileage=90000, description="Brakes", cost=300.0),
+        ])
+        session.commit()
+        account_id = account.id
+
+    return account_id
+
+
+def test_batched_load_matches_individual_helpers(seeded_session):
+    for account_id in (None, seeded_session):
+        batched = data_operations.get_vehicles_with_health_and_triggers(account_id=account_id)
+
+        vehicles = data_operations.get_all_vehicles(account_id=account_id)
+        health = data_operations.get_vehicle_health_status(account_id=account_id)
+        triggered = data_operations.get_all_vehicles_triggered_maintenance(account_id=account_id)
+
+        assert [v.id for v in batched["vehicles"]] == [v.id for v in vehicles]
+        strip = lambda rows: [{k: v for k, v in row.items() if k != "vehicle"} for row in rows]
+        assert strip(batched["vehicle_health"]) == strip(health)
+        assert batched["triggered_maintenance"] == triggered
+
+
+def test_batched_load_scopes_to_account(seeded_session):
+    batched = data_operations.get_vehicles_with_health_and_triggers(account_id=seeded_session)
+
+    assert [v.name for v in batched["vehicles"]] == ["Truck"]
+    assert batched["vehicle_health"][0]["oil_change_status"] == "due_soon"
+    (items,) = batched["triggered_maintenance"].values()
+    assert items[0]["maintenance_type"] == "Tire Rotation"
+    assert items[0]["urgency"] == "medium"
+
+
+def test_notifications_bundle_matches_individual_helpers(seeded_session):
+    for account_id in (None, seeded_session):
+        bundle = data_operations.get_notifications_bundle(account_id=account_id)
+
+        vehicles = data_operations.get_all_vehicles(account_id=account_id)
+        assert [v["id"] for v in bundle["vehicles"]] == [v.id for v in vehicles]
+        assert [v["current_mileage"] for v in bundle["vehicles"]] == [
+            data_operations.get_vehicle_current_mileage(v.id)["current_mileage"] for v in vehicles
+        ]
+        assert bundle["triggered_maintenance"] == data_operations.get_all_vehicles_triggered_maintenance(
+            account_id=account_id
+        )
+
+
+def test_generated_oil_analysis_flag_matches_python_predicate(seeded_session):
+    with data_operations.SessionLocal() as session:
+        session.add_all([
+            MaintenanceRecord(vehicle_id=1, date=date.today(), mileage=41000, description="Blackstone ANALYSIS"),
+            MaintenanceRecord(vehicle_id=1, date=date.today(), mileage=42000, description=None, iron_level=12.0),
+            MaintenanceRecord(vehicle_id=1, date=date.today(), mileage=43000, description="Wipers", oil_analysis_cost=0.0),
+        ])
+        session.commit()
+
+    with data_operations.SessionLocal() as session:
+        records = session.query(MaintenanceRecord).all()
+    expected = [
+        bool(r.oil_analysis_date or r.oil_analysis_cost or r.iron_level or r.aluminum_level or r.copper_level
+             or (r.description and "analysis" in r.description.lower()))
+        for r in records
+    ]
+    assert [r.is_oil_analysis for r in records] == expected
+    assert sorted(r.mileage for r in data_operations.get_oil_analysis_records()) == [41000, 42000]
+
+
+def test_delete_oil_analysis_records_skips_other_records(seeded_session):
+    with data_operations.SessionLocal() as session:
+        analysis = MaintenanceRecord(vehicle_id=1, date=date.today(), mileage=41000, description="Oil analysis")
+        session.add(analysis)
+        session.commit()
+        analysis_id = analysis.id
+
+    result = data_operations.delete_oil_analysis_records([analysis_id, 1])
+
+    assert result == {"success": True, "deleted_ids": [analysis_id]}
+    assert data_operations.get_maintenance_by_id(1) is not None
+    assert data_operations.get_oil_analysis_records() == []
+
+
+def test_notifications_cache_skips_payload_built_before_a_write(seeded_session):
+    data_operations.invalidate_notifications_cache()
+    _, generation = data_operations.get_cached_notifications()
+
+    # A reminder saved while the payload was being built invalidates the cache
+    data_operations.create_future_maintenance(vehicle_id=1, maintenance_type="Wipers", target_mileage=44900)
+    data_operations.cache_notifications({"stale": True}, generation)
+    assert data_operations.get_cached_notifications()[0] is None
+
+    payload, generation = data_operations.get_cached_notifications()
+    data_operations.cache_notifications({"fresh": True}, generation)
+    assert data_operations.get_cached_notifications()[0] == {"fresh": True}
+    data_operations.invalidate_notifications_cache()
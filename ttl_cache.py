@@ -0,0 +1,59 @@
+"""
+Small in-process TTL cache shared by the data_operations and main.py read caches
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Returned by TTLCache.get on a miss, so falsy values such as False can be cached
+MISS = object()
+
+
+class TTLCache:
+    """Thread-safe key -> value map whose entries expire after ttl_seconds.
+
+    get() returns the cache generation along with the value; pass it back to set().
+    invalidate() bumps the generation, so a value that was built while a write
+    happened is dropped instead of being cached stale for the full TTL.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[Any, int]:
+        """Return (cached value or MISS, current generation)"""
+        with self._lock:
+            cached = self._entries.get(key)
+            generation = self.generation
+        if cached and cached[0] > time.monotonic():
+            return cached[1], generation
+        return MISS, generation
+
+    def set(self, key: Hashable, value: Any, generation: int) -> None:
+        """Store value unless the cache was invalidated since get() returned generation"""
+        now = time.monotonic()
+        with self._lock:
+            if generation != self.generation:
+                return
+            # Re-inserted keys move to the end, so the first key is always the oldest
+            self._entries.pop(key, None)
+            if self.max_entries is not None and len(self._entries) >= self.max_entries:
+                self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+                while len(self._entries) >= self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now + self.ttl_seconds, value)
+
+    def invalidate(self) -> None:
+        """Drop every entry and make in-flight builds skip storing their result"""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)